@@ -9,17 +9,51 @@ bl_info = {
     "category": "Object",
 }
 
+import time
+
+_import_started = time.perf_counter()
+
 # 라이브러리 임포트
+# 각 서브패키지는 패널/오퍼레이터만 가볍게 불러오고, 네트워크/NumPy/어댑터 패치 등
+# 무거운 부분은 처음 사용할 때 임포트합니다.
 from .source import core, updator, parts_sperator, drawindexed, addon
 
+_import_ms = (time.perf_counter() - _import_started) * 1000.0
+
+# 애드온 시작(임포트 + 등록)에 허용하는 시간(ms). 초과하면 콘솔에 경고를 남깁니다.
+STARTUP_BUDGET_MS = 150.0
+
+# 마지막 등록 시 단계별 소요 시간(ms)
+startup_timings = {}
+
+
+def check_startup_budget(budget_ms=STARTUP_BUDGET_MS):
+    """(예산 이내 여부, 총 소요 시간 ms, 단계별 시간 dict)를 반환합니다."""
+    total = sum(startup_timings.values())
+    return total <= budget_ms, total, dict(startup_timings)
+
 
 # 애드온 등록 함수
 def register():
-    core.register()
-    parts_sperator.register()
-    drawindexed.register()
-    addon.register()
-    updator.register()
+    startup_timings.clear()
+    startup_timings["import"] = _import_ms
+    for name, module in (
+        ("core", core),
+        ("parts_sperator", parts_sperator),
+        ("drawindexed", drawindexed),
+        ("addon", addon),
+        ("updator", updator),
+    ):
+        started = time.perf_counter()
+        module.register()
+        startup_timings[name] = (time.perf_counter() - started) * 1000.0
+
+    ok, total, _ = check_startup_budget()
+    if not ok:
+        print(
+            f"INIPS: 애드온 시작 시간 {total:.1f}ms가 예산 {STARTUP_BUDGET_MS:.0f}ms를 초과했습니다. "
+            + ", ".join(f"{k}={v:.1f}ms" for k, v in startup_timings.items())
+        )
 
 
 # 애드온 해제 함수
@@ -0,0 +1,272 @@
+"""
+XXMI 원시 버퍼 임포트를 파츠 단위로 나눠 실행합니다.
+
+합쳐진 모델을 임포트한 뒤 Blender에서 면을 분리하는 대신, IB/VB 원본 버퍼를 drawindexed
+범위별로 잘라(`buffer_splitter.compact_indices`) 파츠마다 XXMI 임포트를 따로 실행합니다.
+`xxmi_tools`가 임포트 때에만 불러오므로 NumPy도 그때 로드됩니다.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+import bpy
+import numpy as np
+
+from ..utils import timing
+from ..utils.buffer_splitter import compact_indices, index_dtype
+from ..utils.build_parts_map import build_parts_map
+from ..utils.ib_order import ensure_ib_order
+from ..utils.memory import MemoryMonitor
+
+
+def _fmt_value(path, key):
+    """fmt 파일의 최상위(들여쓰기 없는) `key: value` 값. 없으면 None."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if not line.strip() or line[0].isspace():
+                continue
+            name, sep, value = line.partition(":")
+            if sep and name.strip().lower() == key:
+                return value.strip()
+    return None
+
+
+def _paths_argument(args, kwargs):
+    """import_3dmigoto_vb_ib의 paths 인자(위치/키워드)를 반환합니다."""
+    return kwargs.get("paths", args[0] if args else None)
+
+
+def _with_paths(args, kwargs, paths):
+    """paths만 바꾼 (args, kwargs). 호출자가 넘긴 방식(위치/키워드)을 유지합니다."""
+    if "paths" in kwargs:
+        return args, dict(kwargs, paths=paths)
+    return (paths,) + tuple(args[1:]), kwargs
+
+
+def plan_direct_import(args, kwargs):
+    """
+    임포트 인자가 파츠별 직접 임포트 조건을 만족하는지 확인합니다.
+
+    조건: 임포트 항목이 하나이고 원시 버퍼(use_bin)이며, IB fmt가 R16/R32 trianglelist,
+    VB마다 fmt에 stride가 있고 파일 크기가 stride의 배수이며, IB가 VB 정점 수를 넘지 않아야 합니다.
+
+    Returns:
+        (plan, None) 또는 (None, 사유 문자열)
+    """
+    paths = _paths_argument(args, kwargs)
+    if not isinstance(paths, (tuple, list)) or len(paths) != 1:
+        return None, "임포트 항목이 하나가 아닙니다"
+    entry = paths[0]
+    if not isinstance(entry, (tuple, list)) or len(entry) < 3 or not entry[2]:
+        return None, "원시 버퍼 임포트가 아닙니다"
+    vb_paths, ib = entry[0], entry[1]
+    pose_path = entry[3] if len(entry) > 3 else None
+    if not isinstance(ib, (tuple, list)) or len(ib) != 2 or not all(ib):
+        return None, "IB fmt 파일이 없습니다"
+    ib_path, ib_fmt_path = ib
+
+    topology = _fmt_value(ib_fmt_path, "topology")
+    if topology and topology.lower() != "trianglelist":
+        return None, f"지원하지 않는 topology입니다: {topology}"
+    dtype = index_dtype(_fmt_value(ib_fmt_path, "format"))
+    if dtype is None:
+        return None, "IB format이 R16/R32가 아닙니다"
+    ib_size = os.path.getsize(ib_path)
+    if ib_size % np.dtype(dtype).itemsize:
+        return None, "IB 파일 크기가 format과 맞지 않습니다"
+
+    vbs = []
+    for item in vb_paths or ():
+        if not isinstance(item, (tuple, list)) or len(item) != 2 or not all(item):
+            return None, "VB fmt 파일이 없습니다"
+        vb_path, vb_fmt_path = item
+        try:
+            stride = int(_fmt_value(vb_fmt_path, "stride") or 0)
+        except ValueError:
+            stride = 0
+        if stride <= 0:
+            return None, f"VB stride를 알 수 없습니다: {os.path.basename(vb_fmt_path)}"
+        vb_size = os.path.getsize(vb_path)
+        if vb_size % stride:
+            return None, f"VB 파일 크기가 stride의 배수가 아닙니다: {os.path.basename(vb_path)}"
+        vbs.append((vb_path, vb_fmt_path, stride, vb_size // stride))
+    if not vbs:
+        return None, "VB가 없습니다"
+
+    ib_data = np.memmap(ib_path, dtype=dtype, mode="r") if ib_size else np.empty(0, dtype)
+    if ib_data.size < 3:
+        return None, "IB에 삼각형이 없습니다"
+    vertex_count = min(v[3] for v in vbs)
+    if int(ib_data.max()) >= vertex_count:
+        return None, "IB가 VB 정점 수를 넘습니다"
+    return {
+        "ib": ib_data,
+        "ib_path": ib_path,
+        "ib_fmt_path": ib_fmt_path,
+        "vbs": vbs,
+        "pose_path": pose_path,
+    }, None
+
+
+def _new_collection(context, name, template_obj):
+    """template_obj가 들어 있는 컬렉션 밑(없으면 씬)에 새 컬렉션을 만듭니다."""
+    col_name = name
+    if bpy.data.collections.get(col_name):
+        i = 1
+        while bpy.data.collections.get(f"{name}_{i}"):
+            i += 1
+        col_name = f"{name}_{i}"
+    collection = bpy.data.collections.new(col_name)
+    parents = list(template_obj.users_collection) if template_obj else []
+    if parents:
+        for col in parents:
+            col.children.link(collection)
+    else:
+        context.scene.collection.children.link(collection)
+    return collection
+
+
+def _unique_object_name(base_name):
+    name = base_name
+    if name in bpy.data.objects:
+        i = 1
+        while f"{base_name}_{i}" in bpy.data.objects:
+            i += 1
+        name = f"{base_name}_{i}"
+    return name
+
+
+def _import_triangles(func, operator, context, args, kwargs, plan, work_dir, stem, triangles):
+    """
+    삼각형 인덱스(N x 3)가 쓰는 정점만 모은 IB/VB를 work_dir에 쓰고 XXMI 임포트를 실행합니다.
+
+    Returns:
+        임포트된 오브젝트
+    """
+    ib = plan["ib"]
+    used, remapped = compact_indices(triangles)
+    ib_path = os.path.join(work_dir, f"{stem}.ib")
+    remapped.astype(ib.dtype).tofile(ib_path)
+    vb_paths = []
+    for n, (vb_path, vb_fmt_path, stride, _count) in enumerate(plan["vbs"]):
+        part_vb = os.path.join(work_dir, f"{stem}-{n}.vb")
+        vb = np.memmap(vb_path, dtype=np.uint8, mode="r").reshape(-1, stride)
+        vb[used].tofile(part_vb)
+        vb_paths.append((part_vb, vb_fmt_path))
+
+    paths = [(tuple(vb_paths), (ib_path, plan["ib_fmt_path"]), True, plan["pose_path"])]
+    call_args, call_kwargs = _with_paths(args, kwargs, paths)
+    with timing.phase("xxmi_import"):
+        return func(operator, context, *call_args, **call_kwargs)
+
+
+def import_parts(func, operator, context, args, kwargs, plan, sections, resource, reporter=None):
+    """
+    파츠마다 해당 IB 범위의 삼각형만 XXMI로 임포트해 파츠 오브젝트를 만듭니다.
+    어떤 파츠에도 속하지 않는 삼각형은 `part_remaining`으로 임포트합니다.
+
+    면마다 원래 IB 삼각형 위치를 IB 순서 속성으로 기록하므로, 범위 조회/IB 순서 재정렬은
+    임포트 후 분리한 결과와 같게 동작합니다. 합친 원본 메시가 없으므로 재분리 기록은 남기지 않습니다.
+    중간에 실패하면 만든 오브젝트를 지우고 예외를 그대로 올립니다.
+
+    Returns:
+        dict: 실행 요약(`SplitSession.summary()`와 같은 키 일부 + object/resource/collection)
+    """
+    from ..parts_sperator.functions.separate_parts import PART_KEY_PROP, REMAINING_KEY
+
+    ib = plan["ib"]
+    total_triangles = ib.size // 3
+    triangles = ib[: total_triangles * 3].reshape(-1, 3)
+    parts_map = build_parts_map(sections, resource)
+    keys = parts_map.keys()
+    valid = parts_map.valid_mask(total_triangles * 3)
+    first, stop = parts_map.triangle_bounds()
+    object_name = os.path.splitext(os.path.basename(plan["ib_path"]))[0]
+
+    started = time.perf_counter()
+    memory = MemoryMonitor()
+    messages = []
+
+    def report(level, message):
+        messages.append((next(iter(level), "INFO"), message))
+        if reporter:
+            reporter(level, message)
+
+    created = []
+    collection = None
+    skipped = 0
+    remaining_created = False
+    work_dir = tempfile.mkdtemp(prefix="inips-direct-")
+    try:
+        jobs = []
+        for i, name in enumerate(parts_map.names):
+            if not valid[i]:
+                report(
+                    {"WARNING"},
+                    f"Invalid drawIndexed range for part {name}: "
+                    f"{int(parts_map.starts[i])},{int(parts_map.counts[i])} (0~{total_triangles * 3})",
+                )
+                skipped += 1
+                continue
+            jobs.append((name, keys[i], np.arange(first[i], stop[i], dtype=np.int64)))
+        uncovered = np.flatnonzero(~parts_map.triangle_mask(total_triangles))
+        if uncovered.size:
+            jobs.append(("part_remaining", REMAINING_KEY, uncovered))
+
+        for n, (name, key, positions) in enumerate(jobs):
+            timing.set_part(name)
+            obj = _import_triangles(
+                func, operator, context, args, kwargs, plan, work_dir, f"part{n}",
+                triangles[positions],
+            )
+            if obj is None:
+                skipped += 1
+                continue
+            created.append(obj)
+            obj.name = _unique_object_name(name)
+            if getattr(obj, "data", None) is not None:
+                obj.data.name = obj.name
+                with timing.phase("ib_order"):
+                    ensure_ib_order(obj.data, positions, total_triangles)
+            obj[PART_KEY_PROP] = key
+            if collection is None:
+                collection = _new_collection(context, object_name, obj)
+            for col in list(obj.users_collection):
+                col.objects.unlink(obj)
+            collection.objects.link(obj)
+            remaining_created = remaining_created or key == REMAINING_KEY
+            memory.sample()
+    except Exception:
+        for obj in created:
+            mesh = getattr(obj, "data", None)
+            bpy.data.objects.remove(obj, do_unlink=True)
+            if mesh is not None and mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+        if collection is not None:
+            bpy.data.collections.remove(collection)
+        raise
+    finally:
+        timing.set_part(None)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    memory.stop()
+
+    return {
+        "parts": len(parts_map),
+        "attempts": len(created) + skipped,
+        "created": len(created),
+        "skipped": skipped,
+        "remaining_created": remaining_created,
+        "collection": collection.name if collection else None,
+        "objects": [o.name for o in created],
+        "mesh": {
+            "vertices": min(v[3] for v in plan["vbs"]),
+            "triangles": int(total_triangles),
+        },
+        "elapsed_ms": (time.perf_counter() - started) * 1000.0,
+        "memory": memory.as_dict(),
+        "messages": [{"level": lv, "message": msg} for lv, msg in messages],
+        "object": object_name,
+        "resource": resource,
+    }
@@ -1,7 +1,11 @@
 import bpy
-from bpy.props import BoolProperty
+from bpy.props import BoolProperty, IntProperty
+import functools
 import importlib
+import os
+import re
 import collections
+from ..core.paths import cache_dir
 
 
 class INIPS_PT_Addon_XXMI(bpy.types.Panel):
@@ -20,20 +24,297 @@ class INIPS_PT_Addon_XXMI(bpy.types.Panel):
             return False
         # 체크할 수 있도록 기본 bl_idname(문자열)과 RNA 형식을 둘 다 허용
         op_id = getattr(active_op, "bl_idname", "")
-        return op_id in (
+        if op_id not in (
             "import_mesh.migoto_raw_buffers",
             "IMPORT_MESH_OT_migoto_raw_buffers",
-        )
+        ):
+            return False
+        return True
 
     def draw(self, context):
         layout = self.layout
         wm = context.window_manager
         layout.prop(wm, "inips_addon_xxmi")
+        col = layout.column()
+        col.enabled = wm.inips_addon_xxmi
+        col.prop(wm, "inips_addon_xxmi_dup_early_exit")
+        col.prop(wm, "inips_addon_xxmi_dup_sample")
+        layout.prop(wm, "inips_addon_xxmi_split")
+        if wm.inips_addon_xxmi_split:
+            scene = context.scene
+            resource = getattr(scene, "inips_resource", "")
+            if scene.inips_ini_path and resource:
+                layout.label(text=f"IB: {resource}")
+            else:
+                layout.label(text="INI 파일과 Resource를 먼저 선택하세요.", icon="ERROR")
 
 
 classes = (INIPS_PT_Addon_XXMI,)
 
 
+_HASH_LINE_RE = re.compile(r"^\s*hash\s*=\s*([0-9a-f]+)", re.IGNORECASE)
+_IB_LINE_RE = re.compile(r"^\s*ib\s*=\s*(.+)$", re.IGNORECASE)
+_FILENAME_LINE_RE = re.compile(r"^\s*filename\s*=\s*(.+)$", re.IGNORECASE)
+
+
+def _object_alive(obj):
+    """삭제된 오브젝트의 파이썬 참조면 False(접근 시 ReferenceError)."""
+    try:
+        return obj is not None and obj.name in bpy.data.objects
+    except ReferenceError:
+        return False
+
+
+def _imported_ib_names(args, kwargs):
+    """
+    import_3dmigoto_vb_ib의 paths 인자에서 IB 파일 이름(소문자)을 모읍니다.
+    paths 항목은 (vb_paths, ib_path 또는 (ib_path, fmt_path), use_bin, pose_path) 형식입니다.
+    """
+    paths = kwargs.get("paths", args[0] if args else None)
+    names = []
+    for entry in paths or ():
+        if not isinstance(entry, (tuple, list)) or len(entry) < 2:
+            continue
+        ib = entry[1]
+        if isinstance(ib, (tuple, list)):
+            ib = ib[0] if ib else None
+        if isinstance(ib, str) and ib:
+            names.append(os.path.basename(ib).lower())
+    return names
+
+
+def _resource_identifiers(sections, resource):
+    """
+    Resource와 같은 IB인지 판단할 값: `ib = resource`를 쓰는 섹션들의 hash와
+    Resource 섹션의 filename(소문자 파일 이름).
+    """
+    hashes = set()
+    for lines in sections.values():
+        uses_resource = False
+        section_hashes = []
+        for line in lines:
+            s = line.split(";", 1)[0]
+            m = _IB_LINE_RE.match(s)
+            if m and m.group(1).strip() == resource:
+                uses_resource = True
+            m = _HASH_LINE_RE.match(s)
+            if m:
+                section_hashes.append(m.group(1).lower())
+        if uses_resource:
+            hashes.update(section_hashes)
+    filenames = set()
+    for line in sections.get(resource, ()):
+        m = _FILENAME_LINE_RE.match(line.split(";", 1)[0])
+        if m:
+            filename = m.group(1).strip().strip('"').replace("\\", "/")
+            filenames.add(os.path.basename(filename).lower())
+    return hashes, filenames
+
+
+def _matches_resource(ib_names, sections, resource):
+    """임포트한 IB 파일 이름에 Resource의 hash가 들어 있거나 파일 이름이 같으면 True."""
+    hashes, filenames = _resource_identifiers(sections, resource)
+    stems = {os.path.splitext(f)[0] for f in filenames}
+    for name in ib_names:
+        if name in filenames or os.path.splitext(name)[0] in stems:
+            return True
+        if any(h in name for h in hashes):
+            return True
+    return False
+
+
+def _split_target(context):
+    """임포트 후 분리가 켜져 있고 INI/Resource가 선택되어 있으면 (sections, resource), 아니면 None."""
+    if not getattr(context.window_manager, "inips_addon_xxmi_split", False):
+        return None
+    scene = context.scene
+    resource = getattr(scene, "inips_resource", "")
+    if not scene.inips_ini_path or not resource:
+        return None
+    sections = {}
+    for item in scene.inips_ini_sections:
+        sections[item.section_name] = item.lines.splitlines()
+    return sections, resource
+
+
+def _import_direct(func, operator, context, args, kwargs):
+    """
+    원시 버퍼 임포트면 IB/VB를 파츠 범위별로 잘라 파츠마다 임포트합니다(`xxmi_direct` 참고).
+    합친 모델을 만들지 않으므로 큰 모델도 파츠 크기만큼의 메시만 생성합니다.
+
+    Returns:
+        첫 파츠 오브젝트. 조건이 맞지 않으면(다른 IB, 여러 항목, 원본 유지 옵션, fmt 해석 불가 등)
+        아무것도 만들지 않고 None을 반환하며, 호출자는 임포트 후 분리로 진행합니다.
+    """
+    target = _split_target(context)
+    if target is None:
+        return None
+    sections, resource = target
+    ib_names = _imported_ib_names(args, kwargs)
+    if not _matches_resource(ib_names, sections, resource):
+        return None
+    scene = context.scene
+    reporter = getattr(operator, "report", None)
+    if scene.inips_keep_source:
+        # 재분리에는 합친 원본 메시가 필요하므로 임포트 후 분리로 진행
+        return None
+
+    from . import xxmi_direct
+    from ..parts_sperator.functions import pipeline
+    from ..core import preferences
+
+    plan, reason = xxmi_direct.plan_direct_import(args, kwargs)
+    if plan is None:
+        if reporter:
+            reporter({"INFO"}, f"버퍼를 직접 나눌 수 없어 임포트 후 분리합니다: {reason}")
+        return None
+
+    history_path = preferences.history_path(context)
+    timer = pipeline.timing.start("split") if history_path else None
+    try:
+        summary = xxmi_direct.import_parts(
+            func, operator, context, args, kwargs, plan, sections, resource, reporter
+        )
+    finally:
+        if timer is not None:
+            pipeline.timing.stop()
+    if history_path:
+        try:
+            pipeline.record_run(
+                history_path,
+                summary,
+                bpy.path.abspath(scene.inips_ini_path),
+                "import_direct",
+                timer,
+            )
+        except Exception as e:
+            # 파츠는 이미 만들어졌으므로 기록 실패로 임포트 후 분리를 다시 하지 않음
+            print(f"INIPS Adapter Error: 실행 기록 실패. {e}")
+    if reporter:
+        reporter(
+            {"INFO"},
+            f"파츠별 직접 임포트: 생성 {summary['created']}개, 건너뜀 {summary['skipped']}개",
+        )
+    parts = [bpy.data.objects[name] for name in summary["objects"]]
+    if not parts:
+        return None
+    if parts[0].name in context.view_layer.objects:
+        context.view_layer.objects.active = parts[0]
+    return parts[0]
+
+
+def _split_imported_object(operator, context, obj, ib_names):
+    """
+    임포트 직후 오브젝트를 현재 INI/Resource의 파츠 맵으로 바로 분리합니다.
+    임포트한 IB 파일이 선택된 Resource와 맞지 않으면 분리하지 않습니다.
+
+    Returns:
+        분리했으면 결과 컬렉션의 파츠 오브젝트(없으면 None), 분리하지 않았으면 obj
+    """
+    if obj is None or getattr(obj, "type", None) != "MESH":
+        return obj
+    target = _split_target(context)
+    if target is None:
+        return obj
+    sections, resource = target
+
+    scene = context.scene
+    reporter = getattr(operator, "report", None)
+    if not _matches_resource(ib_names, sections, resource):
+        if reporter:
+            reporter(
+                {"WARNING"},
+                f"임포트한 IB가 {resource}와 맞지 않아 파츠 분리를 건너뜁니다: "
+                f"{', '.join(ib_names) or '(알 수 없음)'}",
+            )
+        return obj
+
+    from ..parts_sperator.functions import pipeline
+    from ..core import preferences
+
+    context.view_layer.objects.active = obj
+    history_path = preferences.history_path(context)
+    timer = pipeline.timing.start("split") if history_path else None
+    try:
+        summary = pipeline.split_object(
+            context,
+            obj,
+            sections,
+            resource,
+            reporter=reporter,
+            keep_source=scene.inips_keep_source,
+        )
+    finally:
+        if timer is not None:
+            pipeline.timing.stop()
+    if history_path:
+        pipeline.record_run(
+            history_path,
+            summary,
+            bpy.path.abspath(scene.inips_ini_path),
+            "import_hook",
+            timer,
+        )
+    if reporter:
+        reporter(
+            {"INFO"},
+            f"임포트 후 파츠 분리: 생성 {summary['created']}개, 건너뜀 {summary['skipped']}개",
+        )
+
+    if _object_alive(obj):
+        return obj
+    # 원본은 분리 후 삭제되므로 호출자에게는 결과 파츠 하나를 돌려줌
+    collection = bpy.data.collections.get(summary.get("collection") or "")
+    parts = [o for o in collection.objects if o.type == "MESH"] if collection else []
+    if not parts:
+        return None
+    if parts[0].name in context.view_layer.objects:
+        context.view_layer.objects.active = parts[0]
+    return parts[0]
+
+
+def _wrap_direct_split(func):
+    @functools.wraps(func)
+    def import_3dmigoto_vb_ib(operator, context, *args, **kwargs):
+        try:
+            obj = _import_direct(func, operator, context, args, kwargs)
+        except Exception as e:
+            print(f"INIPS Adapter Error: 파츠별 직접 임포트 실패, 임포트 후 분리로 진행합니다. {e}")
+            obj = None
+        if obj is not None:
+            return obj
+        obj = func(operator, context, *args, **kwargs)
+        try:
+            # 임포트 직후의 면 순서가 원래 IB 순서이므로 여기서 기록
+            if getattr(obj, "type", None) == "MESH":
+                from ..utils.ib_order import ensure_ib_order
+
+                ensure_ib_order(obj.data)
+        except Exception as e:
+            print(f"INIPS Adapter Error: IB 순서 속성 기록 실패. {e}")
+        try:
+            obj = _split_imported_object(
+                operator, context, obj, _imported_ib_names(args, kwargs)
+            )
+        except Exception as e:
+            print(f"INIPS Adapter Error: 임포트 후 파츠 분리 실패. {e}")
+            if not _object_alive(obj):
+                obj = None
+        return obj
+
+    return import_3dmigoto_vb_ib
+
+
+def _count_duplicate_faces(faces, **kwargs):
+    # NumPy 검사 모듈은 첫 임포트 때 불러옴
+    from ..utils.face_check import count_duplicate_faces
+
+    return count_duplicate_faces(faces, **kwargs)
+
+
+_ADAPTER_CHECK_INTERVAL = 5.0
+
+
 def _apply_xxmi_adapter():
     try:
         mi = importlib.import_module("XXMITools.migoto.import_ops")
@@ -42,23 +323,18 @@ def _apply_xxmi_adapter():
     if hasattr(mi, "_xxmi_orig_import_3dmigoto_vb_ib"):
         return
 
-    import inspect
-    import re
-    import textwrap
-
     mi._xxmi_orig_import_3dmigoto_vb_ib = mi.import_3dmigoto_vb_ib
+    # 주입 코드는 원본 모듈 전역에서 실행되므로 검사 함수를 모듈 전역으로 노출
+    mi._inips_count_duplicate_faces = _count_duplicate_faces
+    patched = _build_validate_patch(mi)
+    mi.import_3dmigoto_vb_ib = _wrap_direct_split(
+        patched or mi._xxmi_orig_import_3dmigoto_vb_ib
+    )
 
-    try:
-        source = inspect.getsource(mi.import_3dmigoto_vb_ib)
-    except Exception as e:
-        print(f"INIPS Adapter Error: 원본 함수 소스를 가져올 수 없습니다. {e}")
-        return
 
-    pattern = re.compile(r'^([ \t]+)mesh\.validate\(\s*verbose=False,\s*clean_customdata=False\s*\)', re.MULTILINE)
+_VALIDATE_PATTERN = r"^([ \t]+)mesh\.validate\(\s*verbose=False,\s*clean_customdata=False\s*\)"
 
-    def replacer(match):
-        indent = match.group(1)
-        block = """# --- INIPS ADAPTER INJECTED CODE ---
+_INJECTED_BLOCK = """# --- INIPS ADAPTER INJECTED CODE ---
 skip_validate = False
 try:
     wm = bpy.context.window_manager
@@ -66,13 +342,14 @@ try:
         if getattr(operator, "bl_idname", "") == "import_mesh.migoto_raw_buffers":
             skip_validate = True
         elif ib is not None:
-            seen = set()
-            for face in ib.faces:
-                key = frozenset(face)
-                if key in seen:
-                    skip_validate = True
-                    break
-                seen.add(key)
+            dup_count = _inips_count_duplicate_faces(
+                ib.faces,
+                early_exit=getattr(wm, "inips_addon_xxmi_dup_early_exit", False),
+                sample_size=getattr(wm, "inips_addon_xxmi_dup_sample", 0),
+            )
+            if dup_count:
+                skip_validate = True
+                operator.report({"INFO"}, f"INIPS: 중복 페이스 {dup_count}개 발견, mesh.validate 생략")
 except Exception as e:
     print(f"INIPS Adapter Error: {e}")
 
@@ -83,23 +360,113 @@ if not skip_validate:
 else:
     mesh.update(calc_edges=True)
 # -----------------------------------"""
-        return "\n".join(indent + line for line in block.split("\n"))
+
+
+def _patch_cache_path(orig):
+    """
+    원본 함수 코드, 주입 코드, Blender/Python 버전으로 만든 키에 해당하는 캐시 파일 경로.
+    원본 코드 객체를 marshal한 값으로 키를 만들기 때문에 inspect.getsource 없이도
+    XXMI 소스가 바뀌면 키가 달라집니다.
+    """
+    import hashlib
+    import marshal
+    import sys
+
+    h = hashlib.sha256()
+    h.update(marshal.dumps(orig.__code__))
+    h.update(_VALIDATE_PATTERN.encode("utf-8"))
+    h.update(_INJECTED_BLOCK.encode("utf-8"))
+    h.update(repr(tuple(bpy.app.version)).encode("utf-8"))
+    h.update(sys.version.encode("utf-8"))
+
+    return os.path.join(cache_dir(), f"xxmi_adapter_{h.hexdigest()[:32]}.marshal")
+
+
+def _compile_validate_patch(orig):
+    """원본 함수 소스의 mesh.validate 호출을 주입 코드로 교체해 컴파일한 코드 객체를 반환합니다."""
+    import inspect
+    import re
+    import textwrap
+
+    try:
+        source = inspect.getsource(orig)
+    except Exception as e:
+        print(f"INIPS Adapter Error: 원본 함수 소스를 가져올 수 없습니다. {e}")
+        return None
+
+    pattern = re.compile(_VALIDATE_PATTERN, re.MULTILINE)
+
+    def replacer(match):
+        indent = match.group(1)
+        return "\n".join(indent + line for line in _INJECTED_BLOCK.split("\n"))
 
     new_source, count = pattern.subn(replacer, source)
 
     if count == 0:
         print("INIPS Adapter Error: mesh.validate 호출을 찾지 못했습니다. 원본 함수를 유지합니다.")
-        return
+        return None
 
     new_source = textwrap.dedent(new_source)
+    try:
+        return compile(new_source, "<inips-xxmi-adapter>", "exec")
+    except Exception as e:
+        print(f"INIPS Adapter Error: 주입된 코드 컴파일 실패. 원본 함수를 유지합니다. {e}")
+        return None
+
+
+def _load_validate_patch(orig):
+    """
+    디스크 캐시에서 패치된 코드 객체를 불러오고, 없으면 새로 만들어 캐시에 저장합니다.
+    캐시를 읽거나 쓰지 못해도 패치 자체는 계속 진행합니다.
+    """
+    import marshal
+
+    cache_path = None
+    try:
+        cache_path = _patch_cache_path(orig)
+        with open(cache_path, "rb") as f:
+            return marshal.load(f)
+    except Exception:
+        pass
+
+    code = _compile_validate_patch(orig)
+    if code is not None and cache_path:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                marshal.dump(code, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"INIPS Adapter: 패치 캐시를 저장하지 못했습니다. {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return code
+
 
-    exec_globals = mi.import_3dmigoto_vb_ib.__globals__
+def _build_validate_patch(mi):
+    """원본 함수의 mesh.validate 호출을 중복 페이스 검사 코드로 교체한 함수를 만듭니다."""
+    orig = mi._xxmi_orig_import_3dmigoto_vb_ib
+    code = _load_validate_patch(orig)
+    if code is None:
+        return None
+
+    exec_globals = orig.__globals__
     exec_locals = {}
     try:
-        exec(new_source, exec_globals, exec_locals)
-        mi.import_3dmigoto_vb_ib = exec_locals['import_3dmigoto_vb_ib']
+        exec(code, exec_globals, exec_locals)
+        return exec_locals["import_3dmigoto_vb_ib"]
     except Exception as e:
-        print(f"INIPS Adapter Error: 주입된 코드 컴파일 실패. 원본 함수를 유지합니다. {e}")
+        print(f"INIPS Adapter Error: 주입된 코드 실행 실패. 원본 함수를 유지합니다. {e}")
+        return None
+
+
+def _adapter_timer():
+    """
+    bpy.app.timers 콜백: XXMI가 시작 후에 켜지거나 다시 불러와져도 패치되도록 주기적으로 확인합니다.
+    이미 패치된 모듈이면 표시 속성만 확인하고 끝나므로 부담이 거의 없습니다.
+    """
+    _apply_xxmi_adapter()
+    return _ADAPTER_CHECK_INTERVAL
 
 
 def _remove_xxmi_adapter():
@@ -110,6 +477,8 @@ def _remove_xxmi_adapter():
     if hasattr(mi, "_xxmi_orig_import_3dmigoto_vb_ib"):
         mi.import_3dmigoto_vb_ib = mi._xxmi_orig_import_3dmigoto_vb_ib
         delattr(mi, "_xxmi_orig_import_3dmigoto_vb_ib")
+    if hasattr(mi, "_inips_count_duplicate_faces"):
+        delattr(mi, "_inips_count_duplicate_faces")
 
 
 def register():
@@ -119,14 +488,46 @@ def register():
             description="중복 페이스를 유지해 최대한 원본 모델을 임포트합니다",
             default=False,
         )
+    if not hasattr(bpy.types.WindowManager, "inips_addon_xxmi_dup_early_exit"):
+        bpy.types.WindowManager.inips_addon_xxmi_dup_early_exit = BoolProperty(
+            name="중복 검사 조기 종료",
+            description="앞쪽 페이스부터 검사해 중복이 발견되면 바로 검사를 멈춥니다",
+            default=False,
+        )
+    if not hasattr(bpy.types.WindowManager, "inips_addon_xxmi_dup_sample"):
+        bpy.types.WindowManager.inips_addon_xxmi_dup_sample = IntProperty(
+            name="검사할 페이스 수",
+            description="앞쪽에서 검사할 최대 페이스 수입니다 (0이면 전체)",
+            default=0,
+            min=0,
+        )
+    if not hasattr(bpy.types.WindowManager, "inips_addon_xxmi_split"):
+        bpy.types.WindowManager.inips_addon_xxmi_split = BoolProperty(
+            name="임포트 후 바로 파츠 분리",
+            description=(
+                "선택된 INI/Resource의 drawindexed 범위별로 IB/VB를 나눠 파츠마다 임포트합니다 "
+                "(원시 버퍼가 아니거나 원본 유지가 켜져 있으면 임포트 후 분리)"
+            ),
+            default=False,
+        )
     for cls in classes:
         bpy.utils.register_class(cls)
-    _apply_xxmi_adapter()
+    # 어댑터 패치는 시작 후 타이머에서 적용 (패널 poll은 부작용 없이 유지)
+    if not bpy.app.timers.is_registered(_adapter_timer):
+        bpy.app.timers.register(_adapter_timer, first_interval=1.0, persistent=True)
 
 
 def unregister():
+    if bpy.app.timers.is_registered(_adapter_timer):
+        bpy.app.timers.unregister(_adapter_timer)
     _remove_xxmi_adapter()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    if hasattr(bpy.types.WindowManager, "inips_addon_xxmi_split"):
+        del bpy.types.WindowManager.inips_addon_xxmi_split
+    if hasattr(bpy.types.WindowManager, "inips_addon_xxmi_dup_sample"):
+        del bpy.types.WindowManager.inips_addon_xxmi_dup_sample
+    if hasattr(bpy.types.WindowManager, "inips_addon_xxmi_dup_early_exit"):
+        del bpy.types.WindowManager.inips_addon_xxmi_dup_early_exit
     if hasattr(bpy.types.WindowManager, "inips_addon_xxmi"):
         del bpy.types.WindowManager.inips_addon_xxmi
@@ -1,9 +1,11 @@
-from . import properties
+from . import properties, preferences
 
 
 def register():
     properties.register()
+    preferences.register()
 
 
 def unregister():
+    preferences.unregister()
     properties.unregister()
@@ -0,0 +1,17 @@
+import os
+import tempfile
+
+import bpy
+
+
+def cache_dir():
+    """애드온 캐시 폴더(Blender 설정 폴더 아래 inips_cache)를 만들고 경로를 반환합니다."""
+    try:
+        path = bpy.utils.user_resource("CONFIG", path="inips_cache", create=True)
+    except Exception:
+        path = ""
+    if not path:
+        # 설정 폴더를 쓸 수 없으면 임시 폴더로 폴백
+        path = os.path.join(tempfile.gettempdir(), "inips_cache")
+        os.makedirs(path, exist_ok=True)
+    return path
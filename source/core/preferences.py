@@ -0,0 +1,137 @@
+import bpy
+import os
+from bpy.types import AddonPreferences
+from bpy.props import StringProperty, BoolProperty, FloatProperty, IntProperty
+
+# 애드온 모듈 이름(설치 폴더 이름) — AddonPreferences.bl_idname으로 사용
+ADDON_ID = __name__.split(".")[0]
+
+
+class INIPS_AddonPreferences(AddonPreferences):
+    bl_idname = ADDON_ID
+
+    history_enabled: BoolProperty(
+        name="실행 기록 저장",
+        description="파츠 분리를 실행할 때마다 성능 기록을 JSON Lines 파일에 추가합니다",
+        default=True,
+    )
+    history_path: StringProperty(
+        name="실행 기록 파일",
+        description="비워 두면 애드온 캐시 폴더의 run_history.jsonl을 사용합니다",
+        default="",
+        subtype="FILE_PATH",
+    )
+    history_regression_threshold: FloatProperty(
+        name="회귀 기준",
+        description="이전 실행 중앙값보다 이 비율 이상 느려지면 회귀로 표시합니다",
+        default=0.2,
+        min=0.0,
+        max=10.0,
+        subtype="FACTOR",
+    )
+
+    profile_cprofile: BoolProperty(
+        name="cProfile",
+        description="INI 불러오기와 파츠 분리 전체를 cProfile로 기록해 .prof 파일로 저장합니다",
+        default=False,
+    )
+    profile_tracemalloc: BoolProperty(
+        name="tracemalloc",
+        description="INI 불러오기와 파츠 분리 중 메모리 할당 상위 위치를 기록합니다(느려짐)",
+        default=False,
+    )
+    profile_dir: StringProperty(
+        name="프로파일 폴더",
+        description="비워 두면 애드온 캐시 폴더의 profiles 폴더를 사용합니다",
+        default="",
+        subtype="DIR_PATH",
+    )
+    profile_top: IntProperty(
+        name="상위 항목 수",
+        description="텍스트 보고서에 남길 함수/할당 위치 수",
+        default=30,
+        min=5,
+        max=500,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        box = layout.box()
+        box.label(text="실행 기록", icon="TIME")
+        box.prop(self, "history_enabled")
+        col = box.column()
+        col.enabled = self.history_enabled
+        col.prop(self, "history_path")
+        col.prop(self, "history_regression_threshold")
+
+        box = layout.box()
+        box.label(text="프로파일링", icon="SETTINGS")
+        row = box.row()
+        row.prop(self, "profile_cprofile")
+        row.prop(self, "profile_tracemalloc")
+        col = box.column()
+        col.enabled = self.profile_cprofile or self.profile_tracemalloc
+        col.prop(self, "profile_dir")
+        col.prop(self, "profile_top")
+
+
+def get_preferences(context=None):
+    """애드온 설정을 반환합니다. 애드온이 활성화되지 않은 경우(헤드리스 임포트 등) None."""
+    context = context or bpy.context
+    addon = context.preferences.addons.get(ADDON_ID)
+    return addon.preferences if addon else None
+
+
+def addon_version():
+    from ... import bl_info
+
+    return ".".join(map(str, bl_info["version"]))
+
+
+def history_path(context=None):
+    """실행 기록 파일 경로. 기록이 꺼져 있으면 None."""
+    from .paths import cache_dir
+
+    prefs = get_preferences(context)
+    if prefs is not None:
+        if not prefs.history_enabled:
+            return None
+        if prefs.history_path:
+            return bpy.path.abspath(prefs.history_path)
+    return os.path.join(cache_dir(), "run_history.jsonl")
+
+
+def profile_session(label, context=None):
+    """설정에서 프로파일링이 켜져 있으면 시작하지 않은 ProfileSession을, 아니면 None을 반환합니다."""
+    prefs = get_preferences(context)
+    if prefs is None or not (prefs.profile_cprofile or prefs.profile_tracemalloc):
+        return None
+
+    from .paths import cache_dir
+    from ..utils.profiling import ProfileSession
+
+    out_dir = (
+        bpy.path.abspath(prefs.profile_dir)
+        if prefs.profile_dir
+        else os.path.join(cache_dir(), "profiles")
+    )
+    return ProfileSession(
+        label,
+        out_dir,
+        cprofile=prefs.profile_cprofile,
+        tracemalloc=prefs.profile_tracemalloc,
+        top=prefs.profile_top,
+    )
+
+
+classes = (INIPS_AddonPreferences,)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
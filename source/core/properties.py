@@ -1,6 +1,13 @@
 import bpy
 from bpy.types import PropertyGroup
-from bpy.props import StringProperty, EnumProperty, IntProperty, CollectionProperty
+from bpy.props import (
+    StringProperty,
+    EnumProperty,
+    IntProperty,
+    BoolProperty,
+    CollectionProperty,
+    PointerProperty,
+)
 
 
 class INPS_INISection(PropertyGroup):
@@ -18,6 +25,28 @@ class INIPS_Resources(PropertyGroup):
     ]
 
 
+class INIPS_PartItem(PropertyGroup):
+    # name: 파츠 이름(PropertyGroup 기본 속성)
+    key: StringProperty(name="Key", description="같은 이름의 파츠를 구분하는 키")
+    start_index: IntProperty(name="Start", min=0)
+    index_count: IntProperty(name="Count", min=0)
+
+
+def _update_resource(self, context):
+    from ..parts_sperator.functions import parts_list
+
+    parts_list.refresh(self)
+
+
+def _update_watch_ini(self, context):
+    from ..parts_sperator.functions import ini_watcher
+
+    if self.inips_watch_ini:
+        ini_watcher.start()
+    else:
+        ini_watcher.stop()
+
+
 def register():
     bpy.utils.register_class(INPS_INISection)
     bpy.types.Scene.inips_ini_sections = CollectionProperty(type=INPS_INISection)
@@ -34,6 +63,37 @@ def register():
         description="파츠를 분리할 IB의 리소스 이름입니다",
         items=_inips_resource_items,
         default=0,
+        update=_update_resource,
+    )
+    bpy.utils.register_class(INIPS_PartItem)
+    bpy.types.Scene.inips_parts = CollectionProperty(type=INIPS_PartItem)
+    bpy.types.Scene.inips_parts_index = IntProperty(name="활성 파츠", default=0)
+
+    bpy.types.Scene.inips_timing_enabled = BoolProperty(
+        name="성능 측정",
+        description="INI 불러오기/파츠 분리의 단계별 소요 시간을 측정해 패널과 보고에 표시합니다",
+        default=False,
+    )
+    bpy.types.Scene.inips_watch_ini = BoolProperty(
+        name="INI 변경 감시",
+        description="INI 파일이 외부에서 수정되면 바뀐 섹션만 다시 분석해 리소스/파츠 정보를 자동 갱신합니다",
+        default=False,
+        update=_update_watch_ini,
+    )
+    bpy.types.Scene.inips_keep_source = BoolProperty(
+        name="재분리용 원본 보관",
+        description="분리 후 원본 메시와 파츠 맵을 결과 컬렉션에 남겨, INI 수정 후 바뀐 파츠만 다시 분리할 수 있게 합니다(파일 크기 증가)",
+        default=False,
+    )
+    bpy.types.Scene.inips_low_memory = BoolProperty(
+        name="저메모리 모드",
+        description="분리하는 동안 중간 실행 취소 기록을 끄고, 끝난 뒤 전체를 한 번의 실행 취소 단계로 남깁니다(큰 모델에서 메모리 사용 감소)",
+        default=False,
+    )
+    bpy.types.Scene.inips_share_part_meshes = BoolProperty(
+        name="같은 범위 메시 공유",
+        description="같은 원본 메시에서 같은 drawindexed 범위로 이미 분리한 파츠가 있으면 메시를 새로 만들지 않고 공유(링크 복제)합니다",
+        default=False,
     )
 
     # drawindexed
@@ -53,12 +113,32 @@ def register():
         max=1000000000,
         step=1,
     )
+    bpy.types.Scene.inips_drawindexed_ranges = StringProperty(
+        name="범위 목록",
+        description="`count, start` 또는 `drawindexed = count, start, 0` 범위를 `|`나 `;`로 구분해 입력합니다",
+        default="",
+    )
+    bpy.types.Scene.inips_drawindexed_text = PointerProperty(
+        name="텍스트",
+        description="drawindexed 줄이나 TextureOverride 블록을 붙여넣은 텍스트 데이터블록(지정하면 범위 목록 대신 사용)",
+        type=bpy.types.Text,
+    )
 
 
 def unregister():
+    del bpy.types.Scene.inips_drawindexed_text
+    del bpy.types.Scene.inips_drawindexed_ranges
     del bpy.types.Scene.inips_drawindexed_count
     del bpy.types.Scene.inips_drawindexed_start
 
+    del bpy.types.Scene.inips_share_part_meshes
+    del bpy.types.Scene.inips_low_memory
+    del bpy.types.Scene.inips_keep_source
+    del bpy.types.Scene.inips_watch_ini
+    del bpy.types.Scene.inips_timing_enabled
+    del bpy.types.Scene.inips_parts_index
+    del bpy.types.Scene.inips_parts
+    bpy.utils.unregister_class(INIPS_PartItem)
     del bpy.types.Scene.inips_resource
     del bpy.types.Scene.inips_ini_path
 
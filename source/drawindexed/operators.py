@@ -1,7 +1,39 @@
 import bpy
-import bmesh
 from bpy.types import Operator
-from ..utils.selector import select_indices_from_drawindexed
+from ..utils import selector
+
+# 선택 방식: 교체 / 현재 선택에 추가 / 현재 선택에서 제외
+SELECT_MODE_ITEMS = (
+    ("SET", "새로 선택", "현재 선택을 범위로 바꿉니다", "SELECT_SET", 0),
+    ("ADD", "추가", "현재 선택에 범위를 추가합니다", "SELECT_EXTEND", 1),
+    ("SUBTRACT", "제외", "현재 선택에서 범위를 뺍니다", "SELECT_SUBTRACT", 2),
+)
+
+
+def _select_ranges(operator, context, starts, counts):
+    """범위들의 합집합을 한 번에 계산해 활성 오브젝트에 operator.mode로 적용합니다."""
+    obj = context.active_object
+
+    # 오브젝트 선택 확인
+    if not obj or obj.type != "MESH":
+        operator.report({"ERROR"}, "메시 오브젝트를 선택하세요.")
+        return {"CANCELLED"}
+
+    if obj.mode == "EDIT":
+        # 편집 모드의 변경을 메시 배열에 반영한 뒤 범위 계산
+        obj.update_from_editmode()
+    try:
+        mask = selector.polygon_mask_from_ranges(obj.data, starts, counts)
+    except ValueError as e:
+        operator.report({"ERROR"}, str(e))
+        return {"CANCELLED"}
+    select_count = selector.apply_polygon_selection(obj, mask, mode=operator.mode)
+
+    if select_count == 0 and operator.mode != "SUBTRACT":
+        operator.report({"WARNING"}, "선택된 face가 없습니다.")
+        return {"CANCELLED"}
+    operator.report({"INFO"}, f"{select_count}개 face 선택 완료")
+    return {"FINISHED"}
 
 
 class INIPS_OT_SelectDrawIndexedMesh(Operator):
@@ -10,31 +42,46 @@ class INIPS_OT_SelectDrawIndexedMesh(Operator):
     bl_description = "drawIndexed 값에 해당하는 face를 오브젝트에서 선택합니다"
     bl_options = {"REGISTER", "UNDO"}
 
+    mode: bpy.props.EnumProperty(name="방식", items=SELECT_MODE_ITEMS, default="SET")
+
     def execute(self, context):
-        obj = context.active_object
         start = context.scene.inips_drawindexed_start
         count = context.scene.inips_drawindexed_count
-
-        # 오브젝트 선택 확인
-        if not obj or obj.type != "MESH":
-            self.report({"ERROR"}, "메시 오브젝트를 선택하세요.")
+        if count <= 0:
+            self.report({"WARNING"}, "선택된 face가 없습니다.")
             return {"CANCELLED"}
-        mesh = obj.data
+        return _select_ranges(self, context, [start], [count])
 
-        # 페이스 선택
-        select_count, selected_indices, face_indices_set = (
-            select_indices_from_drawindexed(mesh, start, count)
-        )
 
-        if select_count == 0:
-            self.report({"WARNING"}, "선택된 face가 없습니다.")
-            return {"CANCELLED"}
+class INIPS_OT_SelectDrawIndexedRanges(Operator):
+    bl_idname = "inips.select_drawindexed_ranges"
+    bl_label = "범위 목록 선택"
+    bl_description = "여러 drawIndexed 범위(붙여넣은 drawindexed 줄 또는 범위 목록)의 face를 한 번에 선택합니다"
+    bl_options = {"REGISTER", "UNDO"}
+
+    mode: bpy.props.EnumProperty(name="방식", items=SELECT_MODE_ITEMS, default="SET")
+
+    def execute(self, context):
+        from ..utils.build_parts_map import parse_drawindexed_ranges
+
+        scene = context.scene
+        text = scene.inips_drawindexed_text
+        if text:
+            ranges = parse_drawindexed_ranges(text.as_string())
         else:
-            self.report({"INFO"}, f"{select_count}개 face 선택 완료")
-        return {"FINISHED"}
+            ranges = parse_drawindexed_ranges(
+                scene.inips_drawindexed_ranges, single_line=True
+            )
+        if not ranges:
+            self.report({"ERROR"}, "drawindexed 범위를 찾을 수 없습니다.")
+            return {"CANCELLED"}
+        result = _select_ranges(self, context, ranges.starts, ranges.counts)
+        if "FINISHED" in result:
+            self.report({"INFO"}, f"범위 {len(ranges)}개 적용")
+        return result
 
 
-classes = (INIPS_OT_SelectDrawIndexedMesh,)
+classes = (INIPS_OT_SelectDrawIndexedMesh, INIPS_OT_SelectDrawIndexedRanges)
 
 
 def register():
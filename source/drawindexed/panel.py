@@ -39,7 +39,22 @@ class INIPS_PT_DrawIndexedPanel(Panel):
         col_zero.label(text="0")
 
         # 매쉬 선택/추출 버튼
-        box.operator("inips.select_drawindexed_mesh", text="매쉬 선택")
+        row = box.row(align=True)
+        row.operator("inips.select_drawindexed_mesh", text="매쉬 선택").mode = "SET"
+        row.operator("inips.select_drawindexed_mesh", text="", icon="SELECT_EXTEND").mode = "ADD"
+        row.operator("inips.select_drawindexed_mesh", text="", icon="SELECT_SUBTRACT").mode = "SUBTRACT"
+
+        # 여러 범위를 한 번에 선택(텍스트를 지정하면 범위 목록 대신 사용)
+        box = layout.box()
+        box.label(text="범위 여러 개")
+        box.prop(context.scene, "inips_drawindexed_text")
+        col = box.column()
+        col.enabled = context.scene.inips_drawindexed_text is None
+        col.prop(context.scene, "inips_drawindexed_ranges", text="")
+        row = box.row(align=True)
+        row.operator("inips.select_drawindexed_ranges", text="범위 선택").mode = "SET"
+        row.operator("inips.select_drawindexed_ranges", text="", icon="SELECT_EXTEND").mode = "ADD"
+        row.operator("inips.select_drawindexed_ranges", text="", icon="SELECT_SUBTRACT").mode = "SUBTRACT"
 
 
 def register():
@@ -0,0 +1,280 @@
+"""
+blender --background 용 파츠 분리 배치 스크립트.
+
+사용 예:
+    blender -b model.blend --python <애드온>/source/headless/batch_split.py -- \\
+        --ini mod.ini --resource ResourceBodyIB --object Body --output out/
+
+    blender -b --python-expr "import ini_part_splitter.source.headless.batch_split as b; b.main()" -- \\
+        --ini mod.ini --resource ResourceBodyIB --blend a.blend --blend b.blend --output out/
+
+'--' 뒤의 인자만 해석합니다. 실행이 끝나면 JSON 요약을 표준 출력에 한 줄로 출력하고
+아래 종료 코드로 Blender를 종료합니다.
+워커 모드(fanout.py가 사용):
+    --part-chunk I/N --library part_I.blend [--remaining]
+        파츠 맵을 N개로 나눈 I번째 구간만 분리해 결과 컬렉션을 라이브러리 파일로 저장
+    --merge part_0.blend --merge part_1.blend ...
+        워커 라이브러리들을 현재 파일에 합치고 원본 오브젝트를 삭제한 뒤 저장
+
+    0: 모든 오브젝트 분리 성공
+    1: 일부(또는 전부) 오브젝트 분리 실패
+    2: 인자/INI 오류로 실행하지 못함
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+
+import bpy
+
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_USAGE = 2
+
+SUMMARY_PREFIX = "INIPS_SUMMARY "
+
+
+def _load_pipeline():
+    # 애드온 패키지로 임포트된 경우(--python-expr)는 상대 임포트,
+    # --python 으로 파일을 직접 실행한 경우는 애드온 폴더를 sys.path에 추가해 임포트
+    if __package__:
+        from ..parts_sperator.functions import pipeline
+
+        return pipeline
+
+    addon_dir = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    parent, addon_name = os.path.split(addon_dir)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    return importlib.import_module(
+        f"{addon_name}.source.parts_sperator.functions.pipeline"
+    )
+
+
+def _script_argv(argv=None):
+    if argv is not None:
+        return list(argv)
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1 :]
+    return []
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="batch_split",
+        description="INI의 drawindexed 정보로 .blend 파일의 오브젝트를 파츠 분리합니다.",
+    )
+    parser.add_argument("--ini", required=True, help="INI 파일 경로")
+    parser.add_argument("--resource", required=True, help="IB 리소스 이름")
+    parser.add_argument(
+        "--object",
+        dest="objects",
+        action="append",
+        default=[],
+        help="분리할 오브젝트 이름(여러 번 지정 가능, 생략 시 활성 오브젝트)",
+    )
+    parser.add_argument(
+        "--blend",
+        dest="blends",
+        action="append",
+        default=[],
+        help="처리할 .blend 파일(여러 번 지정 가능, 생략 시 현재 열린 파일)",
+    )
+    parser.add_argument(
+        "--output",
+        default="",
+        help="결과 .blend 경로 또는 폴더(생략 시 원본 옆에 '<이름>_parts.blend')",
+    )
+    parser.add_argument("--summary", default="", help="JSON 요약을 저장할 파일 경로")
+    parser.add_argument(
+        "--history",
+        default="",
+        help="실행 기록(JSON Lines)을 추가할 파일 경로(생략 시 기록하지 않음)",
+    )
+    parser.add_argument(
+        "--part-chunk",
+        default="",
+        help="워커 모드: 'I/N' 형식으로 N개 구간 중 I번째 파츠만 분리",
+    )
+    parser.add_argument(
+        "--library",
+        default="",
+        help="워커 모드: 결과 컬렉션만 이 .blend 라이브러리로 저장(원본 유지)",
+    )
+    parser.add_argument(
+        "--remaining",
+        action="store_true",
+        help="워커 모드: 잔여 파츠(part_remaining)도 생성",
+    )
+    parser.add_argument(
+        "--merge",
+        dest="merges",
+        action="append",
+        default=[],
+        help="워커가 저장한 라이브러리를 합칩니다(여러 번 지정 가능)",
+    )
+    return parser
+
+
+def _parse_chunk(value):
+    if not value:
+        return None
+    index, _, total = value.partition("/")
+    try:
+        chunk = (int(index), int(total))
+    except ValueError:
+        raise ValueError(f"잘못된 --part-chunk 값입니다: {value}")
+    if chunk[1] <= 0 or not 0 <= chunk[0] < chunk[1]:
+        raise ValueError(f"잘못된 --part-chunk 값입니다: {value}")
+    return chunk
+
+
+def _output_path(output, blend_path, multiple):
+    stem = os.path.splitext(os.path.basename(blend_path or "untitled.blend"))[0]
+    file_name = f"{stem}_parts.blend"
+    if not output:
+        base_dir = os.path.dirname(blend_path) if blend_path else os.getcwd()
+        return os.path.join(base_dir, file_name)
+    if multiple or os.path.isdir(output) or output.endswith(("/", "\\")):
+        os.makedirs(output, exist_ok=True)
+        return os.path.join(output, file_name)
+    return output
+
+
+def _resolve_objects(context, names):
+    if not names:
+        obj = context.view_layer.objects.active
+        return [obj] if obj else [], []
+    found, missing = [], []
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj:
+            found.append(obj)
+        else:
+            missing.append(name)
+    return found, missing
+
+
+def _split_current_file(pipeline, sections, args, blend_path, multiple):
+    context = bpy.context
+    result = {"blend": blend_path, "objects": [], "errors": [], "output": None}
+
+    objects, missing = _resolve_objects(context, args.objects)
+    for name in missing:
+        result["errors"].append(f"오브젝트를 찾을 수 없습니다: {name}")
+    if not objects:
+        result["errors"].append("분리할 오브젝트가 없습니다.")
+
+    if context.object and context.object.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+
+    worker = bool(args.library)
+    if (worker or args.merges) and len(objects) > 1:
+        result["errors"].append("워커/병합 모드는 오브젝트 하나만 지원합니다.")
+        return result
+
+    for obj in objects:
+        obj_name = obj.name
+        try:
+            context.view_layer.objects.active = obj
+            if args.merges:
+                summary = pipeline.merge_part_libraries(context, obj, args.merges)
+            else:
+                timer = pipeline.timing.start("split") if args.history else None
+                try:
+                    summary = pipeline.split_object(
+                        context,
+                        obj,
+                        sections,
+                        args.resource,
+                        part_chunk=args.part_chunk,
+                        create_remaining=args.remaining or not worker,
+                        delete_original=not worker,
+                    )
+                finally:
+                    pipeline.timing.stop()
+                if args.history:
+                    pipeline.record_run(
+                        args.history, summary, args.ini, "headless", timer
+                    )
+        except Exception as e:
+            result["errors"].append(f"{obj_name}: {e}")
+            continue
+        if not summary["created"] and not worker:
+            result["errors"].append(f"{summary['object']}: 생성된 파츠가 없습니다.")
+        result["objects"].append(summary)
+
+    if worker:
+        # 결과 컬렉션(과 그 오브젝트/메쉬)만 라이브러리로 저장
+        collections = set()
+        for summary in result["objects"]:
+            col = bpy.data.collections.get(summary["collection"] or "")
+            if col:
+                collections.add(col)
+        bpy.data.libraries.write(args.library, collections)
+        result["output"] = args.library
+    elif result["objects"]:
+        out_path = _output_path(args.output, blend_path, multiple)
+        bpy.ops.wm.save_as_mainfile(filepath=out_path, copy=True)
+        result["output"] = out_path
+    return result
+
+
+def run(argv=None):
+    """배치 분리를 실행하고 (종료 코드, 요약 dict)를 반환합니다."""
+    parser = build_arg_parser()
+    try:
+        args = parser.parse_args(_script_argv(argv))
+    except SystemExit:
+        return EXIT_USAGE, {"ok": False, "errors": ["잘못된 인자입니다."]}
+
+    try:
+        args.part_chunk = _parse_chunk(args.part_chunk)
+    except ValueError as e:
+        return EXIT_USAGE, {"ok": False, "errors": [str(e)]}
+
+    pipeline = _load_pipeline()
+    try:
+        sections = pipeline.load_ini_sections(args.ini)
+    except (OSError, UnicodeDecodeError) as e:
+        return EXIT_USAGE, {"ok": False, "errors": [f"INI를 읽을 수 없습니다: {e}"]}
+
+    files = []
+    blends = args.blends or [bpy.data.filepath]
+    multiple = len(blends) > 1
+    for blend_path in blends:
+        if blend_path and blend_path != bpy.data.filepath:
+            try:
+                bpy.ops.wm.open_mainfile(filepath=blend_path)
+            except Exception as e:
+                files.append(
+                    {"blend": blend_path, "objects": [], "errors": [str(e)], "output": None}
+                )
+                continue
+        files.append(_split_current_file(pipeline, sections, args, blend_path, multiple))
+
+    ok = all(not f["errors"] for f in files)
+    summary = {
+        "ok": ok,
+        "ini": args.ini,
+        "resource": args.resource,
+        "files": files,
+    }
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return (EXIT_OK if ok else EXIT_PARTIAL), summary
+
+
+def main(argv=None):
+    code, summary = run(argv)
+    print(SUMMARY_PREFIX + json.dumps(summary, ensure_ascii=False))
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
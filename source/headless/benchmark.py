@@ -0,0 +1,371 @@
+"""
+합성 메시/INI로 파츠 분리 파이프라인의 단계별 시간을 재는 벤치마크.
+
+사용 예:
+    blender -b --factory-startup --python <애드온>/source/headless/benchmark.py -- \\
+        --preset quick --output bench.json
+
+    # 이전 결과와 비교해 회귀가 있으면 종료 코드 1
+    blender -b --factory-startup --python <애드온>/source/headless/benchmark.py -- \\
+        --triangles 100000,500000 --parts 16,64 --baseline bench.json --threshold 0.2
+
+케이스마다 삼각형 수, 파츠 수, CommandList 중첩 깊이, `$var` 사용 비율이 같으면
+항상 같은 메시/INI가 생성되므로 변경 전후 결과를 그대로 비교할 수 있습니다.
+
+측정 단계:
+    parse, defunctionalize, build_parts_map — INI 처리
+    select — 분리 중 select_indices_from_drawindexed 누적 시간
+    split — 파츠별 분리 전체(step 반복)
+    remaining — 잔여 파츠 생성(finish)
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import bpy
+import numpy as np
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_USAGE = 2
+
+RESOURCE = "ResourceBenchIB"
+
+PRESETS = {
+    "quick": {"triangles": [10_000, 100_000], "parts": [8, 32]},
+    "full": {"triangles": [10_000, 100_000, 500_000, 2_000_000], "parts": [8, 32, 128]},
+}
+
+STEPS = ("parse", "defunctionalize", "build_parts_map", "select", "split", "remaining")
+
+# 그리드 한 줄의 사각형 수(삼각형은 사각형당 2개)
+GRID_COLUMNS = 256
+
+
+def _load_pipeline():
+    # batch_split.py와 같은 방식: 패키지 임포트면 상대 임포트, 스크립트 실행이면 sys.path 추가
+    if __package__:
+        from ..parts_sperator.functions import pipeline
+
+        return pipeline
+
+    addon_dir = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    parent, addon_name = os.path.split(addon_dir)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    return importlib.import_module(
+        f"{addon_name}.source.parts_sperator.functions.pipeline"
+    )
+
+
+def _script_argv(argv=None):
+    if argv is not None:
+        return list(argv)
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1 :]
+    return []
+
+
+def _int_list(value):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="benchmark",
+        description="합성 메시와 INI로 파츠 분리 단계별 시간을 측정합니다.",
+    )
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--triangles", type=_int_list, help="삼각형 수 목록(쉼표 구분)")
+    parser.add_argument("--parts", type=_int_list, help="파츠 수 목록(쉼표 구분)")
+    parser.add_argument(
+        "--depth", type=int, default=2, help="drawindexed까지의 CommandList 중첩 깊이"
+    )
+    parser.add_argument(
+        "--var-ratio",
+        type=float,
+        default=0.5,
+        help="drawindexed 인덱스 수를 $변수로 쓰는 파츠 비율(0~1)",
+    )
+    parser.add_argument(
+        "--coverage",
+        type=float,
+        default=0.9,
+        help="파츠가 덮는 IB 비율(나머지는 잔여 파츠로 생성)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수")
+    parser.add_argument("--output", default="", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", default="", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="기준 대비 중앙값이 이 비율 이상 느려지면 회귀",
+    )
+    return parser
+
+
+def make_ini_text(parts, total_indices, depth=2, var_ratio=0.5, coverage=0.9):
+    """
+    파츠 parts개가 IB 앞쪽 coverage 비율을 삼각형 단위로 나눠 갖는 INI 문자열을 만듭니다.
+
+    TextureOverride 섹션에서 `ib =` 뒤에 depth단 CommandList를 거쳐 drawindexed에 도달하고,
+    앞에서부터 var_ratio 비율의 파츠는 인덱스 수를 `$part_N` 변수로 지정합니다.
+    """
+    total_tris = total_indices // 3
+    covered = max(parts, int(total_tris * coverage))
+    bounds = [covered * i // parts for i in range(parts + 1)]
+    var_parts = int(round(parts * var_ratio))
+
+    lines = ["[Constants]"]
+    for i in range(var_parts):
+        lines.append(f"global $part_{i} = {(bounds[i + 1] - bounds[i]) * 3}")
+    lines += [
+        "",
+        "[TextureOverrideBenchIB]",
+        "hash = 00000000",
+        "match_first_index = 0",
+        f"ib = {RESOURCE}",
+    ]
+
+    draw_lines = []
+    for i in range(parts):
+        count = f"$part_{i}" if i < var_parts else str((bounds[i + 1] - bounds[i]) * 3)
+        draw_lines += [f"; Part {i}", f"drawindexed = {count}, {bounds[i] * 3}, 0"]
+
+    if depth <= 0:
+        lines += draw_lines
+    else:
+        lines.append("run = CommandListBench_0")
+        for level in range(depth):
+            lines += ["", f"[CommandListBench_{level}]"]
+            if level + 1 < depth:
+                lines.append(f"run = CommandListBench_{level + 1}")
+            else:
+                lines += draw_lines
+    return "\n".join(lines) + "\n"
+
+
+def make_grid_mesh(name, triangles):
+    """삼각형 triangles개(그리드 순서 = IB 순서)로 된 메시 오브젝트를 현재 씬에 만듭니다."""
+    quads = (triangles + 1) // 2
+    cols = min(GRID_COLUMNS, quads)
+    rows = (quads + cols - 1) // cols
+
+    ys, xs = np.mgrid[0 : rows + 1, 0 : cols + 1]
+    co = np.zeros((xs.size, 3), dtype=np.float32)
+    co[:, 0] = xs.ravel()
+    co[:, 1] = ys.ravel()
+
+    q = np.arange(rows * cols)[:quads]
+    r, c = np.divmod(q, cols)
+    v0 = r * (cols + 1) + c
+    v1, v2, v3 = v0 + 1, v0 + cols + 2, v0 + cols + 1
+    tris = np.empty((quads * 2, 3), dtype=np.int32)
+    tris[0::2] = np.stack([v0, v1, v2], axis=1)
+    tris[1::2] = np.stack([v0, v2, v3], axis=1)
+    tris = tris[:triangles]
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(tris.size)
+    mesh.loops.foreach_set("vertex_index", tris.ravel())
+    mesh.polygons.add(len(tris))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, tris.size, 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.full(len(tris), 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def _reset_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for col in list(bpy.data.collections):
+        bpy.data.collections.remove(col)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+
+def run_case(pipeline, triangles, parts, args):
+    """케이스 하나를 repeat번 실행하고 단계별 측정값(ms 목록)을 반환합니다."""
+    timing = pipeline.timing
+    text = make_ini_text(parts, triangles * 3, args.depth, args.var_ratio, args.coverage)
+    samples = {step: [] for step in STEPS}
+    created = None
+
+    for _ in range(args.repeat):
+        _reset_scene()
+        obj = make_grid_mesh("Bench", triangles)
+        context = bpy.context
+        context.view_layer.objects.active = obj
+
+        timer = timing.start("benchmark")
+        try:
+            t0 = time.perf_counter()
+            sections = pipeline.parse_ini_sections(text)
+            t1 = time.perf_counter()
+            sections = pipeline.defunctionalize.defunctionalize_sections(sections)
+            t2 = time.perf_counter()
+            parts_map = pipeline.build_parts_map.build_parts_map(sections, RESOURCE)
+            t3 = time.perf_counter()
+
+            session = pipeline.SplitSession(context, obj, parts_map)
+            session.begin()
+            while not session.done:
+                session.step()
+            t4 = time.perf_counter()
+            session.finish()
+            t5 = time.perf_counter()
+        finally:
+            timing.stop()
+
+        samples["parse"].append((t1 - t0) * 1000.0)
+        samples["defunctionalize"].append((t2 - t1) * 1000.0)
+        samples["build_parts_map"].append((t3 - t2) * 1000.0)
+        select = timer.phases.get("select_indices_from_drawindexed")
+        samples["select"].append(select[0] * 1000.0 if select else 0.0)
+        samples["split"].append((t4 - t3) * 1000.0)
+        samples["remaining"].append((t5 - t4) * 1000.0)
+        created = session.summary()["created"]
+
+    _reset_scene()
+    return {
+        "name": f"t{triangles}_p{parts}_d{args.depth}",
+        "triangles": triangles,
+        "parts": parts,
+        "depth": args.depth,
+        "var_ratio": args.var_ratio,
+        "coverage": args.coverage,
+        "created": created,
+        # 파츠 parts개 + 잔여 파츠 1개가 나와야 정상
+        "ok": created == parts + (1 if args.coverage < 1.0 else 0),
+        "steps": {
+            step: {
+                "median_ms": statistics.median(values),
+                "min_ms": min(values),
+                "runs_ms": values,
+            }
+            for step, values in samples.items()
+        },
+    }
+
+
+def compare_results(current, baseline, threshold=0.2):
+    """
+    같은 이름의 케이스끼리 단계별 중앙값을 비교합니다.
+
+    Returns:
+        list[dict]: 회귀 목록(case, step, baseline_ms, current_ms, ratio)
+    """
+    base_cases = {case["name"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    for case in current.get("cases", []):
+        base = base_cases.get(case["name"])
+        if not base:
+            continue
+        for step, entry in case["steps"].items():
+            base_entry = base.get("steps", {}).get(step)
+            if not base_entry or base_entry["median_ms"] <= 0:
+                continue
+            ratio = entry["median_ms"] / base_entry["median_ms"]
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    {
+                        "case": case["name"],
+                        "step": step,
+                        "baseline_ms": base_entry["median_ms"],
+                        "current_ms": entry["median_ms"],
+                        "ratio": ratio,
+                    }
+                )
+    return regressions
+
+
+def run(argv=None):
+    """벤치마크를 실행하고 (종료 코드, 결과 dict)를 반환합니다."""
+    parser = build_arg_parser()
+    try:
+        args = parser.parse_args(_script_argv(argv))
+    except SystemExit:
+        return EXIT_USAGE, {"errors": ["잘못된 인자입니다."]}
+    if args.repeat < 1 or not 0.0 < args.coverage <= 1.0:
+        return EXIT_USAGE, {"errors": ["--repeat는 1 이상, --coverage는 (0, 1] 범위여야 합니다."]}
+
+    preset = PRESETS[args.preset]
+    triangle_counts = args.triangles or preset["triangles"]
+    part_counts = args.parts or preset["parts"]
+
+    pipeline = _load_pipeline()
+    addon = importlib.import_module(pipeline.__name__.split(".")[0])
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "addon_version": ".".join(map(str, addon.bl_info["version"])),
+            "blender_version": bpy.app.version_string,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "cases": [],
+    }
+    for triangles in triangle_counts:
+        for parts in part_counts:
+            if parts > triangles:
+                continue
+            case = run_case(pipeline, triangles, parts, args)
+            results["cases"].append(case)
+            steps = ", ".join(
+                f"{step} {case['steps'][step]['median_ms']:.1f}ms" for step in STEPS
+            )
+            print(f"[benchmark] {case['name']}: {steps}")
+
+    code = EXIT_OK
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            return EXIT_USAGE, {"errors": [f"기준 결과를 읽을 수 없습니다: {e}"]}
+        regressions = compare_results(results, baseline, args.threshold)
+        results["baseline"] = args.baseline
+        results["threshold"] = args.threshold
+        results["regressions"] = regressions
+        for item in regressions:
+            print(
+                f"[benchmark] 회귀 {item['case']} / {item['step']}: "
+                f"{item['baseline_ms']:.1f}ms -> {item['current_ms']:.1f}ms ({item['ratio']:.2f}배)"
+            )
+        if regressions:
+            code = EXIT_REGRESSION
+
+    if not all(case["ok"] for case in results["cases"]):
+        # 생성된 파츠 수가 다르면 시간 비교가 의미 없으므로 실패로 처리
+        code = EXIT_REGRESSION
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return code, results
+
+
+def main(argv=None):
+    code, _results = run(argv)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+여러 개의 `blender -b` 워커 프로세스로 파츠 분리를 분산 실행하는 드라이버.
+
+Blender 없이 일반 파이썬으로 실행합니다.
+
+파일 단위 분산 (파일마다 워커 하나):
+    python fanout.py --blender /opt/blender/blender --jobs 8 \\
+        --ini mod.ini --resource ResourceBodyIB --object Body \\
+        --blend a.blend --blend b.blend ... --output out/
+
+파츠 구간 분산 (메시 하나를 N개 구간으로 나눠 워커마다 라이브러리로 저장 후 병합):
+    python fanout.py --blender /opt/blender/blender --jobs 8 --split-parts \\
+        --ini mod.ini --resource ResourceBodyIB --object Body \\
+        --blend big.blend --output big_parts.blend
+
+마지막에 JSON 요약을 출력하며 종료 코드는 batch_split.py와 같습니다.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+BATCH_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_split.py")
+SUMMARY_PREFIX = "INIPS_SUMMARY "
+
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_USAGE = 2
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="fanout",
+        description="blender -b 워커 여러 개로 파츠 분리를 병렬 실행합니다.",
+    )
+    parser.add_argument("--blender", default="blender", help="Blender 실행 파일 경로")
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1, help="동시에 실행할 워커 수"
+    )
+    parser.add_argument("--ini", required=True, help="INI 파일 경로")
+    parser.add_argument("--resource", required=True, help="IB 리소스 이름")
+    parser.add_argument(
+        "--object", dest="objects", action="append", default=[], help="분리할 오브젝트 이름"
+    )
+    parser.add_argument(
+        "--blend", dest="blends", action="append", required=True, help="입력 .blend 파일"
+    )
+    parser.add_argument("--output", default="", help="결과 .blend 경로 또는 폴더")
+    parser.add_argument(
+        "--split-parts",
+        action="store_true",
+        help="파일 하나의 메시를 파츠 구간별로 나눠 워커에 분배",
+    )
+    parser.add_argument("--summary", default="", help="JSON 요약을 저장할 파일 경로")
+    return parser
+
+
+def _blender_command(blender, blend, script_args):
+    return [
+        blender,
+        "-b",
+        blend,
+        "--factory-startup",
+        "--python-exit-code",
+        str(EXIT_PARTIAL),
+        "--python",
+        BATCH_SCRIPT,
+        "--",
+        *script_args,
+    ]
+
+
+def _run_worker(command):
+    """워커 하나를 실행하고 (종료 코드, batch_split 요약)을 반환합니다."""
+    proc = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+        errors="replace",
+    )
+    summary = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(SUMMARY_PREFIX):
+            summary = json.loads(line[len(SUMMARY_PREFIX) :])
+    if summary is None:
+        tail = "\n".join(proc.stdout.splitlines()[-20:])
+        summary = {"ok": False, "errors": [f"워커 요약을 찾을 수 없습니다.\n{tail}"]}
+    return proc.returncode, summary
+
+
+def _common_args(args):
+    common = ["--ini", os.path.abspath(args.ini), "--resource", args.resource]
+    for name in args.objects:
+        common += ["--object", name]
+    return common
+
+
+def run_per_file(args):
+    common = _common_args(args)
+    output = args.output
+    if output:
+        os.makedirs(output, exist_ok=True)
+        common += ["--output", os.path.abspath(output) + os.sep]
+
+    commands = [
+        _blender_command(args.blender, os.path.abspath(blend), common)
+        for blend in args.blends
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(_run_worker, commands))
+
+    return {
+        "mode": "per_file",
+        "workers": [
+            {"blend": blend, "code": code, "summary": summary}
+            for blend, (code, summary) in zip(args.blends, results)
+        ],
+    }
+
+
+def run_split_parts(args):
+    if len(args.blends) != 1 or len(args.objects) != 1:
+        raise ValueError("--split-parts 는 --blend 와 --object 를 하나씩만 지원합니다.")
+
+    blend = os.path.abspath(args.blends[0])
+    common = _common_args(args)
+    jobs = max(1, args.jobs)
+    temp_dir = tempfile.mkdtemp(prefix="inips_fanout_")
+    try:
+        libraries = [os.path.join(temp_dir, f"part_{i}.blend") for i in range(jobs)]
+        commands = []
+        for i, library in enumerate(libraries):
+            script_args = common + ["--part-chunk", f"{i}/{jobs}", "--library", library]
+            # 잔여 파츠는 전체 파츠 맵이 필요하므로 마지막 워커가 함께 생성
+            if i == jobs - 1:
+                script_args.append("--remaining")
+            commands.append(_blender_command(args.blender, blend, script_args))
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_run_worker, commands))
+        workers = [{"code": code, "summary": summary} for code, summary in results]
+
+        merged = [lib for lib, (code, _) in zip(libraries, results) if code == EXIT_OK]
+        if len(merged) != len(libraries):
+            return {"mode": "split_parts", "workers": workers, "merge": None}
+
+        # 원본 파일을 열어 워커 결과를 합치고 저장
+        merge_args = list(common)
+        for library in merged:
+            merge_args += ["--merge", library]
+        if args.output:
+            merge_args += ["--output", os.path.abspath(args.output)]
+        code, summary = _run_worker(_blender_command(args.blender, blend, merge_args))
+        return {
+            "mode": "split_parts",
+            "workers": workers,
+            "merge": {"code": code, "summary": summary},
+        }
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _is_ok(result):
+    steps = list(result["workers"])
+    if result["mode"] == "split_parts":
+        steps.append(result["merge"])
+    return all(step and step["code"] == EXIT_OK for step in steps)
+
+
+def main(argv=None):
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.split_parts:
+            result = run_split_parts(args)
+        else:
+            result = run_per_file(args)
+    except (ValueError, OSError) as e:
+        print(SUMMARY_PREFIX + json.dumps({"ok": False, "errors": [str(e)]}, ensure_ascii=False))
+        return EXIT_USAGE
+
+    result["ok"] = _is_ok(result)
+    text = json.dumps(result, ensure_ascii=False)
+    print(SUMMARY_PREFIX + text)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return EXIT_OK if result["ok"] else EXIT_PARTIAL
+
+
+if __name__ == "__main__":
+    sys.exit(main())
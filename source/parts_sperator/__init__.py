@@ -1,11 +1,14 @@
 from . import operators, panel
+from .functions import ini_watcher
 
 
 def register():
     operators.register()
     panel.register()
+    ini_watcher.register()
 
 
 def unregister():
+    ini_watcher.unregister()
     panel.unregister()
     operators.unregister()
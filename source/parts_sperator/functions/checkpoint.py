@@ -0,0 +1,142 @@
+"""
+중단한 파츠 분리를 이어서 하거나 되돌리기 위한 체크포인트.
+
+모달 분리를 시작하면 실행 상태(파츠 맵, 처리 순서, 결과 컬렉션, 원본 오브젝트의 컬렉션 링크)를
+Scene 커스텀 프로퍼티에 한 번 저장하고, 파츠를 하나 처리할 때마다 완료 수만 갱신합니다.
+ESC로 멈춘 뒤에는 다음 파츠부터 재개하거나, 만든 파츠를 지우고 원본 링크를 되돌릴 수 있습니다.
+"""
+
+import bpy
+import json
+
+CHECKPOINT_PROP = "inips_split_checkpoint"
+
+
+def save(scene, session, previous=None):
+    """
+    세션 시작 시 체크포인트를 저장합니다.
+    previous(재개한 체크포인트)가 있으면 처음 실행의 원본 링크와 전체 처리 순서를 유지합니다.
+    """
+    state = session.checkpoint_state()
+    base = 0
+    if previous is not None:
+        for key in ("original_collections", "scene_linked", "created_collection", "queue"):
+            state[key] = previous[key]
+        base = previous["done"]
+    scene[CHECKPOINT_PROP] = {
+        "state": json.dumps(state, ensure_ascii=False),
+        "object": state["object"],
+        "base": base,
+        "done": base + session.position,
+        "total": len(state["queue"]),
+    }
+
+
+def update(scene, session):
+    """완료한 파츠 수만 갱신합니다(파츠마다 호출)."""
+    group = scene.get(CHECKPOINT_PROP)
+    if group is not None:
+        group["done"] = group["base"] + session.position
+
+
+def progress(scene):
+    """패널 표시용 (오브젝트 이름, 완료 수, 전체 수). 체크포인트가 없으면 None."""
+    group = scene.get(CHECKPOINT_PROP)
+    if group is None:
+        return None
+    return group["object"], group["done"], group["total"]
+
+
+def load(scene):
+    """저장된 실행 상태(dict, done 포함)를 반환합니다. 없거나 깨졌으면 None."""
+    group = scene.get(CHECKPOINT_PROP)
+    if group is None:
+        return None
+    try:
+        state = json.loads(group["state"])
+    except (KeyError, ValueError):
+        return None
+    state["done"] = int(group["done"])
+    return state
+
+
+def clear(scene):
+    if CHECKPOINT_PROP in scene:
+        del scene[CHECKPOINT_PROP]
+
+
+def resume_session(context, state, reporter=None):
+    """
+    체크포인트에서 아직 처리하지 않은 파츠만 분리하는 SplitSession을 만듭니다.
+
+    Raises:
+        ValueError: 원본 오브젝트나 결과 컬렉션이 없어졌을 때
+    """
+    from ...utils.parts_map import PartsMap
+    from .pipeline import SplitSession
+
+    obj = bpy.data.objects.get(state["object"])
+    if obj is None or obj.type != "MESH":
+        raise ValueError(f"분리 대상 오브젝트를 찾을 수 없습니다: {state['object']}")
+    collection = bpy.data.collections.get(state["collection"] or "")
+    if collection is None:
+        raise ValueError(f"결과 컬렉션을 찾을 수 없습니다: {state['collection']}")
+
+    parts = state["parts"]
+    parts_map = PartsMap(
+        [p[0] for p in parts], [p[1] for p in parts], [p[2] for p in parts]
+    )
+    return SplitSession(
+        context,
+        obj,
+        parts_map,
+        reporter=reporter,
+        part_indices=state["queue"][state["done"] :],
+        collection=collection,
+        resource=state.get("resource", ""),
+    )
+
+
+def rollback(context, state):
+    """
+    중단된 분리를 되돌립니다. 만든 파츠 오브젝트를 지우고(새로 만든 결과 컬렉션이면 컬렉션도),
+    원본 오브젝트를 처음 컬렉션에 다시 링크합니다.
+
+    Returns:
+        int: 삭제한 파츠 오브젝트 수
+    """
+    from .separate_parts import PART_KEY_PROP
+
+    scene = context.scene
+    removed = 0
+    collection = bpy.data.collections.get(state["collection"] or "")
+    if collection is not None:
+        for o in [o for o in collection.objects if PART_KEY_PROP in o]:
+            mesh = o.data if o.type == "MESH" else None
+            bpy.data.objects.remove(o, do_unlink=True)
+            if mesh is not None and mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+            removed += 1
+        if (
+            state.get("created_collection")
+            and not collection.objects
+            and not collection.children
+        ):
+            bpy.data.collections.remove(collection)
+
+    obj = bpy.data.objects.get(state["object"])
+    if obj is not None:
+        for name in state.get("original_collections", []):
+            col = bpy.data.collections.get(name)
+            if col is not None and obj.name not in col.objects:
+                col.objects.link(obj)
+        # 다른 컬렉션에 다시 링크된 경우에만 씬 컬렉션에서 뺌(어디에도 없는 오브젝트가 되지 않도록)
+        if (
+            not state.get("scene_linked")
+            and obj.name in scene.collection.objects
+            and len(obj.users_collection) > 1
+        ):
+            scene.collection.objects.unlink(obj)
+
+    clear(scene)
+    return removed
@@ -1,28 +1,10 @@
-import re
 from ...core.properties import INIPS_Resources
+from ...utils.build_parts_map import find_ib_resources
 
 
 def create_resource_enum(op, scene, sections):
-    # IB 리소스 수집: "ib = ..." 구문에서 값을 추출
-    ib_pattern = re.compile(r"^\s*ib\s*=\s*(.+)$", re.IGNORECASE)
-    resources = []
-    for lines in sections.values():
-        for line in lines:
-            m = ib_pattern.match(line)
-            if not m:
-                continue
-            val = m.group(1).strip()
-            if val:
-                resources.append(val)
-
-    # 순서 유지한 중복 제거 및 Enum 항목 생성 (첫 항목은 NONE)
-    seen = set()
-    enum_items = []
-    for r in resources:
-        if r in seen:
-            continue
-        seen.add(r)
-        enum_items.append((r, r, ""))
+    # IB 리소스 수집: "ib = ..." 구문에서 값을 추출(순서 유지, 중복 제거)
+    enum_items = [(r, r, "") for r in find_ib_resources(sections)]
 
     # 프로퍼티 클래스의 항목을 업데이트
     INIPS_Resources._resource_items = enum_items
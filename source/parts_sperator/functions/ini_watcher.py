@@ -0,0 +1,126 @@
+"""
+외부 편집기에서 INI를 수정하면 패널의 섹션/리소스 목록을 자동으로 갱신하는 감시기.
+
+`bpy.app.timers`로 POLL_INTERVAL마다 파일의 (mtime, 크기)만 확인하고, 바뀌었을 때만
+`IniDocument.update`로 바뀐 섹션과 그 섹션을 호출하는 섹션만 다시 확장합니다.
+"""
+
+import bpy
+import os
+from bpy.app.handlers import persistent
+from . import create_resource_enum, parts_list
+
+POLL_INTERVAL = 1.0
+
+_state = {"path": None, "stat": None, "document": None}
+
+
+def _file_stat(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_text(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def document(path=None):
+    """현재 감시 중인 INI의 IniDocument(없으면 None). path가 주어지면 그 파일을 감시 중일 때만 반환."""
+    if path is not None and path != _state["path"]:
+        return None
+    return _state["document"]
+
+
+def track(path):
+    """path를 전체 파싱해 감시 기준으로 삼습니다."""
+    from ...utils.ini_document import IniDocument
+
+    _state["stat"] = _file_stat(path)
+    _state["document"] = IniDocument(_read_text(path))
+    _state["path"] = path
+    return _state["document"]
+
+
+def apply_to_scene(scene, doc, changed):
+    """바뀐 섹션만 Scene의 섹션 컬렉션에 반영하고 리소스 목록을 갱신합니다."""
+    items = scene.inips_ini_sections
+    sections = doc.sections
+    if [item.section_name for item in items] != list(sections):
+        # 섹션 추가/삭제/순서 변경은 전체 재구성
+        items.clear()
+        for name, lines in sections.items():
+            item = items.add()
+            item.section_name = name
+            item.lines = "\n".join(lines)
+    else:
+        for item in items:
+            if item.section_name in changed:
+                item.lines = "\n".join(sections[item.section_name])
+    create_resource_enum.create_resource_enum(None, scene, sections)
+    parts_list.refresh(scene)
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+def _poll():
+    scene = bpy.context.scene
+    if scene is None or not scene.inips_watch_ini:
+        _state["document"] = None
+        return None
+    path = bpy.path.abspath(scene.inips_ini_path) if scene.inips_ini_path else ""
+    if not path or not os.path.isfile(path):
+        return POLL_INTERVAL
+
+    try:
+        if path != _state["path"] or _state["document"] is None:
+            # 새로 선택한 파일은 불러오기 오퍼레이터가 이미 반영했으므로 기준만 잡음
+            track(path)
+            return POLL_INTERVAL
+        stat = _file_stat(path)
+        if stat == _state["stat"]:
+            return POLL_INTERVAL
+        text = _read_text(path)
+    except (OSError, UnicodeDecodeError):
+        # 편집기가 저장 중일 수 있으므로 다음 틱에 다시 시도
+        return POLL_INTERVAL
+
+    _state["stat"] = stat
+    doc = _state["document"]
+    changed = doc.update(text)
+    if changed:
+        apply_to_scene(scene, doc, changed)
+        print(f"INIPS: INI 변경 감지 — 섹션 {len(changed)}개 갱신")
+    return POLL_INTERVAL
+
+
+def start():
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=POLL_INTERVAL, persistent=True)
+
+
+def stop():
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
+    _state.update(path=None, stat=None, document=None)
+
+
+@persistent
+def _on_load_post(_dummy):
+    # 감시를 켜 둔 채 저장한 파일을 열면 다시 시작
+    scene = bpy.context.scene
+    if scene is not None and getattr(scene, "inips_watch_ini", False):
+        _state.update(path=None, stat=None, document=None)
+        start()
+
+
+def register():
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+
+def unregister():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    stop()
@@ -0,0 +1,175 @@
+"""
+파츠 메시 공유 레지스트리.
+
+같은 원본 메시(내용 지문)에서 같은 drawindexed 범위로 분리한 파츠 메시는 내용이 같으므로,
+분리한 메시에 `원본 지문:start:count` 키를 기록해 두고 같은 키가 다시 나오면
+메시를 새로 만들지 않고 기존 메시 데이터블록을 공유하는 링크 복제 오브젝트를 만듭니다.
+토글 변형처럼 같은 모델을 여러 번 불러와 분리하는 경우 메시 복사/분리 작업과 파일 크기가 줄어듭니다.
+"""
+
+import bpy
+import hashlib
+import numpy as np
+from ...utils import timing
+
+# 분리된 파츠 메시에 기록하는 공유 키 커스텀 프로퍼티
+PART_MESH_KEY_PROP = "inips_part_key"
+# 등록할 때의 파츠 메시 요약값(요소 수 + 좌표 합). 재사용 전에 편집 여부를 싸게 확인
+PART_MESH_CHECK_PROP = "inips_part_check"
+
+# 속성 data_type -> (foreach 이름, dtype, 요소 폭)
+_ATTRIBUTE_LAYOUTS = {
+    "FLOAT": ("value", np.float32, 1),
+    "INT": ("value", np.int32, 1),
+    "INT8": ("value", np.int32, 1),
+    "BOOLEAN": ("value", np.bool_, 1),
+    "FLOAT_VECTOR": ("vector", np.float32, 3),
+    "FLOAT2": ("vector", np.float32, 2),
+    "INT32_2D": ("value", np.int32, 2),
+    "FLOAT_COLOR": ("color", np.float32, 4),
+    "BYTE_COLOR": ("color", np.float32, 4),
+    "QUATERNION": ("value", np.float32, 4),
+    "FLOAT4X4": ("value", np.float32, 16),
+}
+
+
+def _update_array(h, collection, attr, dtype, width):
+    buf = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, buf)
+    h.update(len(buf).to_bytes(8, "little"))
+    h.update(buf.tobytes())
+
+
+def _update_text(h, text):
+    h.update(text.encode("utf-8") + b"\0")
+
+
+def mesh_fingerprint(mesh):
+    """
+    메시 내용 지문. 정점 좌표와 면 구성(루프 정점, 면 크기, 머티리얼 인덱스)에 더해
+    모든 속성 레이어(이름/도메인/형식/값, `.`으로 시작하는 내부 속성 제외), UV 레이어,
+    셰이프 키를 포함합니다. 모두 foreach_get으로 한 번에 읽습니다.
+    정점 그룹 가중치는 일괄로 읽는 API가 없어 정점마다 파이썬 루프가 필요하므로 넣지 않습니다.
+    """
+    h = hashlib.blake2b(digest_size=12)
+    for collection, attr, dtype, width in (
+        (mesh.vertices, "co", np.float32, 3),
+        (mesh.loops, "vertex_index", np.int32, 1),
+        (mesh.polygons, "loop_total", np.int32, 1),
+        (mesh.polygons, "material_index", np.int32, 1),
+    ):
+        _update_array(h, collection, attr, dtype, width)
+
+    # Blender 2.93 미만에는 mesh.attributes가 없음
+    attributes = getattr(mesh, "attributes", None)
+    if attributes is not None:
+        for attribute in sorted(attributes, key=lambda a: a.name):
+            if attribute.name.startswith("."):
+                # 선택/숨김 상태 같은 내부 속성은 내용이 아님
+                continue
+            layout = _ATTRIBUTE_LAYOUTS.get(attribute.data_type)
+            if layout is None:
+                # STRING 등 foreach로 읽을 수 없는 형식은 이름/형식만 반영
+                _update_text(h, f"{attribute.name}:{attribute.data_type}")
+                continue
+            _update_text(h, f"{attribute.name}:{attribute.domain}:{attribute.data_type}")
+            _update_array(h, attribute.data, *layout)
+
+    for layer in sorted(mesh.uv_layers, key=lambda l: l.name):
+        _update_text(h, f"uv:{layer.name}")
+        _update_array(h, layer.data, "uv", np.float32, 2)
+
+    if mesh.shape_keys is not None:
+        for block in mesh.shape_keys.key_blocks:
+            _update_text(h, f"key:{block.name}")
+            _update_array(h, block.data, "co", np.float32, 3)
+    return h.hexdigest()
+
+
+def _mesh_check(mesh):
+    """편집 감지용 요약값: 정점/엣지/루프/면 수와 정점 좌표 합(IDProperty 실수 배열로 저장)."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return [
+        float(len(mesh.vertices)),
+        float(len(mesh.edges)),
+        float(len(mesh.loops)),
+        float(len(mesh.polygons)),
+        float(co.sum(dtype=np.float64)),
+    ]
+
+
+class PartMeshRegistry:
+    """한 원본 메시에 대한 (start, count) -> 공유 파츠 메시 조회."""
+
+    def __init__(self, source_mesh):
+        with timing.phase("mesh_fingerprint"):
+            self.fingerprint = mesh_fingerprint(source_mesh)
+        # 파일에 이미 있는 파츠 메시 색인(이전 실행/다른 변형에서 만든 것 포함)
+        prefix = self.fingerprint + ":"
+        self._meshes = {}
+        for mesh in bpy.data.meshes:
+            key = mesh.get(PART_MESH_KEY_PROP)
+            if isinstance(key, str) and key.startswith(prefix):
+                self._meshes[key] = mesh.name
+
+    def key(self, start, count):
+        return f"{self.fingerprint}:{int(start)}:{int(count)}"
+
+    def lookup(self, start, count):
+        """
+        같은 범위로 만든 파츠 메시가 남아 있으면 반환합니다.
+        편집 중이거나 등록한 뒤 요소 수/좌표가 바뀐 메시는 키를 지우고 공유하지 않습니다.
+        """
+        key = self.key(start, count)
+        name = self._meshes.get(key)
+        mesh = bpy.data.meshes.get(name) if name else None
+        if mesh is None or mesh.get(PART_MESH_KEY_PROP) != key:
+            self._meshes.pop(key, None)
+            return None
+        check = mesh.get(PART_MESH_CHECK_PROP)
+        unchanged = (
+            not mesh.is_editmode
+            and check is not None
+            and list(check) == _mesh_check(mesh)
+        )
+        if not unchanged:
+            for prop in (PART_MESH_KEY_PROP, PART_MESH_CHECK_PROP):
+                if prop in mesh:
+                    del mesh[prop]
+            self._meshes.pop(key, None)
+            return None
+        return mesh
+
+    def add(self, start, count, objects):
+        """분리로 새로 만든 파츠 메시를 등록합니다(오브젝트가 하나일 때만)."""
+        if len(objects) != 1 or getattr(objects[0], "type", None) != "MESH":
+            return
+        key = self.key(start, count)
+        mesh = objects[0].data
+        mesh[PART_MESH_CHECK_PROP] = _mesh_check(mesh)
+        mesh[PART_MESH_KEY_PROP] = key
+        self._meshes[key] = mesh.name
+
+    def instance(self, context, mesh, name, source_obj, collection):
+        """
+        source_obj를 복사해(모디파이어, 부모, 정점 그룹 이름, 커스텀 프로퍼티 유지)
+        데이터만 mesh로 바꾼 새 오브젝트를 만들어 collection에 넣습니다.
+        """
+        base_name = name or "part"
+        if base_name in bpy.data.objects:
+            i = 1
+            while f"{base_name}_{i}" in bpy.data.objects:
+                i += 1
+            base_name = f"{base_name}_{i}"
+        obj = source_obj.copy()
+        obj.data = mesh
+        obj.name = base_name
+        if collection is None:
+            collection = (
+                source_obj.users_collection[0]
+                if source_obj.users_collection
+                else context.collection
+            )
+        collection.objects.link(obj)
+        return obj
@@ -0,0 +1,84 @@
+"""
+패널의 파츠 목록(UIList) 데이터.
+
+`Scene.inips_parts`를 현재 INI/리소스의 파츠 맵으로 채우고, 목록 필터/정렬에 쓰는 열
+(소문자 이름, 이름순 순위)을 한 번만 계산해 둡니다. UIList는 매 redraw마다 `filter_items`를
+부르므로 이 열과 `revision()`을 키로 결과를 캐시해 파츠가 1000개 이상이어도 다시 계산하지 않습니다.
+"""
+
+import bpy
+
+_state = {"revision": 0, "columns": None}
+
+
+def revision():
+    """목록을 다시 채울 때마다 1씩 증가하는 번호(필터 캐시 키)."""
+    return _state["revision"]
+
+
+def scene_parts_map(scene):
+    """
+    Scene에 불러온 INI와 선택된 리소스의 파츠 맵을 반환합니다.
+    INI 감시 중이면 감시기의 문서가 캐시한 파츠 맵을 그대로 사용합니다.
+    """
+    from ...utils import build_parts_map
+    from . import ini_watcher
+
+    resource = scene.inips_resource
+    path = bpy.path.abspath(scene.inips_ini_path) if scene.inips_ini_path else ""
+    doc = ini_watcher.document(path)
+    if doc is not None:
+        return doc.parts_map(resource)
+
+    sections = {}
+    for item in scene.inips_ini_sections:
+        sections[item.section_name] = item.lines.splitlines()
+    return build_parts_map.build_parts_map(sections, resource)
+
+
+def refresh(scene):
+    """파츠 목록을 현재 파츠 맵으로 다시 채우고 파츠 수를 반환합니다."""
+    items = scene.inips_parts
+    items.clear()
+    _state["revision"] += 1
+    _state["columns"] = None
+
+    if not scene.inips_ini_sections or not scene.inips_resource:
+        scene.inips_parts_index = 0
+        return 0
+
+    parts_map = scene_parts_map(scene)
+    keys = parts_map.keys()
+    for name, key in zip(parts_map.names, keys):
+        item = items.add()
+        item.name = name
+        item.key = key
+    if len(parts_map):
+        items.foreach_set("start_index", parts_map.starts.astype("int32"))
+        items.foreach_set("index_count", parts_map.counts.astype("int32"))
+
+    scene.inips_parts_index = min(scene.inips_parts_index, max(len(items) - 1, 0))
+    return len(items)
+
+
+def columns(scene):
+    """
+    필터/정렬용 열을 반환합니다. 목록이 바뀌지 않았으면 이전 계산을 재사용합니다.
+
+    Returns:
+        dict: key(캐시 키), lower(소문자 이름 리스트), alpha_rank(이름순 정렬 위치)
+    """
+    items = scene.inips_parts
+    key = (_state["revision"], scene.as_pointer(), len(items))
+    cols = _state["columns"]
+    if cols is not None and cols["key"] == key:
+        return cols
+
+    # 파일을 새로 열었을 때처럼 refresh 없이 목록이 바뀐 경우에도 key로 감지해 다시 계산
+    lower = [item.name.lower() for item in items]
+    alpha_rank = [0] * len(lower)
+    for rank, i in enumerate(sorted(range(len(lower)), key=lower.__getitem__)):
+        alpha_rank[i] = rank
+    cols = {"key": key, "lower": lower, "alpha_rank": alpha_rank}
+    _state["columns"] = cols
+    return cols
@@ -0,0 +1,642 @@
+import bpy
+import json
+import os
+import time
+from ...utils import timing, run_history
+from ...utils.memory import process_memory, MemoryMonitor
+from ...utils import defunctionalize, build_parts_map
+from ...utils.ini_parser import parse_ini_sections
+from ...utils.ini_inspect import load_ini_sections
+from ...utils.parts_map import PartsMap
+from ...utils.interval_index import analyze_parts
+from ...utils.part_faces import FaceSetPrefetcher
+from ...utils.ib_order import ensure_ib_order, total_ib_indices
+from ...utils.selector import mesh_snapshot
+from . import separate_parts
+from .mesh_registry import PartMeshRegistry
+from .split_record import SPLIT_RECORD_PROP, split_record
+
+
+class SplitSession:
+    """
+    한 오브젝트에 대한 파츠 분리 실행 상태.
+
+    모달 오퍼레이터는 타이머 틱마다 `step()`을 호출하고,
+    헤드리스 실행은 `run()`으로 같은 파이프라인을 동기적으로 끝까지 수행합니다.
+    `separate_parts` 함수들은 이 객체를 `self`로 받아 `report`와 `_scene_collection`을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        context,
+        target_obj,
+        parts_map,
+        reporter=None,
+        part_range=None,
+        part_indices=None,
+        collection=None,
+        resource="",
+    ):
+        self.context = context
+        self._target_obj = target_obj
+        if not isinstance(parts_map, PartsMap):
+            parts_map = PartsMap.from_rows(parts_map)
+        self._parts_map = parts_map
+        self._reporter = reporter
+
+        # 분리할 파츠 구간 [start, stop) — 워커 분산 실행 시 일부만 처리
+        start, stop = part_range or (0, len(parts_map))
+        self._start = max(0, min(start, len(parts_map)))
+        self._stop = max(self._start, min(stop, len(parts_map)))
+        # 처리할 파츠 위치 목록 — part_indices가 주어지면(재분리) 그 파츠들만 처리
+        if part_indices is not None:
+            self._queue = sorted(i for i in part_indices if 0 <= i < len(parts_map))
+        else:
+            self._queue = list(range(self._start, self._stop))
+        self._keys = parts_map.keys()
+        self.resource = resource
+
+        self._pos = 0
+        self._success_count = 0
+        self._skipped_count = 0
+        self._shared_count = 0
+        self._remaining_created = False
+        self._mesh_registry = None
+        self._prefetch = None
+
+        self._original_collections = []
+        self._scene_collection = None
+        self._new_collection = collection
+        self._reuse_collection = collection is not None
+        self._source_mesh_name = None
+        self._matrix_world = None
+
+        self.mesh_stats = {}
+        self.analysis = None
+        self._valid = None
+        self._started = None
+        self.elapsed = 0.0
+        self.memory = None
+
+        self.messages = []
+
+    def report(self, level, message):
+        self.messages.append((next(iter(level), "INFO"), message))
+        if self._reporter:
+            self._reporter(level, message)
+
+    @property
+    def done(self):
+        return self._pos >= len(self._queue)
+
+    def begin(self):
+        """원본 컬렉션 정보를 보관하고 분리된 파츠를 모을 새 컬렉션을 만듭니다."""
+        context = self.context
+        target_obj = self._target_obj
+
+        self._pos = 0
+        self._success_count = 0
+        self._skipped_count = 0
+        self._shared_count = 0
+        self._remaining_created = False
+        self._started = time.perf_counter()
+        self.memory = MemoryMonitor()
+
+        mesh = getattr(target_obj, "data", None)
+        if mesh is not None:
+            # 첫 분리 때 현재 면 순서를 원래 IB 순서로 기록(편집 후 범위 조회/IB 순서 재정렬에 사용)
+            with timing.phase("ib_order"):
+                ensure_ib_order(mesh)
+            self.mesh_stats = {
+                "vertices": len(mesh.vertices),
+                "polygons": len(mesh.polygons),
+                # 폴리곤마다 (루프 수 - 2)개 삼각형
+                "triangles": len(mesh.loops) - 2 * len(mesh.polygons),
+            }
+            if len(self._parts_map):
+                self._analyze_ranges(total_ib_indices(mesh))
+                # 같은 원본/범위로 이미 만든 파츠 메시는 새로 분리하지 않고 공유
+                if getattr(context.scene, "inips_share_part_meshes", False):
+                    self._mesh_registry = PartMeshRegistry(mesh)
+                self._start_prefetch(mesh)
+
+        # 원본/컬렉션 정보 보관
+        self._original_collections = list(target_obj.users_collection)
+        self._scene_collection = context.scene.collection
+
+        if self._scene_collection not in self._original_collections:
+            for col in self._original_collections:
+                col.objects.unlink(target_obj)
+            self._scene_collection.objects.link(target_obj)
+
+        # 재분리: 기존 결과 컬렉션을 그대로 사용
+        if self._reuse_collection:
+            return
+
+        # 새 컬렉션 생성 및 씬에 링크(여기에 분리된 파츠들을 모음)
+        base_name = target_obj.name
+        new_col_name = base_name
+        if bpy.data.collections.get(new_col_name):
+            i = 1
+            while bpy.data.collections.get(f"{new_col_name}_{i}"):
+                i += 1
+            new_col_name = f"{new_col_name}_{i}"
+        self._new_collection = bpy.data.collections.new(new_col_name)
+        # 원본 컬렉션이 있으면 그 밑에 링크, 없으면 씬에 링크
+        if self._original_collections:
+            for col in self._original_collections:
+                if self._new_collection.name not in [c.name for c in col.children]:
+                    col.children.link(self._new_collection)
+        else:
+            self._scene_collection.children.link(self._new_collection)
+
+    def _analyze_ranges(self, total_indices):
+        """파츠 범위를 한 번에 점검해 범위 오류/겹침/빈 구간을 보고하고 유효 마스크를 보관합니다."""
+        parts_map = self._parts_map
+        with timing.phase("analyze_ranges"):
+            self.analysis = analyze_parts(parts_map, total_indices)
+            self._valid = parts_map.valid_mask(total_indices)
+
+        analysis = self.analysis
+        for item in analysis["invalid"]:
+            if item["reason"] == "out_of_bounds":
+                self.report(
+                    {"WARNING"},
+                    f"Invalid drawIndexed range for part {item['name']}: "
+                    f"{item['start']},{item['count']} (0~{total_indices})",
+                )
+        if analysis["overlaps"]:
+            first = analysis["overlaps"][0]
+            self.report(
+                {"WARNING"},
+                f"겹치는 파츠 범위 {len(analysis['overlaps'])}개 "
+                f"(예: {first['a']} / {first['b']}, 인덱스 {first['count']}개)",
+            )
+        if analysis["coverage"] is not None and analysis["gaps"]:
+            self.report(
+                {"INFO"},
+                f"파츠가 덮는 인덱스 {analysis['coverage'] * 100:.1f}%, "
+                f"빈 구간 {len(analysis['gaps'])}개(잔여 파츠로 분리)",
+            )
+
+    def _start_prefetch(self, mesh):
+        """
+        범위가 유효한 파츠의 면/정점/엣지 인덱스를 작업 스레드에서 미리 계산하기 시작합니다.
+        메시 배열은 여기서 한 번 복사하므로 이후 bpy 변경과 겹쳐도 안전합니다.
+        """
+        with timing.phase("mesh_snapshot"):
+            snapshot = mesh_snapshot(mesh)
+        indices = [i for i in self._queue if self._valid is None or self._valid[i]]
+        self._prefetch = FaceSetPrefetcher(snapshot, self._parts_map, indices)
+
+    def close(self):
+        """미리 계산 작업 스레드를 정리합니다(종료/취소 시 호출)."""
+        if self._prefetch is not None:
+            self._prefetch.close()
+            self._prefetch = None
+
+    def step(self):
+        """다음 파츠 하나를 분리합니다."""
+        parts_map = self._parts_map
+        i = self._queue[self._pos]
+        self._pos += 1
+        name = parts_map.names[i]
+        timing.set_part(name)
+        if self._valid is not None and not self._valid[i]:
+            # 범위 오류는 begin()에서 이미 보고함 — 복제 없이 건너뜀
+            self._skipped_count += 1
+            return
+        start, count = int(parts_map.starts[i]), int(parts_map.counts[i])
+        registry = self._mesh_registry
+        shared = registry.lookup(start, count) if registry else None
+        prefetch = self._prefetch
+        if shared is not None:
+            if prefetch is not None:
+                prefetch.discard(i)
+            with timing.phase("shared_mesh"):
+                created = [
+                    registry.instance(
+                        self.context, shared, name, self._target_obj, self._new_collection
+                    )
+                ]
+            self._shared_count += 1
+        else:
+            face_set = None
+            if prefetch is not None:
+                with timing.phase("wait_face_set"):
+                    face_set = prefetch.get(i)
+            created = separate_parts.separate_parts(
+                self,
+                self.context,
+                self._target_obj,
+                name,
+                start,
+                count,
+                self._new_collection,
+                face_set,
+            )
+            if registry:
+                registry.add(start, count, created)
+        for o in created:
+            o[separate_parts.PART_KEY_PROP] = self._keys[i]
+        if created:
+            self._success_count += len(created)
+        else:
+            self._skipped_count += 1
+        self.memory.sample()
+
+    def finish(self, create_remaining=True, delete_original=True, keep_source=False):
+        """
+        잔여 파츠를 만들고 원본 오브젝트를 삭제합니다.
+        keep_source면 원본 메시를 가짜 사용자로 남기고 결과 컬렉션에 파츠 맵을 기록해
+        나중에 `resplit_collection`으로 바뀐 파츠만 다시 분리할 수 있게 합니다.
+        """
+        context = self.context
+        timing.set_part(None)
+        self.close()
+
+        # 잔여 파츠 생성 (create_remaining_part는 생성된 오브젝트 수를 반환)
+        if create_remaining:
+            created = separate_parts.create_remaining_part(
+                self,
+                context,
+                self._target_obj,
+                self._parts_map,
+                self._new_collection,
+            )
+            if created:
+                self._success_count += created
+            self._remaining_created = bool(created)
+
+        # 원본 오브젝트 삭제
+        orig = self._target_obj
+        if orig and keep_source and getattr(orig, "data", None):
+            orig.data.use_fake_user = True
+            self._source_mesh_name = orig.data.name
+            self._matrix_world = [v for row in orig.matrix_world for v in row]
+            self._store_record(orig.name)
+        if orig and delete_original:
+            with timing.phase("delete_original"):
+                self._delete_target()
+
+        if self._started is not None:
+            self.elapsed = time.perf_counter() - self._started
+        if self.memory is not None:
+            self.memory.stop()
+
+    def _delete_target(self):
+        """원본 오브젝트와 더 이상 쓰이지 않는 메쉬/머티리얼을 삭제합니다."""
+        context = self.context
+        orig = self._target_obj
+        if orig:
+            orig_name = orig.name
+            mesh_name = None
+            mats_to_check = []
+
+            if getattr(orig, "data", None):
+                mesh_name = orig.data.name
+                mats_to_check = [m.name for m in orig.data.materials if m is not None]
+
+            # 선택 해제 후 대상 활성화 -> 삭제 시도
+            try:
+                bpy.ops.object.select_all(action="DESELECT")
+            except Exception:
+                for o in context.view_layer.objects:
+                    o.select_set(False)
+
+            obj_to_del = bpy.data.objects.get(orig_name)
+            if obj_to_del:
+                obj_to_del.select_set(True)
+                context.view_layer.objects.active = obj_to_del
+                try:
+                    bpy.ops.object.delete()
+                except Exception:
+                    bpy.data.objects.remove(obj_to_del, do_unlink=True)
+
+            # 메쉬/머티리얼 정리(다른 곳에서 사용중이지 않을 때만 제거)
+            if mesh_name:
+                mesh = bpy.data.meshes.get(mesh_name)
+                if mesh and mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
+            for mname in mats_to_check:
+                m = bpy.data.materials.get(mname)
+                if m and m.users == 0:
+                    bpy.data.materials.remove(m)
+
+            # 참조 해제
+            self._target_obj = None
+
+    def _store_record(self, object_name):
+        collection = self._new_collection
+        if collection is None:
+            return
+        parts_map = self._parts_map
+        if self._reuse_collection:
+            # 재분리의 임시 원본은 이름이 바뀌었을 수 있으므로 처음 기록한 이름 유지
+            object_name = (split_record(collection) or {}).get("object", object_name)
+        collection[SPLIT_RECORD_PROP] = json.dumps(
+            {
+                "object": object_name,
+                "source_mesh": self._source_mesh_name,
+                "matrix_world": self._matrix_world,
+                "resource": self.resource,
+                "parts": [
+                    [key, int(start), int(count)]
+                    for key, start, count in zip(
+                        self._keys, parts_map.starts, parts_map.counts
+                    )
+                ],
+            },
+            ensure_ascii=False,
+        )
+
+    def adopt_objects(self, objects):
+        """다른 곳(예: 워커가 쓴 라이브러리)에서 만든 파츠 오브젝트를 결과 컬렉션으로 옮깁니다."""
+        collection = self._new_collection
+        for o in objects:
+            for col in list(o.users_collection):
+                col.objects.unlink(o)
+            collection.objects.link(o)
+            self._success_count += 1
+
+    def run(self, create_remaining=True, delete_original=True, keep_source=False):
+        """구간 내 파츠를 동기적으로 분리하고 요약을 반환합니다."""
+        self.begin()
+        while not self.done:
+            self.step()
+        self.finish(create_remaining, delete_original, keep_source)
+        return self.summary()
+
+    def checkpoint_state(self):
+        """중단 후 재개/되돌리기에 필요한 실행 상태(JSON으로 저장 가능한 dict)."""
+        scene_col = self._scene_collection
+        parts_map = self._parts_map
+        return {
+            "object": self._target_obj.name,
+            "resource": self.resource,
+            "collection": self._new_collection.name if self._new_collection else None,
+            "created_collection": not self._reuse_collection,
+            "original_collections": [
+                c.name for c in self._original_collections if c != scene_col
+            ],
+            "scene_linked": scene_col in self._original_collections,
+            "parts": [
+                [name, int(start), int(count)]
+                for name, start, count in zip(
+                    parts_map.names, parts_map.starts, parts_map.counts
+                )
+            ],
+            "queue": list(self._queue),
+        }
+
+    @property
+    def position(self):
+        """처리한(건너뛴 것 포함) 파츠 수."""
+        return self._pos
+
+    @property
+    def new_collection(self):
+        return self._new_collection
+
+    @property
+    def attempts(self):
+        return self._pos + (1 if self._remaining_created else 0)
+
+    def summary(self):
+        return {
+            "parts": len(self._parts_map),
+            "range": [self._start, self._stop],
+            "attempts": self.attempts,
+            "created": self._success_count,
+            "skipped": self._skipped_count,
+            "shared": self._shared_count,
+            "remaining_created": self._remaining_created,
+            "collection": self._new_collection.name if self._new_collection else None,
+            "mesh": dict(self.mesh_stats),
+            "analysis": (
+                {
+                    "invalid": len(self.analysis["invalid"]),
+                    "overlaps": len(self.analysis["overlaps"]),
+                    "gaps": len(self.analysis["gaps"]),
+                    "coverage": self.analysis["coverage"],
+                }
+                if self.analysis
+                else None
+            ),
+            "elapsed_ms": self.elapsed * 1000.0,
+            "memory": self.memory.as_dict() if self.memory else None,
+            "messages": [{"level": lv, "message": msg} for lv, msg in self.messages],
+        }
+
+
+def record_run(path, summary, ini_path, engine, timer=None):
+    """
+    분리 실행 하나를 실행 기록 파일(JSON Lines)에 추가합니다.
+
+    Args:
+        summary: `SplitSession.summary()` 결과(+ object/resource)
+        engine: 실행 방식("modal", "headless", "import_hook", "import_direct")
+        timer: 같은 실행을 측정한 `timing.PhaseTimer`(없으면 단계별 시간 없이 기록)
+
+    peak_memory는 이 실행 구간의 최대 메모리(`MemoryMonitor`)이고,
+    process_peak_memory는 Blender 프로세스 시작 이후의 최대 메모리입니다.
+    """
+    from ...core.preferences import addon_version
+
+    # 프로세스 최대값(VmHWM 등)은 이전 작업의 최대치가 남으므로 실행 구간 최대값과 따로 기록
+    _current, process_peak = process_memory()
+    run_memory = summary.get("memory") or {}
+    timings = timer.as_dict() if timer is not None else {}
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "ini": os.path.basename(ini_path or ""),
+        "ini_hash": run_history.file_hash(ini_path) if ini_path else "",
+        "resource": summary.get("resource", ""),
+        "object": summary.get("object", ""),
+        "mesh": summary.get("mesh", {}),
+        "parts": summary.get("parts", 0),
+        "created": summary.get("created", 0),
+        "skipped": summary.get("skipped", 0),
+        "total_ms": timings.get("total_ms") or summary.get("elapsed_ms", 0.0),
+        "phases": timings.get("phases", {}),
+        "peak_memory": run_memory.get("peak"),
+        "run_memory": summary.get("memory"),
+        "process_peak_memory": process_peak,
+        "engine": engine,
+        "addon_version": addon_version(),
+        "blender_version": bpy.app.version_string,
+    }
+    run_history.append_record(path, record)
+    return record
+
+
+def chunk_range(total, chunk, chunks):
+    """파츠 total개를 chunks개로 나눴을 때 chunk번째(0부터) 연속 구간을 반환합니다."""
+    if chunks <= 0 or not 0 <= chunk < chunks:
+        raise ValueError(f"Invalid chunk {chunk}/{chunks}.")
+    return total * chunk // chunks, total * (chunk + 1) // chunks
+
+
+def split_object(
+    context,
+    obj,
+    sections,
+    resource,
+    reporter=None,
+    part_chunk=None,
+    create_remaining=True,
+    delete_original=True,
+    keep_source=False,
+):
+    """
+    모달 없이 한 오브젝트를 INI 섹션 맵 기준으로 끝까지 분리합니다.
+    part_chunk=(i, n)이 주어지면 파츠 맵을 n개로 나눈 i번째 구간만 분리합니다.
+    keep_source면 재분리를 위해 원본 메시와 파츠 맵을 남깁니다(`SplitSession.finish` 참고).
+
+    Returns:
+        dict: 실행 요약(`SplitSession.summary()` 형식 + object/resource)
+    Raises:
+        ValueError: 메시 오브젝트가 아닐 때
+    """
+    if obj is None or obj.type != "MESH":
+        raise ValueError("분리 대상은 메시 오브젝트여야 합니다.")
+
+    obj_name = obj.name
+    parts_map = build_parts_map.build_parts_map(sections, resource)
+    part_range = chunk_range(len(parts_map), *part_chunk) if part_chunk else None
+    session = SplitSession(
+        context,
+        obj,
+        parts_map,
+        reporter=reporter,
+        part_range=part_range,
+        resource=resource,
+    )
+    if parts_map:
+        summary = session.run(create_remaining, delete_original, keep_source)
+    else:
+        summary = session.summary()
+    summary["object"] = obj_name
+    summary["resource"] = resource
+    return summary
+
+
+def merge_part_libraries(context, obj, library_paths, reporter=None):
+    """
+    워커 프로세스들이 저장한 파츠 라이브러리(.blend)를 현재 파일로 가져와
+    하나의 결과 컬렉션에 모으고 원본 오브젝트를 삭제합니다.
+    """
+    if obj is None or obj.type != "MESH":
+        raise ValueError("분리 대상은 메시 오브젝트여야 합니다.")
+
+    obj_name = obj.name
+    session = SplitSession(context, obj, [], reporter=reporter)
+    session.begin()
+    for path in library_paths:
+        with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+            data_to.collections = list(data_from.collections)
+        for col in data_to.collections:
+            if col is None:
+                continue
+            session.adopt_objects(list(col.objects))
+            bpy.data.collections.remove(col)
+    session.finish(create_remaining=False)
+
+    summary = session.summary()
+    summary["object"] = obj_name
+    summary["libraries"] = list(library_paths)
+    return summary
+
+
+def diff_parts(record_parts, parts_map):
+    """
+    기록된 파츠([key, start, count] 목록)와 새 파츠 맵을 키와 범위로 비교합니다.
+
+    Returns:
+        (unchanged_keys, rebuild_indices, stale_keys, removed_keys)
+        rebuild_indices: 새로 생겼거나 범위가 바뀐 파츠의 parts_map 위치
+        stale_keys: 오브젝트를 지워야 하는 기존 키(범위 변경 + 삭제)
+        removed_keys: 새 파츠 맵에 없는 기존 키
+    """
+    old = {key: (start, count) for key, start, count in record_parts}
+    new_keys = parts_map.keys()
+    unchanged, rebuild = set(), []
+    for i, key in enumerate(new_keys):
+        if old.get(key) == (int(parts_map.starts[i]), int(parts_map.counts[i])):
+            unchanged.add(key)
+        else:
+            rebuild.append(i)
+    new_set = set(new_keys)
+    stale = [key for key in old if key not in unchanged]
+    removed = [key for key in old if key not in new_set]
+    return unchanged, rebuild, stale, removed
+
+
+def _remove_objects(objects):
+    for o in objects:
+        mesh = o.data if o.type == "MESH" else None
+        bpy.data.objects.remove(o, do_unlink=True)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def resplit_collection(context, collection, sections, resource=None, reporter=None):
+    """
+    이전 분리 결과 컬렉션을 새 INI 섹션 맵과 비교해 추가/변경된 파츠만 다시 만듭니다.
+    범위가 같은 파츠 오브젝트는 그대로 두고, 삭제/변경된 파츠 오브젝트는 지웁니다.
+    파츠가 하나라도 바뀌면 잔여 파츠도 다시 만듭니다.
+
+    Returns:
+        dict: 실행 요약 + unchanged/rebuilt/removed
+    Raises:
+        ValueError: 분리 기록이나 보관된 원본 메시가 없을 때
+    """
+    record = split_record(collection)
+    if record is None:
+        raise ValueError("이 컬렉션에는 분리 기록이 없습니다.")
+    mesh = bpy.data.meshes.get(record.get("source_mesh") or "")
+    if mesh is None:
+        raise ValueError("보관된 원본 메시를 찾을 수 없습니다. 전체 분리를 다시 실행하세요.")
+
+    resource = resource or record.get("resource", "")
+    parts_map = build_parts_map.build_parts_map(sections, resource)
+    unchanged, rebuild, stale, removed = diff_parts(record.get("parts", []), parts_map)
+    summary_extra = {
+        "object": record.get("object", ""),
+        "resource": resource,
+        "unchanged": len(unchanged),
+        "rebuilt": len(rebuild),
+        "removed": len(removed),
+    }
+    if not rebuild and not stale:
+        summary_extra["created"] = 0
+        summary_extra["skipped"] = 0
+        summary_extra["shared"] = 0
+        return summary_extra
+
+    # 바뀐/없어진 파츠와 잔여 파츠 오브젝트 삭제
+    stale = set(stale) | {separate_parts.REMAINING_KEY}
+    _remove_objects(
+        [o for o in collection.objects if o.get(separate_parts.PART_KEY_PROP) in stale]
+    )
+
+    # 보관된 메시로 임시 원본 오브젝트를 만들어 필요한 파츠만 분리
+    source = bpy.data.objects.new(record.get("object") or mesh.name, mesh)
+    if record.get("matrix_world"):
+        m = record["matrix_world"]
+        source.matrix_world = [m[0:4], m[4:8], m[8:12], m[12:16]]
+    context.scene.collection.objects.link(source)
+    context.view_layer.objects.active = source
+
+    session = SplitSession(
+        context,
+        source,
+        parts_map,
+        reporter=reporter,
+        part_indices=rebuild,
+        collection=collection,
+        resource=resource,
+    )
+    summary = session.run(create_remaining=True, delete_original=True, keep_source=True)
+    summary.update(summary_extra)
+    return summary
@@ -1,40 +1,44 @@
 import bpy
 import bmesh
-from ...utils.selector import select_indices_from_drawindexed
-
-
-def separate_parts(self, context, obj, part, collection):
+import numpy as np
+from ...utils import timing
+from ...utils.selector import (
+    select_indices_from_drawindexed,
+    select_face_set,
+    polygon_mask_from_ranges,
+)
+from ...utils.ib_order import total_ib_indices
+
+# 분리된 오브젝트에 어떤 파츠에서 나왔는지 기록하는 커스텀 프로퍼티(재분리 시 사용)
+PART_KEY_PROP = "inips_part"
+REMAINING_KEY = "<remaining>"
+
+
+def separate_parts(
+    self, context, obj, name, start_index, index_count, collection, face_set=None
+):
+    """
+    파츠 하나를 분리해 collection에 넣고, 만들어진 오브젝트 목록을 반환합니다.
+    face_set(미리 계산한 폴리곤/정점/엣지 인덱스)이 주어지면 범위 계산 없이 그대로 선택합니다.
+    """
     if obj is None or obj.type != "MESH":
-        return
-
-    name = part.get("name") if isinstance(part, dict) else getattr(part, "name", None)
-    if not name:
-        name = "part"
-
-    start_index = (
-        int(part.get("start_index", 0))
-        if isinstance(part, dict)
-        else int(getattr(part, "start_index", 0) or 0)
-    )
-    index_count = (
-        int(part.get("index_count", 0))
-        if isinstance(part, dict)
-        else int(getattr(part, "index_count", 0) or 0)
-    )
+        return []
 
+    name = name or "part"
     if index_count <= 0:
-        return
+        return []
 
     # 상태 보존
     old_active = context.view_layer.objects.active
     old_selected = [o for o in context.selected_objects]
 
     # 오브젝트 복제 (데이터 복사)
-    dup_obj = obj.copy()
-    dup_obj.data = obj.data.copy()
-    dup_obj.matrix_world = obj.matrix_world
-    link_col = obj.users_collection[0] if obj.users_collection else context.collection
-    link_col.objects.link(dup_obj)
+    with timing.phase("duplicate"):
+        dup_obj = obj.copy()
+        dup_obj.data = obj.data.copy()
+        dup_obj.matrix_world = obj.matrix_world
+        link_col = obj.users_collection[0] if obj.users_collection else context.collection
+        link_col.objects.link(dup_obj)
 
     # 이름/참조는 문자열로 저장(삭제된 RNA에 접근하는 오류 방지)
     dup_name = dup_obj.name
@@ -51,12 +55,17 @@ def separate_parts(self, context, obj, part, collection):
     dup_obj.select_set(True)
     context.view_layer.objects.active = dup_obj
 
+    separated = []
     try:
         # 인덱스 범위에 해당하는 face 선택
         try:
-            select_count, _, _ = select_indices_from_drawindexed(
-                dup_obj.data, start_index, index_count
-            )
+            if face_set is not None:
+                with timing.phase("select_face_set"):
+                    select_count = select_face_set(dup_obj, *face_set)
+            else:
+                select_count, _, _ = select_indices_from_drawindexed(
+                    dup_obj.data, start_index, index_count
+                )
         except Exception as e:
             reporter = getattr(self, "report", None)
             if reporter:
@@ -85,7 +94,7 @@ def separate_parts(self, context, obj, part, collection):
                 m = bpy.data.materials.get(mname)
                 if m and m.users == 0:
                     bpy.data.materials.remove(m)
-            return
+            return []
 
         # 선택된 face가 없으면 복제 삭제 후 종료
         if select_count == 0:
@@ -110,11 +119,16 @@ def separate_parts(self, context, obj, part, collection):
                 m = bpy.data.materials.get(mname)
                 if m and m.users == 0:
                     bpy.data.materials.remove(m)
-            return
+            return []
 
         # 선택된 면 분리
-        bpy.ops.mesh.separate(type="SELECTED")
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with timing.phase("mesh.separate"):
+            bpy.ops.mesh.separate(type="SELECTED")
+            bpy.ops.object.mode_set(mode="OBJECT")
+        # 복제본이 아직 남아 있는 시점이 파츠 하나의 최대 메모리
+        monitor = getattr(self, "memory", None)
+        if monitor is not None:
+            monitor.sample()
 
         # 분리된 오브젝트들에 이름 지정 (중복 방지)
         separated = [o for o in context.selected_objects if o != dup_obj]
@@ -150,30 +164,31 @@ def separate_parts(self, context, obj, part, collection):
                         collection.objects.link(o)
 
     finally:
-        # 복제 오브젝트 삭제 및 데이터/머티리얼 정리 (이름으로 안전 조회)
-        try:
-            bpy.ops.object.select_all(action="DESELECT")
-        except Exception:
-            for o in context.view_layer.objects:
-                o.select_set(False)
-
-        obj_to_del = bpy.data.objects.get(dup_name)
-        if obj_to_del:
-            obj_to_del.select_set(True)
-            context.view_layer.objects.active = obj_to_del
+        with timing.phase("cleanup"):
+            # 복제 오브젝트 삭제 및 데이터/머티리얼 정리 (이름으로 안전 조회)
             try:
-                bpy.ops.object.delete()
+                bpy.ops.object.select_all(action="DESELECT")
             except Exception:
-                bpy.data.objects.remove(obj_to_del, do_unlink=True)
+                for o in context.view_layer.objects:
+                    o.select_set(False)
+
+            obj_to_del = bpy.data.objects.get(dup_name)
+            if obj_to_del:
+                obj_to_del.select_set(True)
+                context.view_layer.objects.active = obj_to_del
+                try:
+                    bpy.ops.object.delete()
+                except Exception:
+                    bpy.data.objects.remove(obj_to_del, do_unlink=True)
 
-        mesh = bpy.data.meshes.get(mesh_name)
-        if mesh and mesh.users == 0:
-            bpy.data.meshes.remove(mesh)
+            mesh = bpy.data.meshes.get(mesh_name)
+            if mesh and mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
 
-        for mname in _mats_to_check:
-            m = bpy.data.materials.get(mname)
-            if m and m.users == 0:
-                bpy.data.materials.remove(m)
+            for mname in _mats_to_check:
+                m = bpy.data.materials.get(mname)
+                if m and m.users == 0:
+                    bpy.data.materials.remove(m)
 
         # 이전 선택/활성 상태 복원
         try:
@@ -190,6 +205,8 @@ def separate_parts(self, context, obj, part, collection):
                 if o.name in bpy.data.objects:
                     bpy.data.objects[o.name].select_set(True)
 
+    return separated
+
 
 def create_remaining_part(self, context, obj, parts_map, collection):
     if not obj or not parts_map:
@@ -200,11 +217,12 @@ def create_remaining_part(self, context, obj, parts_map, collection):
     old_selected = [o for o in context.selected_objects]
 
     # 오브젝트 복제 (데이터 복사)
-    dup_obj = obj.copy()
-    dup_obj.data = obj.data.copy()
-    dup_obj.matrix_world = obj.matrix_world
-    link_col = obj.users_collection[0] if obj.users_collection else context.collection
-    link_col.objects.link(dup_obj)
+    with timing.phase("duplicate"):
+        dup_obj = obj.copy()
+        dup_obj.data = obj.data.copy()
+        dup_obj.matrix_world = obj.matrix_world
+        link_col = obj.users_collection[0] if obj.users_collection else context.collection
+        link_col.objects.link(dup_obj)
 
     dup_name = dup_obj.name
     mesh_name = dup_obj.data.name
@@ -224,37 +242,13 @@ def create_remaining_part(self, context, obj, parts_map, collection):
 
         # parts_map 전체의 폴리곤 인덱스 합집합 계산
         mesh = dup_obj.data
-        mesh.calc_loop_triangles()
-        tris = mesh.loop_triangles
-        total_indices = len(tris) * 3
-
-        selected_poly_indices = set()
-        for part in parts_map:
-            if isinstance(part, dict):
-                start = int(part.get("start_index", 0))
-                count = int(part.get("index_count", 0))
-            else:
-                start = int(getattr(part, "start_index", 0) or 0)
-                count = int(getattr(part, "index_count", 0) or 0)
-            if count <= 0:
-                continue
-            if start < 0 or start + count > total_indices:
-                reporter = getattr(self, "report", None)
-                pname = (
-                    part.get("name")
-                    if isinstance(part, dict)
-                    else getattr(part, "name", None)
-                )
-                if reporter:
-                    reporter(
-                        {"WARNING"},
-                        f"Invalid drawIndexed range for part {pname}: {start},{count}",
-                    )
-                continue
-            first_tri = start // 3
-            last_tri = (start + count - 1) // 3
-            for i in range(first_tri, last_tri + 1):
-                selected_poly_indices.add(tris[i].polygon_index)
+        total_indices = total_ib_indices(mesh)
+
+        with timing.phase("remaining.range_union"):
+            # 범위 오류 파츠는 제외된 구간 인덱스(분리 시작 때 만든 것을 재사용)
+            starts, ends = parts_map.interval_index(total_indices).merged()
+            covered = polygon_mask_from_ranges(mesh, starts, ends - starts)
+            selected_poly_indices = set(np.flatnonzero(covered).tolist())
 
         if not selected_poly_indices:
             # 선택된 폴리곤이 없다면 복제 삭제 후 종료
@@ -290,8 +284,9 @@ def create_remaining_part(self, context, obj, parts_map, collection):
         bmesh.update_edit_mesh(mesh)
 
         # 선택된 면 분리 -> 선택된 오브젝트(부분)들을 삭제하고 남은 오브젝트를 남김
-        bpy.ops.mesh.separate(type="SELECTED")
-        bpy.ops.object.mode_set(mode="OBJECT")
+        with timing.phase("mesh.separate"):
+            bpy.ops.mesh.separate(type="SELECTED")
+            bpy.ops.object.mode_set(mode="OBJECT")
 
         separated = [o for o in context.selected_objects if o != dup_obj]
         # 분리된 오브젝트들 삭제(파츠로 이미 처리된 것들이므로 제거)
@@ -353,6 +348,7 @@ def create_remaining_part(self, context, obj, parts_map, collection):
                         i += 1
                     base_name = f"{base_name}_{i}"
                 remaining.name = base_name
+                remaining[PART_KEY_PROP] = REMAINING_KEY
 
                 scene_col = getattr(self, "_scene_collection", None)
                 if collection:
@@ -365,13 +361,14 @@ def create_remaining_part(self, context, obj, parts_map, collection):
 
     finally:
         # 데이터/머티리얼 정리
-        mesh_ref = bpy.data.meshes.get(mesh_name)
-        if mesh_ref and mesh_ref.users == 0:
-            bpy.data.meshes.remove(mesh_ref)
-        for mname in _mats_to_check:
-            m = bpy.data.materials.get(mname)
-            if m and m.users == 0:
-                bpy.data.materials.remove(m)
+        with timing.phase("cleanup"):
+            mesh_ref = bpy.data.meshes.get(mesh_name)
+            if mesh_ref and mesh_ref.users == 0:
+                bpy.data.meshes.remove(mesh_ref)
+            for mname in _mats_to_check:
+                m = bpy.data.materials.get(mname)
+                if m and m.users == 0:
+                    bpy.data.materials.remove(m)
 
         # 이전 선택/활성 상태 복원
         try:
@@ -0,0 +1,28 @@
+import json
+
+# 결과 컬렉션에 분리 당시 파츠 맵과 원본 메시를 기록하는 커스텀 프로퍼티
+SPLIT_RECORD_PROP = "inips_split"
+
+
+def split_record(collection):
+    """결과 컬렉션에 저장된 분리 기록(dict)을 반환합니다. 없거나 깨졌으면 None."""
+    raw = collection.get(SPLIT_RECORD_PROP) if collection else None
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def find_split_collection(context):
+    """활성 오브젝트가 속한(없으면 활성) 컬렉션 중 분리 기록이 있는 컬렉션을 찾습니다."""
+    obj = context.active_object
+    candidates = list(obj.users_collection) if obj else []
+    layer_col = context.view_layer.active_layer_collection
+    if layer_col:
+        candidates.append(layer_col.collection)
+    for col in candidates:
+        if SPLIT_RECORD_PROP in col:
+            return col
+    return None
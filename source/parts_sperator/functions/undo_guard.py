@@ -0,0 +1,27 @@
+"""
+분리 실행 중 전역 실행 취소(memfile undo) 기록을 잠시 끄는 도우미.
+
+파츠마다 복제/분리한 메시가 중간 실행 취소 단계에 쌓이지 않도록 실행 동안
+`use_global_undo`를 끄고, 끝나면 원래대로 돌립니다. 분리 전체는 오퍼레이터의
+UNDO 옵션이 종료 시점에 남기는 한 단계로 되돌릴 수 있습니다.
+전역 설정이므로 `suspend()` 뒤에는 종료/취소 경로에서 반드시 `restore()`를 호출해야 합니다.
+"""
+
+
+def suspend(context):
+    """전역 실행 취소를 끄고 복원용 상태를 반환합니다."""
+    prefs = context.preferences
+    state = (prefs.edit.use_global_undo, prefs.is_dirty)
+    prefs.edit.use_global_undo = False
+    return state
+
+
+def restore(context, state):
+    if state is None:
+        return
+    prefs = context.preferences
+    use_global_undo, was_dirty = state
+    prefs.edit.use_global_undo = use_global_undo
+    # 잠시 바꾼 값 때문에 설정 자동 저장 대상이 되지 않도록 이전 상태 유지
+    if not was_dirty:
+        prefs.is_dirty = False
@@ -1,15 +1,20 @@
 import bpy
 from bpy.types import Operator
 from bpy_extras.io_utils import ImportHelper
+import contextlib
 import os
-from ..utils.ini_parser import parse_ini_sections
+from ..utils import timing
+from ..core import preferences
 from .functions import (
-    defunctionalize,
+    checkpoint,
     create_resource_enum,
-    build_parts_map,
-    separate_parts,
+    parts_list,
+    split_record,
+    undo_guard,
 )
 
+# 파츠 맵/분리 파이프라인(NumPy 사용)은 애드온 시작 시간을 줄이기 위해 실행 시점에 임포트
+
 
 def _force_ui_redraw():
     """모든 윈도우/영역을 강제로 다시 그려 UI(패널)를 갱신합니다."""
@@ -20,6 +25,40 @@ def _force_ui_redraw():
                 region.tag_redraw()
 
 
+# 실행 기록 요약을 쓰는 텍스트 데이터블록 이름
+HISTORY_TEXT_NAME = "INIPS 실행 기록"
+
+
+def _start_profile(operator, context, label):
+    """애드온 설정에서 프로파일링이 켜져 있으면 측정을 시작해 세션을 반환합니다."""
+    session = preferences.profile_session(label, context)
+    if session is None:
+        return None
+    try:
+        return session.start()
+    except ValueError as e:
+        # 다른 프로파일러가 이미 동작 중인 경우 등
+        operator.report({"WARNING"}, f"프로파일링을 시작할 수 없습니다: {e}")
+        return None
+
+
+def _split_timing_wanted(context):
+    """분리 단계 측정이 필요한지: 측정 토글이 켜져 있거나 실행 기록을 남길 때(단계별 시간 비교용)."""
+    return context.scene.inips_timing_enabled or bool(preferences.history_path(context))
+
+
+def _stop_profile(operator, session):
+    if session is None:
+        return
+    try:
+        paths = session.stop()
+    except OSError as e:
+        operator.report({"WARNING"}, f"프로파일 저장 실패: {e}")
+        return
+    if paths:
+        operator.report({"INFO"}, f"프로파일 저장: {os.path.dirname(paths[0])}")
+
+
 class INIPS_OT_SelectIniFile(Operator, ImportHelper):
     bl_idname = "inips.select_ini_file_panel"
     bl_label = "INI 파일 선택"
@@ -31,6 +70,15 @@ class INIPS_OT_SelectIniFile(Operator, ImportHelper):
     )
 
     def execute(self, context):
+        profile = _start_profile(self, context, "load")
+        try:
+            return self._execute(context)
+        finally:
+            _stop_profile(self, profile)
+
+    def _execute(self, context):
+        from .functions import pipeline
+
         scene = context.scene
 
         path = getattr(self, "filepath", None)
@@ -39,18 +87,22 @@ class INIPS_OT_SelectIniFile(Operator, ImportHelper):
             return {"CANCELLED"}
         scene.inips_ini_path = path
 
-        text = None
-        with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
-        if text is None:
-            self.report({"ERROR"}, f"파일을 읽을 수 없습니다: {os.path.basename(path)}")
-            return {"CANCELLED"}
+        # 이 오퍼레이터가 시작한 타이머만 멈춤(진행 중인 모달 분리의 타이머는 건드리지 않음)
+        timer = None
+        if scene.inips_timing_enabled and timing.active() is None:
+            timer = timing.start("load")
 
-        # ini 파싱
-        sections = parse_ini_sections(text)
+        def phase(name):
+            return timer.phase(name) if timer is not None else contextlib.nullcontext()
 
-        # CommandList 함수화 해제
-        sections = defunctionalize.defunctionalize_sections(sections)
+        # ini 파싱 및 CommandList 함수화 해제
+        try:
+            sections = pipeline.load_ini_sections(path)
+        except (OSError, UnicodeDecodeError):
+            if timer is not None:
+                timing.stop()
+            self.report({"ERROR"}, f"파일을 읽을 수 없습니다: {os.path.basename(path)}")
+            return {"CANCELLED"}
 
         # INI 섹션 데이터를 Scene의 CollectionProperty에 저장
         ini_sections = scene.inips_ini_sections
@@ -63,7 +115,14 @@ class INIPS_OT_SelectIniFile(Operator, ImportHelper):
         self.report({"INFO"}, f"INI 파싱 완료: {len(sections)} 섹션")
 
         # IB 리소스 Enum 생성
-        create_resource_enum.create_resource_enum(self, scene, sections)
+        with phase("create_resource_enum"):
+            create_resource_enum.create_resource_enum(self, scene, sections)
+        with phase("parts_list"):
+            parts_list.refresh(scene)
+
+        if timer is not None:
+            timing.stop()
+            self.report({"INFO"}, "측정: " + ", ".join(timer.summary_lines(4)))
 
         # UI 강제 갱신
         _force_ui_redraw()
@@ -78,19 +137,25 @@ class INIPS_OT_SeparatePartsFromIniModal(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     _timer = None
-    _index = 0
-    _target_obj = None
-    _parts_map = []
-
-    _original_collections = []
-    _scene_collection = None
-    _new_collection = None
-
-    _success_count = 0
-    _skipped_count = 0
+    _session = None
+    _object_name = ""
+    _profile = None
+    _undo_state = None
+
+    resume: bpy.props.BoolProperty(
+        name="재개",
+        description="중단된 분리의 체크포인트에서 다음 파츠부터 이어서 분리합니다",
+        default=False,
+        options={"HIDDEN", "SKIP_SAVE"},
+    )
 
     def invoke(self, context, event):
+        from ..utils import build_parts_map
+        from .functions import pipeline
+
         scene = context.scene
+        if self.resume:
+            return self._invoke_resume(context)
 
         # 기본 검증 및 초기화
         ini_path = getattr(scene, "inips_ini_path", None)
@@ -104,7 +169,10 @@ class INIPS_OT_SeparatePartsFromIniModal(Operator):
         if not target_obj:
             self.report({"ERROR"}, "분리 대상 오브젝트를 선택하세요.")
             return {"CANCELLED"}
-        self._target_obj = target_obj
+
+        if _split_timing_wanted(context):
+            timing.start("split")
+        self._profile = _start_profile(self, context, "split")
 
         # INI 섹션 데이터 가져오기
         ini_sections = getattr(scene, "inips_ini_sections", None)
@@ -114,44 +182,58 @@ class INIPS_OT_SeparatePartsFromIniModal(Operator):
                 sections[item.section_name] = item.lines.splitlines()
 
         # 파츠 맵 생성
-        self._parts_map = build_parts_map.build_parts_map(sections, resource)
+        parts_map = build_parts_map.build_parts_map(sections, resource)
 
         # drawindexed(파츠)가 없으면 스킵
-        if not self._parts_map:
+        if not parts_map:
+            timing.stop()
+            if self._profile is not None:
+                self._profile.abort()
             self.report({"INFO"}, "파츠가 없습니다. 분리 작업을 건너뜁니다.")
             return {"CANCELLED"}
 
-        # 초기화
-        self._index = 0
-        self._success_count = 0
-        self._skipped_count = 0
-        self._remaining_created = False
+        if checkpoint.progress(scene) is not None:
+            self.report({"WARNING"}, "중단된 이전 분리의 체크포인트를 새 실행으로 덮어씁니다.")
 
         # 원본/컬렉션 정보 보관 및 새 컬렉션 생성
-        self._original_collections = list(target_obj.users_collection)
-        self._scene_collection = context.scene.collection
-
-        if self._scene_collection not in self._original_collections:
-            for col in self._original_collections:
-                col.objects.unlink(target_obj)
-            self._scene_collection.objects.link(target_obj)
-
-        # 새 컬렉션 생성 및 씬에 링크(여기에 분리된 파츠들을 모음)
-        base_name = target_obj.name
-        new_col_name = base_name
-        if bpy.data.collections.get(new_col_name):
-            i = 1
-            while bpy.data.collections.get(f"{new_col_name}_{i}"):
-                i += 1
-            new_col_name = f"{new_col_name}_{i}"
-        self._new_collection = bpy.data.collections.new(new_col_name)
-        # 원본 컬렉션이 있으면 그 밑에 링크, 없으면 씬에 링크
-        if self._original_collections:
-            for col in self._original_collections:
-                if self._new_collection.name not in [c.name for c in col.children]:
-                    col.children.link(self._new_collection)
-        else:
-            self._scene_collection.children.link(self._new_collection)
+        self._object_name = target_obj.name
+        self._session = pipeline.SplitSession(
+            context, target_obj, parts_map, reporter=self.report, resource=resource
+        )
+        return self._start(context)
+
+    def _invoke_resume(self, context):
+        scene = context.scene
+        state = checkpoint.load(scene)
+        if state is None:
+            self.report({"ERROR"}, "재개할 분리 체크포인트가 없습니다.")
+            return {"CANCELLED"}
+        try:
+            self._session = checkpoint.resume_session(context, state, reporter=self.report)
+        except ValueError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        if _split_timing_wanted(context):
+            timing.start("split")
+        self._profile = _start_profile(self, context, "split")
+        self._object_name = state["object"]
+        self.report({"INFO"}, f"분리 재개: {state['done']}/{len(state['queue'])}개 완료 지점부터")
+        return self._start(context, previous=state)
+
+    def _start(self, context, previous=None):
+        # 저메모리 모드: 실행 동안 중간 실행 취소 기록을 끄고 종료 시 한 단계로 남김
+        if context.scene.inips_low_memory:
+            self._undo_state = undo_guard.suspend(context)
+        try:
+            self._session.begin()
+            # 중단 시 재개/되돌리기를 위한 체크포인트(이후 파츠마다 완료 수만 갱신)
+            checkpoint.save(context.scene, self._session, previous)
+        except Exception as e:
+            # 전역 실행 취소/측정/프로파일러가 켜진 채로 남지 않도록 정리
+            self._stop_run(context)
+            self.report({"ERROR"}, f"파츠 분리를 시작할 수 없습니다: {e}")
+            return {"CANCELLED"}
 
         # 타이머 설정 및 모달 시작
         wm = context.window_manager
@@ -161,133 +243,461 @@ class INIPS_OT_SeparatePartsFromIniModal(Operator):
 
     def modal(self, context, event):
         if event.type == "TIMER":
-            if self._index >= len(self._parts_map):
-                # 잔여 파츠 생성 및 컬렉션 정리
-                before_count = (
-                    len(self._new_collection.objects) if self._new_collection else 0
-                )
-                created_from_remaining = separate_parts.create_remaining_part(
-                    self,
-                    context,
-                    getattr(self, "_target_obj", None),
-                    self._parts_map,
-                    self._new_collection,
-                )
-                # create_remaining_part는 int 반환(생성된 오브젝트 수)입니다.
-                after_count = 0
-                if isinstance(created_from_remaining, int):
-                    created = created_from_remaining
-                else:
-                    after_count = (
-                        len(self._new_collection.objects) if self._new_collection else 0
-                    )
-                    created = max(0, after_count - before_count)
-
-                if created:
-                    self._success_count += created
-                self._remaining_created = bool(created)
-
-                # 원본 오브젝트 삭제
-                orig = getattr(self, "_target_obj", None)
-                if orig:
-                    orig_name = orig.name
-                    mesh_name = None
-                    mats_to_check = []
-
-                    if getattr(orig, "data", None):
-                        mesh_name = orig.data.name
-                        mats_to_check = [
-                            m.name for m in orig.data.materials if m is not None
-                        ]
-
-                    # 선택 해제 후 대상 활성화 -> 삭제 시도
-                    try:
-                        bpy.ops.object.select_all(action="DESELECT")
-                    except Exception:
-                        for o in context.view_layer.objects:
-                            o.select_set(False)
-
-                    obj_to_del = bpy.data.objects.get(orig_name)
-                    if obj_to_del:
-                        obj_to_del.select_set(True)
-                        context.view_layer.objects.active = obj_to_del
-                        try:
-                            bpy.ops.object.delete()
-                        except Exception:
-                            bpy.data.objects.remove(obj_to_del, do_unlink=True)
-
-                    # 메쉬/머티리얼 정리(다른 곳에서 사용중이지 않을 때만 제거)
-                    if mesh_name:
-                        mesh = bpy.data.meshes.get(mesh_name)
-                        if mesh and mesh.users == 0:
-                            bpy.data.meshes.remove(mesh)
-                    for mname in mats_to_check:
-                        m = bpy.data.materials.get(mname)
-                        if m and m.users == 0:
-                            bpy.data.materials.remove(m)
-
-                    # 참조 해제
-                    self._target_obj = None
-
-                # 타이머 제거 및 종료
-                if getattr(self, "_timer", None):
-                    context.window_manager.event_timer_remove(self._timer)
-                    self._timer = None
-                self._finish(context)
-                return {"FINISHED"}
-
-            # 파츠 당 분리 로직 실행
-            before_count = (
-                len(self._new_collection.objects) if self._new_collection else 0
-            )
-            separate_parts.separate_parts(
-                self,
-                context,
-                getattr(self, "_target_obj", None),
-                self._parts_map[self._index],
-                self._new_collection,
-            )
-            after_count = (
-                len(self._new_collection.objects) if self._new_collection else 0
-            )
-            created = max(0, after_count - before_count)
-            if created:
-                self._success_count += created
-            else:
-                self._skipped_count += 1
-            self._index += 1
-            return {"PASS_THROUGH"}
+            try:
+                return self._tick(context)
+            except Exception as e:
+                # 전역 실행 취소가 꺼진 채로 남거나 타이머가 새지 않도록 정리 후 중단
+                self._stop_run(context)
+                _force_ui_redraw()
+                message = f"파츠 분리 실패: {e}"
+                if checkpoint.progress(context.scene) is not None:
+                    message += " (패널에서 재개하거나 되돌릴 수 있습니다)"
+                self.report({"ERROR"}, message)
+                return {"CANCELLED"}
 
         # ESC 키로 모달 취소
         if event.type in {"ESC"}:
-            if getattr(self, "_timer", None):
-                context.window_manager.event_timer_remove(self._timer)
-                self._timer = None
-            self.report({"INFO"}, "파츠 분리 취소됨")
+            # 오래 걸려 취소한 경우가 분석 대상이므로 프로파일은 저장
+            self._stop_run(context)
+            # 체크포인트는 남겨 두어 재개/되돌리기 가능
+            progress = checkpoint.progress(context.scene)
+            done, total = (progress[1], progress[2]) if progress else (0, 0)
+            _force_ui_redraw()
+            self.report(
+                {"INFO"},
+                f"파츠 분리 중단됨 ({done}/{total}): 패널에서 재개하거나 되돌릴 수 있습니다",
+            )
             return {"CANCELLED"}
 
         return {"RUNNING_MODAL"}
 
+    def _tick(self, context):
+        session = self._session
+        if session.done:
+            # 잔여 파츠 생성 및 원본 오브젝트 삭제
+            session.finish(keep_source=context.scene.inips_keep_source)
+
+            # 타이머 제거 및 종료
+            self._remove_timer(context)
+            self._finish(context)
+            return {"FINISHED"}
+
+        # 파츠 당 분리 로직 실행
+        session.step()
+        checkpoint.update(context.scene, session)
+        return {"PASS_THROUGH"}
+
     def cancel(self, context):
+        self._stop_run(context)
+
+    def _remove_timer(self, context):
         if getattr(self, "_timer", None):
             context.window_manager.event_timer_remove(self._timer)
             self._timer = None
 
+    def _stop_run(self, context):
+        """타이머/측정/작업 스레드를 멈추고 실행 취소 설정을 되돌립니다(체크포인트는 유지)."""
+        self._remove_timer(context)
+        timing.stop()
+        if self._session is not None:
+            self._session.close()
+        self._restore_undo(context)
+        _stop_profile(self, self._profile)
+        self._profile = None
+
+    def _restore_undo(self, context):
+        undo_guard.restore(context, self._undo_state)
+        self._undo_state = None
+
     def _finish(self, context):
         # 간단한 정리 및 UI 갱신
+        timer = timing.stop()
+        self._restore_undo(context)
+        checkpoint.clear(context.scene)
+        _stop_profile(self, self._profile)
+        self._profile = None
         _force_ui_redraw()
-        attempts = self._index + (
-            1 if getattr(self, "_remaining_created", False) else 0
+        summary = self._session.summary()
+        self.report(
+            {"INFO"},
+            f"파츠 분리 완료: 시도 {summary['attempts']}개, 생성 {summary['created']}개, 건너뜀 {summary['skipped']}개",
         )
+        if self._session.memory is not None:
+            self.report({"INFO"}, self._session.memory.summary_line())
+        if summary["shared"]:
+            self.report({"INFO"}, f"메시 공유: {summary['shared']}개 파츠가 기존 메시를 재사용")
+        if timer and context.scene.inips_timing_enabled:
+            self.report({"INFO"}, "측정: " + ", ".join(timer.summary_lines(4)))
+            slowest = ", ".join(f"{n} {ms:.0f}ms" for n, ms in timer.slowest_parts())
+            if slowest:
+                self.report({"INFO"}, f"느린 파츠: {slowest}")
+
+        history_path = preferences.history_path(context)
+        if history_path:
+            from .functions import pipeline
+
+            scene = context.scene
+            summary["object"] = self._object_name
+            summary["resource"] = self._session.resource
+            try:
+                pipeline.record_run(
+                    history_path,
+                    summary,
+                    bpy.path.abspath(scene.inips_ini_path),
+                    "modal",
+                    timer,
+                )
+            except OSError as e:
+                self.report({"WARNING"}, f"실행 기록 저장 실패: {e}")
+
+
+class INIPS_OT_RollbackSplit(Operator):
+    bl_idname = "inips.rollback_split"
+    bl_label = "분리 되돌리기"
+    bl_description = "중단된 분리에서 만든 파츠를 지우고 원본 오브젝트를 처음 컬렉션으로 되돌립니다"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "OBJECT" and checkpoint.progress(context.scene) is not None
+
+    def execute(self, context):
+        state = checkpoint.load(context.scene)
+        if state is None:
+            checkpoint.clear(context.scene)
+            self.report({"ERROR"}, "체크포인트를 읽을 수 없습니다.")
+            return {"CANCELLED"}
+        removed = checkpoint.rollback(context, state)
+        _force_ui_redraw()
+        self.report({"INFO"}, f"분리 되돌리기 완료: 파츠 {removed}개 삭제, 원본 링크 복원")
+        return {"FINISHED"}
+
+
+def _part_item(operator, context):
+    """operator.index(음수면 목록의 활성 항목)에 해당하는 파츠 항목을 반환하고 활성 항목으로 만듭니다."""
+    scene = context.scene
+    items = scene.inips_parts
+    index = operator.index if operator.index >= 0 else scene.inips_parts_index
+    if not 0 <= index < len(items):
+        return None
+    scene.inips_parts_index = index
+    return items[index]
+
+
+class _PartActionMixin:
+    bl_options = {"REGISTER", "UNDO"}
+
+    index: bpy.props.IntProperty(default=-1, options={"HIDDEN", "SKIP_SAVE"})
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == "MESH" and bool(context.scene.inips_parts)
+
+
+class _PartSelectMixin(_PartActionMixin):
+    # 범위 선택은 폴리곤 배열에 한 번에 쓰는 빠른 경로(selector.apply_polygon_selection) 사용
+    isolate = False
+
+    def execute(self, context):
+        from ..utils import selector
+
+        item = _part_item(self, context)
+        if item is None:
+            self.report({"ERROR"}, "파츠를 선택하세요.")
+            return {"CANCELLED"}
+        obj = context.active_object
+        if obj.mode == "EDIT":
+            # 편집 모드의 변경을 메시 배열에 반영한 뒤 범위 계산
+            obj.update_from_editmode()
+        try:
+            mask = selector.polygon_mask_from_ranges(
+                obj.data, [item.start_index], [item.index_count]
+            )
+        except ValueError as e:
+            self.report({"ERROR"}, f"{item.name}: {e}")
+            return {"CANCELLED"}
+        select_count = selector.apply_polygon_selection(obj, mask, isolate=self.isolate)
+        if select_count == 0:
+            self.report({"WARNING"}, f"{item.name}: 선택된 face가 없습니다.")
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"{item.name}: {select_count}개 face 선택")
+        return {"FINISHED"}
+
+
+class INIPS_OT_PartSelect(_PartSelectMixin, Operator):
+    bl_idname = "inips.part_select"
+    bl_label = "파츠 선택"
+    bl_description = "활성 오브젝트에서 이 파츠의 face를 선택합니다"
+
+
+class INIPS_OT_PartIsolate(_PartSelectMixin, Operator):
+    bl_idname = "inips.part_isolate"
+    bl_label = "파츠만 보기"
+    bl_description = "이 파츠의 face만 남기고 나머지를 숨깁니다(편집 모드에서 Alt+H로 다시 표시)"
+
+    isolate = True
+
+
+class INIPS_OT_PartSplit(_PartActionMixin, Operator):
+    bl_idname = "inips.part_split"
+    bl_label = "파츠 하나 분리"
+    bl_description = "원본은 그대로 두고 이 파츠만 새 오브젝트로 분리합니다"
+
+    def execute(self, context):
+        from .functions import separate_parts
+        from .functions.mesh_registry import PartMeshRegistry
+
+        item = _part_item(self, context)
+        if item is None:
+            self.report({"ERROR"}, "파츠를 선택하세요.")
+            return {"CANCELLED"}
+        obj = context.active_object
+        if obj.mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+        registry = (
+            PartMeshRegistry(obj.data) if context.scene.inips_share_part_meshes else None
+        )
+        shared = registry.lookup(item.start_index, item.index_count) if registry else None
+        if shared is not None:
+            created = [registry.instance(context, shared, item.name, obj, None)]
+        else:
+            created = separate_parts.separate_parts(
+                self,
+                context,
+                obj,
+                item.name,
+                item.start_index,
+                item.index_count,
+                None,
+            )
+            if registry:
+                registry.add(item.start_index, item.index_count, created)
+        if not created:
+            self.report({"WARNING"}, f"{item.name}: 분리된 오브젝트가 없습니다.")
+            return {"CANCELLED"}
+        for o in created:
+            o[separate_parts.PART_KEY_PROP] = item.key
+        self.report({"INFO"}, f"{item.name}: {len(created)}개 오브젝트 분리")
+        return {"FINISHED"}
+
+
+class INIPS_OT_ResplitChangedParts(Operator):
+    bl_idname = "inips.resplit_changed_parts"
+    bl_label = "변경된 파츠만 재분리"
+    bl_description = "이전 분리 결과와 현재 INI의 파츠 맵을 비교해 추가/변경된 파츠만 다시 분리합니다"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return (
+            context.mode == "OBJECT"
+            and bool(context.scene.inips_ini_sections)
+            and split_record.find_split_collection(context) is not None
+        )
+
+    def execute(self, context):
+        from .functions import pipeline
+
+        scene = context.scene
+        collection = split_record.find_split_collection(context)
+
+        sections = {}
+        for item in scene.inips_ini_sections:
+            sections[item.section_name] = item.lines.splitlines()
+
+        # 기록된 리소스를 우선 사용(다른 IB를 선택해 둔 경우에도 같은 메시 기준으로 비교)
+        try:
+            summary = pipeline.resplit_collection(
+                context, collection, sections, reporter=self.report
+            )
+        except ValueError as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+
+        _force_ui_redraw()
+        if not summary["rebuilt"] and not summary["removed"] and not summary["created"]:
+            self.report({"INFO"}, f"변경된 파츠가 없습니다 ({summary['unchanged']}개 유지).")
+            return {"FINISHED"}
         self.report(
             {"INFO"},
-            f"파츠 분리 완료: 시도 {attempts}개, 생성 {self._success_count}개, 건너뜀 {self._skipped_count}개",
+            f"재분리 완료: 유지 {summary['unchanged']}개, 다시 만듦 {summary['rebuilt']}개, "
+            f"삭제 {summary['removed']}개, 생성 {summary['created']}개",
+        )
+        return {"FINISHED"}
+
+
+class INIPS_OT_SortFacesByIbOrder(Operator):
+    bl_idname = "inips.sort_faces_by_ib_order"
+    bl_label = "IB 순서로 면 정렬"
+    bl_description = "선택한 메시들의 면을 임포트/첫 분리 때 기록한 원래 IB 순서로 다시 정렬합니다(원래 순서대로 내보내기용)"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == "OBJECT" and any(
+            o.type == "MESH" for o in context.selected_objects
         )
 
+    def execute(self, context):
+        import bmesh
+        import numpy as np
+        from ..utils.ib_order import has_ib_order, read_ib_order
+
+        sorted_count = 0
+        missing = []
+        meshes = {o.data for o in context.selected_objects if o.type == "MESH"}
+        for mesh in meshes:
+            if not has_ib_order(mesh):
+                missing.append(mesh.name)
+                continue
+            # 원래 IB 위치가 없는 면(나중에 추가된 면)은 기존 순서대로 맨 뒤로
+            ib_order = read_ib_order(mesh)
+            ib_order[ib_order < 0] = np.iinfo(np.int64).max
+            if (np.diff(ib_order) >= 0).all():
+                continue
+            # 현재 면 인덱스 -> IB 순서상 위치
+            rank = np.empty_like(ib_order)
+            rank[np.argsort(ib_order, kind="stable")] = np.arange(ib_order.size)
+            rank = rank.tolist()
+
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(mesh)
+                bm.faces.ensure_lookup_table()
+                bm.faces.sort(key=lambda f: rank[f.index])
+                bm.faces.index_update()
+                bm.to_mesh(mesh)
+            finally:
+                bm.free()
+            mesh.update()
+            sorted_count += 1
+
+        if missing:
+            self.report(
+                {"WARNING"},
+                f"IB 순서 속성이 없는 메시 {len(missing)}개는 건너뜀: {', '.join(missing[:3])}",
+            )
+        self.report({"INFO"}, f"IB 순서로 정렬한 메시 {sorted_count}개")
+        return {"FINISHED"}
+
+
+class INIPS_OT_ExportPartBuffers(Operator):
+    bl_idname = "inips.export_part_buffers"
+    bl_label = "버퍼 직접 분리"
+    bl_description = "모델을 임포트하지 않고 INI가 가리키는 IB/VB 파일을 파츠별 버퍼로 나눠 저장합니다"
+
+    directory: bpy.props.StringProperty(
+        name="출력 폴더",
+        subtype="DIR_PATH",
+    )
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        scene = context.scene
+        ini_path = getattr(scene, "inips_ini_path", None)
+        resource = getattr(scene, "inips_resource", None)
+        if not ini_path or not resource:
+            self.report({"ERROR"}, "INI 파일과 Resource를 선택하세요.")
+            return {"CANCELLED"}
+        if not self.directory:
+            self.report({"ERROR"}, "출력 폴더를 선택하세요.")
+            return {"CANCELLED"}
+
+        # NumPy 경로는 처음 사용할 때 임포트
+        from ..utils import build_parts_map, buffer_splitter
+
+        sections = {}
+        for item in scene.inips_ini_sections:
+            sections[item.section_name] = item.lines.splitlines()
+
+        parts_map = build_parts_map.build_parts_map(sections, resource)
+        if not parts_map:
+            self.report({"INFO"}, "파츠가 없습니다. 분리 작업을 건너뜁니다.")
+            return {"CANCELLED"}
+
+        try:
+            manifest = buffer_splitter.split_buffers(
+                sections,
+                os.path.dirname(bpy.path.abspath(ini_path)),
+                resource,
+                parts_map,
+                self.directory,
+            )
+        except (KeyError, ValueError, OSError) as e:
+            self.report({"ERROR"}, f"버퍼 분리 실패: {e}")
+            return {"CANCELLED"}
+
+        for skipped in manifest["skipped"]:
+            self.report({"WARNING"}, f"{skipped['name']}: {skipped['reason']}")
+        self.report(
+            {"INFO"},
+            f"버퍼 분리 완료: {len(manifest['parts'])}개 파츠, 건너뜀 {len(manifest['skipped'])}개",
+        )
+        return {"FINISHED"}
+
+
+class INIPS_OT_RunHistoryReport(Operator):
+    bl_idname = "inips.run_history_report"
+    bl_label = "실행 기록 요약"
+    bl_description = "저장된 실행 기록을 에셋별로 요약하고 이전 실행보다 느려진 항목을 표시합니다"
+
+    def execute(self, context):
+        from ..utils import run_history
+
+        path = preferences.history_path(context)
+        if not path:
+            self.report({"ERROR"}, "실행 기록 저장이 꺼져 있습니다(애드온 설정).")
+            return {"CANCELLED"}
+        try:
+            records = run_history.load_records(path)
+        except OSError as e:
+            self.report({"ERROR"}, f"실행 기록을 읽을 수 없습니다: {e}")
+            return {"CANCELLED"}
+        if not records:
+            self.report({"INFO"}, "저장된 실행 기록이 없습니다.")
+            return {"CANCELLED"}
+
+        prefs = preferences.get_preferences(context)
+        threshold = (
+            prefs.history_regression_threshold
+            if prefs
+            else run_history.DEFAULT_REGRESSION_THRESHOLD
+        )
+        summary = run_history.summarize(records, threshold)
+        lines = run_history.format_report(summary, threshold)
+
+        text = bpy.data.texts.get(HISTORY_TEXT_NAME) or bpy.data.texts.new(
+            HISTORY_TEXT_NAME
+        )
+        text.clear()
+        text.write("\n".join(lines) + "\n")
+
+        regressions = sum(1 for item in summary if item["regression"])
+        level = {"WARNING"} if regressions else {"INFO"}
+        self.report(
+            level,
+            f"실행 기록 {len(records)}개, 에셋 {len(summary)}개, 회귀 {regressions}개 "
+            f"(텍스트 '{HISTORY_TEXT_NAME}' 참고)",
+        )
+        return {"FINISHED"}
+
 
 classes = (
     INIPS_OT_SelectIniFile,
     INIPS_OT_SeparatePartsFromIniModal,
+    INIPS_OT_RollbackSplit,
+    INIPS_OT_PartSelect,
+    INIPS_OT_PartIsolate,
+    INIPS_OT_PartSplit,
+    INIPS_OT_ResplitChangedParts,
+    INIPS_OT_SortFacesByIbOrder,
+    INIPS_OT_ExportPartBuffers,
+    INIPS_OT_RunHistoryReport,
 )
 
 
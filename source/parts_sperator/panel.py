@@ -1,5 +1,8 @@
 import bpy
-from bpy.types import Panel
+import fnmatch
+from bpy.types import Panel, UIList
+from ..utils import timing
+from .functions import checkpoint, parts_list
 
 
 class INIPS_PT_PartsSeperatorPanel(Panel):
@@ -21,6 +24,7 @@ class INIPS_PT_PartsSeperatorPanel(Panel):
         if ini_path:
             layout.label(text=f"INI: {ini_path.split('/')[-1]}")
             layout.prop(context.scene, "inips_resource")
+            layout.prop(context.scene, "inips_watch_ini")
 
         # 파츠 분리 버튼 활성화 조건
         obj = context.active_object
@@ -36,8 +40,122 @@ class INIPS_PT_PartsSeperatorPanel(Panel):
         row.enabled = enable_button
         row.operator("inips.separate_parts_from_ini_modal", text="파츠 분리")
 
+        # 중단된 분리(체크포인트)가 있으면 재개/되돌리기
+        progress = checkpoint.progress(context.scene)
+        if progress is not None:
+            name, done, total = progress
+            box = layout.box()
+            box.label(text=f"중단된 분리: {name} ({done}/{total})", icon="PAUSE")
+            row = box.row(align=True)
+            row.operator(
+                "inips.separate_parts_from_ini_modal", text="재개", icon="PLAY"
+            ).resume = True
+            row.operator("inips.rollback_split", text="되돌리기", icon="LOOP_BACK")
+        layout.prop(context.scene, "inips_keep_source")
+        layout.prop(context.scene, "inips_low_memory")
+        layout.prop(context.scene, "inips_share_part_meshes")
+        layout.operator("inips.resplit_changed_parts", text="변경된 파츠만 재분리")
+        layout.operator("inips.sort_faces_by_ib_order", text="IB 순서로 면 정렬")
 
-classes = (INIPS_PT_PartsSeperatorPanel,)
+        # IB/VB 버퍼 직접 분리 버튼 (오브젝트 선택 불필요)
+        row = layout.row()
+        row.enabled = bool(ini_path.strip()) and bool(resource.strip())
+        row.operator("inips.export_part_buffers", text="버퍼 직접 분리")
+
+        # 단계별 성능 측정 결과
+        layout.prop(context.scene, "inips_timing_enabled")
+        if context.scene.inips_timing_enabled:
+            for label, title in (("load", "INI 불러오기"), ("split", "파츠 분리")):
+                timer = timing.last_results.get(label)
+                if not timer:
+                    continue
+                box = layout.box()
+                box.label(text=title, icon="TIME")
+                col = box.column(align=True)
+                for line in timer.summary_lines():
+                    col.label(text=line)
+
+        # 실행 기록 요약(이전 실행 대비 회귀 확인)
+        layout.operator("inips.run_history_report", text="실행 기록 요약", icon="TEXT")
+
+
+class INIPS_UL_Parts(UIList):
+    """
+    파츠 목록. redraw마다 호출되는 filter_items는 미리 계산한 열(parts_list.columns)과
+    필터 문자열/정렬 옵션이 같으면 이전 결과를 그대로 돌려줍니다.
+    """
+
+    _filter_cache = {"key": None, "result": ([], [])}
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name)
+        sub = row.row(align=True)
+        sub.alignment = "RIGHT"
+        sub.label(text=f"{item.index_count}, {item.start_index}")
+        op = row.operator("inips.part_select", text="", icon="RESTRICT_SELECT_OFF", emboss=False)
+        op.index = index
+        op = row.operator("inips.part_isolate", text="", icon="HIDE_OFF", emboss=False)
+        op.index = index
+
+    def filter_items(self, context, data, propname):
+        cols = parts_list.columns(data)
+        pattern = self.filter_name.lower()
+        key = (cols["key"], pattern, self.use_filter_sort_alpha)
+        cache = INIPS_UL_Parts._filter_cache
+        if cache["key"] == key:
+            return cache["result"]
+
+        # 반전/역순 정렬은 Blender가 결과에 적용하므로 여기서는 다루지 않음
+        flags = []
+        if pattern:
+            bit = self.bitflag_filter_item
+            if any(c in pattern for c in "*?["):
+                pattern = f"*{pattern}*"
+                flags = [bit if fnmatch.fnmatchcase(n, pattern) else 0 for n in cols["lower"]]
+            else:
+                flags = [bit if pattern in n else 0 for n in cols["lower"]]
+        order = cols["alpha_rank"] if self.use_filter_sort_alpha else []
+
+        cache["key"] = key
+        cache["result"] = (flags, order)
+        return flags, order
+
+
+class INIPS_PT_PartsListPanel(Panel):
+    bl_label = "파츠 목록"
+    bl_idname = "INIPS_PT_parts_list_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "파츠 분리"
+    bl_parent_id = "INIPS_PT_parts_seperator_panel"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.inips_ini_path)
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        parts = scene.inips_parts
+
+        if not parts:
+            layout.label(text="선택된 IB에 파츠가 없습니다.")
+            return
+
+        layout.label(text=f"파츠 {len(parts)}개 (수, 시작)")
+        layout.template_list(
+            "INIPS_UL_Parts", "", scene, "inips_parts", scene, "inips_parts_index", rows=8
+        )
+
+        # 활성 파츠에 대한 동작
+        row = layout.row(align=True)
+        row.operator("inips.part_select", text="선택", icon="RESTRICT_SELECT_OFF")
+        row.operator("inips.part_isolate", text="이것만 보기", icon="HIDE_OFF")
+        row.operator("inips.part_split", text="분리", icon="MOD_EXPLODE")
+
+
+classes = (INIPS_PT_PartsSeperatorPanel, INIPS_UL_Parts, INIPS_PT_PartsListPanel)
 
 
 def register():
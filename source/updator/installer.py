@@ -0,0 +1,244 @@
+import hashlib
+import os
+import re
+import shutil
+import urllib.error
+import urllib.request
+import zipfile
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UpdateCancelled(Exception):
+    pass
+
+
+def find_zip_asset(release):
+    """
+    릴리스 JSON에서 첫 번째 .zip 에셋을 찾습니다.
+
+    Returns:
+        dict(name, url, sha256, checksum_url) 또는 None
+        sha256은 에셋의 `digest`("sha256:...")가 있을 때만 채워지고,
+        checksum_url은 `<zip>.sha256` 에셋이 함께 올라와 있을 때 채워집니다.
+    """
+    assets = release.get("assets", [])
+    for asset in assets:
+        name = asset.get("name", "")
+        if not name.endswith(".zip"):
+            continue
+        digest = asset.get("digest") or ""
+        sha256 = digest.split(":", 1)[1] if digest.startswith("sha256:") else None
+        checksum_url = None
+        for other in assets:
+            if other.get("name") == f"{name}.sha256":
+                checksum_url = other.get("browser_download_url")
+                break
+        return {
+            "name": name,
+            "url": asset.get("browser_download_url", ""),
+            "sha256": sha256,
+            "checksum_url": checksum_url,
+        }
+    return None
+
+
+def fetch_checksum(url, timeout=10):
+    """`sha256sum` 형식(해시 + 파일명) 체크섬 파일에서 해시만 읽어 반환합니다."""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        text = response.read().decode("utf-8", "replace").strip()
+    return text.split()[0].lower() if text else None
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h
+
+
+def _part_path(dest, resume_key):
+    if not resume_key:
+        return f"{dest}.part"
+    return f"{dest}.{re.sub(r'[^0-9A-Za-z_.-]+', '_', str(resume_key))}.part"
+
+
+def _remove_files(*paths):
+    for path in paths:
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def _remove_stale_parts(dest, part_path):
+    """같은 에셋 이름으로 받다 만 다른 릴리스의 `.part`(와 검증값 파일)를 지웁니다."""
+    folder = os.path.dirname(os.path.abspath(dest))
+    prefix = os.path.basename(dest) + "."
+    keep = {os.path.basename(part_path), os.path.basename(part_path) + ".validator"}
+    for name in os.listdir(folder):
+        if not name.startswith(prefix) or name in keep:
+            continue
+        if name.endswith(".part") or name.endswith(".part.validator"):
+            _remove_files(os.path.join(folder, name))
+
+
+def _response_validator(response):
+    """If-Range에 쓸 값: 강한 ETag, 없으면 Last-Modified(약한 ETag는 If-Range에 쓸 수 없음)."""
+    etag = response.headers.get("ETag") or ""
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified") or ""
+
+
+def _open(url, offset, validator, timeout):
+    request = urllib.request.Request(url)
+    if offset:
+        # 서버 파일이 바뀌었으면 If-Range가 맞지 않아 206 대신 전체(200)를 받음
+        request.add_header("Range", f"bytes={offset}-")
+        request.add_header("If-Range", validator)
+    return urllib.request.urlopen(request, timeout=timeout)
+
+
+def download(
+    url,
+    dest,
+    expected_sha256=None,
+    progress=None,
+    cancelled=None,
+    timeout=30,
+    resume_key=None,
+):
+    """
+    url을 CHUNK_SIZE 단위로 스트리밍해 dest에 저장합니다.
+
+    - 받는 중인 데이터는 `dest.<resume_key>.part`에 씁니다. resume_key(예: 릴리스 태그)가
+      다른 `.part`는 지우므로 다른 릴리스의 데이터를 이어 붙이지 않습니다.
+    - 처음 받을 때 응답의 ETag/Last-Modified를 `.part.validator`에 남기고, 이어받을 때
+      Range와 함께 If-Range로 보냅니다. 서버가 206을 주지 않으면 처음부터 다시 받고,
+      검증값이 없으면 이어받지 않습니다.
+    - 416(받아 둔 파일이 서버 파일보다 큼)이면 `.part`를 버리고 처음부터 받습니다.
+    - expected_sha256이 있으면 완료 후 검증하고, 다르면 `.part`를 지우고 ValueError.
+    - progress(received, total)는 청크마다 호출됩니다(total을 모르면 0).
+    - cancelled()가 True를 반환하면 UpdateCancelled를 올립니다(`.part`는 남겨 이어받기 가능).
+    """
+    part_path = _part_path(dest, resume_key)
+    validator_path = f"{part_path}.validator"
+    _remove_stale_parts(dest, part_path)
+
+    offset = 0
+    validator = ""
+    if os.path.isfile(part_path):
+        if os.path.isfile(validator_path):
+            with open(validator_path, "r", encoding="utf-8") as f:
+                validator = f.read().strip()
+        if validator:
+            offset = os.path.getsize(part_path)
+        else:
+            _remove_files(part_path)
+
+    try:
+        response = _open(url, offset, validator, timeout)
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not offset:
+            raise
+        _remove_files(part_path, validator_path)
+        offset = 0
+        response = _open(url, 0, "", timeout)
+
+    with response:
+        if offset and response.status != 206:
+            offset = 0
+        if not offset:
+            validator = _response_validator(response)
+            if validator:
+                with open(validator_path, "w", encoding="utf-8") as f:
+                    f.write(validator)
+            else:
+                _remove_files(validator_path)
+        h = _file_sha256(part_path) if offset else hashlib.sha256()
+        length = int(response.headers.get("Content-Length") or 0)
+        total = offset + length if length else 0
+        received = offset
+        with open(part_path, "ab" if offset else "wb") as f:
+            while True:
+                if cancelled and cancelled():
+                    raise UpdateCancelled()
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                h.update(chunk)
+                received += len(chunk)
+                if progress:
+                    progress(received, total)
+
+    digest = h.hexdigest()
+    if expected_sha256 and digest != expected_sha256.lower():
+        _remove_files(part_path, validator_path)
+        raise ValueError(f"SHA-256 불일치: {digest} != {expected_sha256}")
+    os.replace(part_path, dest)
+    _remove_files(validator_path)
+    return digest
+
+
+def _safe_extract(zip_path, extract_dir):
+    root = os.path.realpath(extract_dir)
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for member in zip_ref.namelist():
+            target = os.path.realpath(os.path.join(root, member))
+            if target != root and not target.startswith(root + os.sep):
+                raise ValueError(f"압축 파일에 잘못된 경로가 있습니다: {member}")
+        zip_ref.extractall(root)
+
+
+def _find_addon_source(extract_dir, addon_name):
+    # 압축 내부에서 한 단계 들어가서 addon_name 폴더 찾기
+    entries = os.listdir(extract_dir)
+    if not entries:
+        raise ValueError("압축을 풀었으나 내부에 항목이 없습니다.")
+
+    if len(entries) == 1 and os.path.isdir(os.path.join(extract_dir, entries[0])):
+        first_level = os.path.join(extract_dir, entries[0])
+        candidate = os.path.join(first_level, addon_name)
+        if os.path.isdir(candidate):
+            return candidate
+        if os.path.basename(first_level) == addon_name:
+            return first_level
+
+    for root, dirs, _files in os.walk(extract_dir):
+        if addon_name in dirs:
+            return os.path.join(root, addon_name)
+    raise ValueError(f"새 버전 애드온 폴더({addon_name})를 찾지 못했습니다.")
+
+
+def install(zip_path, addon_dir, addon_name):
+    """
+    새 버전을 addon_dir 옆의 스테이징 폴더에 풀어 둔 뒤 폴더 이름 바꾸기로 교체합니다.
+
+    교체는 (기존 -> 백업, 스테이징 -> addon_dir) 두 번의 rename으로 이루어지며,
+    두 번째 rename이 실패하면 백업을 되돌려 기존 설치를 그대로 유지합니다.
+    """
+    parent = os.path.dirname(os.path.abspath(addon_dir))
+    staging_root = os.path.join(parent, f".{addon_name}.staging")
+    backup_dir = os.path.join(parent, f".{addon_name}.backup")
+    shutil.rmtree(staging_root, ignore_errors=True)
+    shutil.rmtree(backup_dir, ignore_errors=True)
+    os.makedirs(staging_root)
+
+    try:
+        _safe_extract(zip_path, staging_root)
+        new_addon_src = _find_addon_source(staging_root, addon_name)
+
+        had_previous = os.path.exists(addon_dir)
+        if had_previous:
+            os.replace(addon_dir, backup_dir)
+        try:
+            os.replace(new_addon_src, addon_dir)
+        except OSError:
+            if had_previous:
+                os.replace(backup_dir, addon_dir)
+            raise
+    finally:
+        shutil.rmtree(staging_root, ignore_errors=True)
+
+    shutil.rmtree(backup_dir, ignore_errors=True)
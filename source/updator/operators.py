@@ -1,12 +1,9 @@
 import bpy
 from bpy.types import Operator
-import urllib.request
-import json
 import os
-import urllib.request
-import zipfile
-import shutil
-import tempfile
+
+# 네트워크/압축 관련 모듈(release_api, installer)은 애드온 시작 시간을 줄이기 위해
+# 실제로 업데이트를 확인/실행할 때 임포트합니다.
 
 
 def _redraw_ui_regions(context):
@@ -19,43 +16,208 @@ def _redraw_ui_regions(context):
                         region.tag_redraw()
 
 
+def _release_cache_path():
+    from ..core.paths import cache_dir
+
+    return os.path.join(cache_dir(), "release_latest.json")
+
+
+def _current_version():
+    from ... import bl_info
+
+    return ".".join(map(str, bl_info["version"]))
+
+
+# 백그라운드 업데이트 확인 상태 (워커 스레드 -> 타이머로 결과 전달)
+_check_state = {"thread": None, "result": None}
+
+
+def _check_worker(cache_path, force):
+    from . import release_api
+
+    try:
+        data, from_cache = release_api.fetch_latest_release(
+            cache_path=cache_path, force=force
+        )
+        _check_state["result"] = ("ok", data, from_cache)
+    except Exception as e:
+        _check_state["result"] = ("error", str(e), False)
+
+
+def _apply_check_result():
+    # bpy.app.timers 콜백: 워커가 끝났으면 결과를 씬에 반영하고 타이머 종료
+    thread = _check_state["thread"]
+    if thread is not None and thread.is_alive():
+        return 0.2
+
+    result = _check_state["result"]
+    _check_state["thread"] = None
+    _check_state["result"] = None
+
+    scene = bpy.context.scene
+    scene["inips.checking_update"] = False
+    if result is None:
+        return None
+
+    status, payload, from_cache = result
+    if status == "ok":
+        latest_version = payload.get("tag_name", "").lstrip("v")
+        current_version = _current_version()
+        scene["inips.latest_version"] = latest_version
+        scene["inips.current_version"] = current_version
+        scene["inips.show_restart"] = False
+        scene["inips.update_error"] = ""
+        scene["inips.update_available"] = bool(
+            latest_version and latest_version != current_version
+        )
+        source = "캐시" if from_cache else "서버"
+        print(f"INIPS: 업데이트 확인({source}) {current_version} → {latest_version}")
+    else:
+        scene["inips.update_available"] = False
+        scene["inips.update_error"] = f"업데이트 확인 실패: {payload}"
+        print(f"INIPS: 업데이트 확인 실패: {payload}")
+
+    _redraw_ui_regions(bpy.context)
+    return None
+
+
 # 업데이트 체크
 class INIPS_OT_CheckUpdate(Operator):
     bl_idname = "inips.check_update"
     bl_label = "업데이트 체크"
-    bl_description = "최신 버전이 있는지 확인합니다"
+    bl_description = "최신 버전이 있는지 확인합니다 (Shift: 캐시 무시)"
+
+    force: bpy.props.BoolProperty(
+        name="캐시 무시",
+        default=False,
+        options={"SKIP_SAVE"},
+    )
+
+    def invoke(self, context, event):
+        self.force = event.shift
+        return self.execute(context)
 
     def execute(self, context):
-        try:
-            url = (
-                "https://api.github.com/repos/DPN-dpn/ini_part_splitter/releases/latest"
-            )
-            with urllib.request.urlopen(url, timeout=5) as response:
-                data = json.loads(response.read().decode())
-                latest_version = data.get("tag_name", "").lstrip("v")
-                context.scene["inips.latest_version"] = latest_version
-                # 현재 버전 가져오기
-                from ... import bl_info
-
-                current_version = ".".join(map(str, bl_info["version"]))
-                context.scene["inips.current_version"] = current_version
-                context.scene["inips.show_restart"] = False
-                if latest_version and latest_version != current_version:
-                    context.scene["inips.update_available"] = True
-                    self.report(
-                        {"INFO"}, f"업데이트 가능: {current_version} → {latest_version}"
-                    )
-                else:
-                    context.scene["inips.update_available"] = False
-                    self.report({"INFO"}, "최신 버전입니다.")
-        except Exception as e:
-            context.scene["inips.update_available"] = False
-            self.report({"ERROR"}, f"업데이트 확인 실패: {e}")
+        import threading
+
+        thread = _check_state["thread"]
+        if thread is not None and thread.is_alive():
+            self.report({"INFO"}, "업데이트를 확인하는 중입니다.")
+            return {"CANCELLED"}
+
+        # 네트워크 요청은 워커 스레드에서, 결과 반영은 메인 스레드 타이머에서 처리
+        thread = threading.Thread(
+            target=_check_worker,
+            args=(_release_cache_path(), self.force),
+            daemon=True,
+        )
+        _check_state["thread"] = thread
+        _check_state["result"] = None
+        context.scene["inips.checking_update"] = True
+        thread.start()
+        if not bpy.app.timers.is_registered(_apply_check_result):
+            bpy.app.timers.register(_apply_check_result, first_interval=0.2)
 
         _redraw_ui_regions(context)
         return {"FINISHED"}
 
 
+def _addon_dir(addon_name):
+    # 애드온 폴더 찾기
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    cur = current_dir
+    while True:
+        if os.path.basename(cur).lower() == "addons":
+            return os.path.join(cur, addon_name)
+        parent = os.path.dirname(cur)
+        if parent == cur:
+            break
+        cur = parent
+    # 찾지 못하면 기존 동작(현재 애드온 폴더)으로 폴백
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# 백그라운드 업데이트 상태 (워커 스레드 -> 타이머로 진행률/결과 전달)
+_update_state = {
+    "thread": None,
+    "progress": 0.0,
+    "message": "",
+    "result": None,
+    "cancel": False,
+}
+
+
+def _update_worker(cache_path, download_dir):
+    from . import installer, release_api
+
+    def on_progress(received, total):
+        _update_state["progress"] = received / total if total else 0.0
+        _update_state["message"] = f"다운로드 중 {received // 1024} KB"
+
+    try:
+        # 업데이트 체크 때 받아 둔 릴리스 정보를 재사용
+        release = release_api.cached_release(cache_path)
+        if release is None:
+            release, _ = release_api.fetch_latest_release(cache_path=cache_path)
+
+        asset = installer.find_zip_asset(release)
+        if not asset or not asset["url"]:
+            raise ValueError("릴리스 zip 파일을 찾을 수 없습니다.")
+        sha256 = asset["sha256"]
+        if not sha256 and asset["checksum_url"]:
+            sha256 = installer.fetch_checksum(asset["checksum_url"])
+        if not sha256:
+            # 검증할 수 없는 파일로 애드온 폴더를 교체하지 않음
+            raise ValueError("릴리스에 SHA-256 정보가 없어 설치하지 않습니다.")
+
+        zip_path = os.path.join(download_dir, asset["name"])
+        installer.download(
+            asset["url"],
+            zip_path,
+            expected_sha256=sha256,
+            progress=on_progress,
+            cancelled=lambda: _update_state["cancel"],
+            resume_key=release.get("tag_name"),
+        )
+
+        _update_state["message"] = "설치 중"
+        addon_name = os.path.splitext(asset["name"])[0]
+        installer.install(zip_path, _addon_dir(addon_name), addon_name)
+        os.remove(zip_path)
+        _update_state["result"] = ("ok", None)
+    except Exception as e:
+        _update_state["result"] = ("error", str(e))
+
+
+def _apply_update_progress():
+    # bpy.app.timers 콜백: 진행률을 씬에 반영하고, 워커가 끝나면 결과 처리 후 종료
+    scene = bpy.context.scene
+    thread = _update_state["thread"]
+    if thread is not None and thread.is_alive():
+        scene["inips.update_progress"] = _update_state["progress"]
+        scene["inips.update_message"] = _update_state["message"]
+        _redraw_ui_regions(bpy.context)
+        return 0.2
+
+    result = _update_state["result"]
+    _update_state["thread"] = None
+    _update_state["result"] = None
+    scene["inips.updating"] = False
+    scene["inips.update_message"] = ""
+
+    if result and result[0] == "ok":
+        print("INIPS: 블렌더를 재시작해, 애드온을 새로고침해 주세요.")
+        scene["inips.show_restart"] = True
+    else:
+        error = result[1] if result else "취소됨"
+        print(f"INIPS: 업데이트 실패: {error}")
+        scene["inips.update_error"] = f"업데이트 실패: {error}"
+        scene["inips.show_restart"] = False
+
+    _redraw_ui_regions(bpy.context)
+    return None
+
+
 # 업데이트 실행
 class INIPS_OT_DoUpdate(Operator):
     bl_idname = "inips.do_update"
@@ -63,120 +225,35 @@ class INIPS_OT_DoUpdate(Operator):
     bl_description = "애드온을 최신 버전으로 업데이트합니다"
 
     def execute(self, context):
-        temp_dir = None
-        try:
-            url = "https://api.github.com/repos/DPN-dpn/ini_part_splitter/releases/latest"
-            with urllib.request.urlopen(url, timeout=5) as response:
-                data = json.loads(response.read().decode())
-                assets = data.get("assets", [])
-                zip_url = ""
-                zip_name = ""
-                for asset in assets:
-                    name = asset.get("name", "")
-                    if name.endswith(".zip"):
-                        zip_name = name
-                        zip_url = asset.get("browser_download_url", "")
-                        break
-                if not zip_url:
-                    self.report({"ERROR"}, "릴리스 zip 파일을 찾을 수 없습니다.")
-                    return {"CANCELLED"}
-
-            addon_name = os.path.splitext(zip_name)[0]
-            
-            # 애드온 폴더 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            addons_root = None
-            cur = current_dir
-            while True:
-                if os.path.basename(cur).lower() == "addons":
-                    addons_root = cur
-                    break
-                parent = os.path.dirname(cur)
-                if parent == cur:
-                    break
-                cur = parent
-
-            if addons_root:
-                addon_dir = os.path.join(addons_root, addon_name)
-            else:
-                # 찾지 못하면 기존 동작(현재 애드온 폴더)으로 폴백
-                addon_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-            temp_dir = tempfile.mkdtemp(prefix="dpn_update_")
-            zip_path = os.path.join(temp_dir, zip_name or "update.zip")
-            urllib.request.urlretrieve(zip_url, zip_path)
-
-            extract_dir = os.path.join(temp_dir, "extracted")
-            os.makedirs(extract_dir, exist_ok=True)
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
-
-            # 압축 내부에서 한 단계 들어가서 addon_name 폴더 찾기
-            entries = os.listdir(extract_dir)
-            if not entries:
-                raise Exception("압축을 풀었으나 내부에 항목이 없습니다.")
-
-            new_addon_src = None
-            if len(entries) == 1 and os.path.isdir(os.path.join(extract_dir, entries[0])):
-                first_level = os.path.join(extract_dir, entries[0])
-                candidate = os.path.join(first_level, addon_name)
-                if os.path.isdir(candidate):
-                    new_addon_src = candidate
-                elif os.path.basename(first_level) == addon_name:
-                    new_addon_src = first_level
-
-            if not new_addon_src:
-                for root, dirs, _files in os.walk(extract_dir):
-                    if addon_name in dirs:
-                        new_addon_src = os.path.join(root, addon_name)
-                        break
-
-            if not new_addon_src:
-                self.report({"ERROR"}, f"새 버전 애드온 폴더({addon_name})를 찾지 못했습니다.")
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                return {"CANCELLED"}
-
-            # 기존 애드온 폴더 내부를 삭제
-            if os.path.exists(addon_dir):
-                for name in os.listdir(addon_dir):
-                    target = os.path.join(addon_dir, name)
-                    try:
-                        if os.path.isfile(target) or os.path.islink(target):
-                            os.remove(target)
-                        elif os.path.isdir(target):
-                            shutil.rmtree(target)
-                    except Exception as e:
-                        self.report({"ERROR"}, f"{target} 삭제 실패: {e}")
-                        shutil.rmtree(temp_dir, ignore_errors=True)
-                        return {"CANCELLED"}
-
-            # 새 버전의 내부 항목들을 애드온 폴더로 이동
-            for name in os.listdir(new_addon_src):
-                src = os.path.join(new_addon_src, name)
-                dst = os.path.join(addon_dir, name)
-                try:
-                    shutil.move(src, dst)
-                except Exception as e:
-                    self.report({"ERROR"}, f"{src} 이동 실패: {e}")
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                    return {"CANCELLED"}
-
-            if os.path.exists(zip_path):
-                os.remove(zip_path)
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
-            self.report({"WARNING"}, "블렌더를 재시작해, 애드온을 새로고침해 주세요.")
-            context.scene["inips.show_restart"] = True
-            _redraw_ui_regions(context)
-            return {"FINISHED"}
-
-        except Exception as e:
-            if temp_dir:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            self.report({"ERROR"}, f"업데이트 실패: {e}")
-            context.scene["inips.show_restart"] = False
+        import threading
+        from ..core.paths import cache_dir
+
+        thread = _update_state["thread"]
+        if thread is not None and thread.is_alive():
+            self.report({"INFO"}, "업데이트를 진행하는 중입니다.")
             return {"CANCELLED"}
 
+        # 받다 만 파일은 같은 폴더에 남겨 다음 시도에서 이어받음
+        download_dir = os.path.join(cache_dir(), "updates")
+        os.makedirs(download_dir, exist_ok=True)
+
+        thread = threading.Thread(
+            target=_update_worker,
+            args=(_release_cache_path(), download_dir),
+            daemon=True,
+        )
+        _update_state.update(
+            thread=thread, progress=0.0, message="", result=None, cancel=False
+        )
+        context.scene["inips.updating"] = True
+        context.scene["inips.update_error"] = ""
+        thread.start()
+        if not bpy.app.timers.is_registered(_apply_update_progress):
+            bpy.app.timers.register(_apply_update_progress, first_interval=0.2)
+
+        self.report({"INFO"}, "업데이트를 시작합니다.")
+        return {"FINISHED"}
+
 
 # GitHub 이동
 class INIPS_OT_OpenGithub(Operator):
@@ -205,5 +282,10 @@ def register():
 
 
 def unregister():
+    _update_state["cancel"] = True
+    if bpy.app.timers.is_registered(_apply_update_progress):
+        bpy.app.timers.unregister(_apply_update_progress)
+    if bpy.app.timers.is_registered(_apply_check_result):
+        bpy.app.timers.unregister(_apply_check_result)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
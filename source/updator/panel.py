@@ -17,24 +17,37 @@ class INIPS_PT_Updater(Panel):
         current_version = scene.get("inips.current_version", "")
         update_available = scene.get("inips.update_available", False)
         show_restart = scene.get("inips.show_restart", False)
+        checking = scene.get("inips.checking_update", False)
+        updating = scene.get("inips.updating", False)
+        update_error = scene.get("inips.update_error", "")
 
         # 버튼 라벨 조건 분기
-        if not latest_version:
+        if checking:
+            update_label = "업데이트 확인 중..."
+        elif not latest_version:
             update_label = "업데이트 체크 필요"
         elif not update_available:
             update_label = "현재 최신 버전입니다"
         else:
             update_label = f"업데이트: {current_version} → {latest_version}"
 
-        layout.operator("inips.check_update", text="업데이트 체크", icon="FILE_REFRESH")
+        row = layout.row()
+        row.enabled = not checking
+        row.operator("inips.check_update", text="업데이트 체크", icon="FILE_REFRESH")
         row = layout.row()
         if show_restart:
             row.operator(
                 "wm.quit_blender", text="블렌더 종료(애드온 재실행)", icon="CANCEL"
             )
+        elif updating:
+            progress = scene.get("inips.update_progress", 0.0)
+            message = scene.get("inips.update_message", "")
+            row.label(text=f"{message} ({progress * 100:.0f}%)", icon="IMPORT")
         else:
             row.enabled = bool(update_available)
             row.operator("inips.do_update", text=update_label, icon="IMPORT")
+        if update_error:
+            layout.label(text=update_error, icon="ERROR")
         layout.operator("inips.open_github", text="GitHub", icon="URL")
 
 
@@ -0,0 +1,84 @@
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+
+DEFAULT_API_URL = "https://api.github.com/repos/DPN-dpn/ini_part_splitter/releases/latest"
+
+# 릴리스 API 주소를 바꿀 때 쓰는 환경 변수 (로컬 테스트 서버 등)
+API_URL_ENV = "INIPS_UPDATE_API_URL"
+
+# 캐시된 응답을 재요청 없이 그대로 쓰는 시간(초)
+DEFAULT_TTL = 15 * 60
+
+
+def api_url():
+    return os.environ.get(API_URL_ENV, "").strip() or DEFAULT_API_URL
+
+
+def _read_cache(cache_path):
+    if not cache_path or not os.path.isfile(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_path, entry):
+    if not cache_path:
+        return
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, cache_path)
+
+
+def fetch_latest_release(url=None, cache_path=None, ttl=DEFAULT_TTL, timeout=5, force=False):
+    """
+    최신 릴리스 JSON을 가져옵니다.
+
+    - 같은 URL의 캐시가 ttl초 이내면 네트워크 요청 없이 캐시를 반환합니다(force면 무시).
+    - 캐시에 ETag가 있으면 If-None-Match로 조건부 요청하고, 304면 캐시 데이터를 재사용합니다.
+
+    Returns:
+        (release_dict, from_cache)
+    Raises:
+        urllib.error.URLError, OSError, ValueError: 요청/파싱 실패 시
+    """
+    url = url or api_url()
+    cached = _read_cache(cache_path)
+    if cached and cached.get("url") != url:
+        cached = None
+
+    now = time.time()
+    if cached and not force and now - cached.get("fetched_at", 0) < ttl:
+        return cached["data"], True
+
+    request = urllib.request.Request(url, headers={"Accept": "application/vnd.github+json"})
+    if cached and cached.get("etag"):
+        request.add_header("If-None-Match", cached["etag"])
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            data = json.loads(response.read().decode())
+            etag = response.headers.get("ETag", "")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            cached["fetched_at"] = now
+            _write_cache(cache_path, cached)
+            return cached["data"], True
+        raise
+
+    _write_cache(cache_path, {"url": url, "etag": etag, "fetched_at": now, "data": data})
+    return data, False
+
+
+def cached_release(cache_path, url=None):
+    """TTL과 관계없이 마지막으로 받아 둔 릴리스 JSON을 반환합니다(없으면 None)."""
+    cached = _read_cache(cache_path)
+    if cached and cached.get("url") == (url or api_url()):
+        return cached["data"]
+    return None
@@ -0,0 +1,8 @@
+"""
+Blender 없이 쓸 수 있는 INI 처리/버퍼/측정 도구 모음.
+
+`selector`를 제외한 모듈은 bpy를 임포트하지 않으므로 일반 CPython에서 바로 임포트하거나
+애드온 폴더에서 CLI로 실행할 수 있습니다.
+
+    python -m source.utils inspect mod.ini --resource ResourceBodyIB --json
+"""
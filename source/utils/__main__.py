@@ -0,0 +1,51 @@
+"""
+bpy 없이 INI를 점검하는 CLI. 애드온 폴더에서 실행합니다.
+
+    python -m source.utils inspect mod.ini [more.ini ...] [--resource ResourceBodyIB] [--json]
+
+--json이면 INI마다 결과를 JSON 한 줄로 출력합니다(여러 파일이면 JSON Lines).
+읽지 못한 INI가 있으면 종료 코드 1.
+"""
+
+import argparse
+import json
+import sys
+
+from .ini_inspect import inspect_ini, format_inspection
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m source.utils",
+        description="INI 파일의 IB 리소스와 파츠 맵을 출력합니다.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    inspect_cmd = commands.add_parser("inspect", help="리소스/파츠 맵 출력")
+    inspect_cmd.add_argument("ini", nargs="+", help="INI 파일 경로")
+    inspect_cmd.add_argument("--resource", default="", help="이 IB 리소스만 출력")
+    inspect_cmd.add_argument("--json", action="store_true", help="JSON으로 출력")
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    failed = 0
+    for path in args.ini:
+        try:
+            result = inspect_ini(path, args.resource or None)
+        except (OSError, UnicodeDecodeError) as e:
+            failed += 1
+            if args.json:
+                print(json.dumps({"ini": path, "error": str(e)}, ensure_ascii=False))
+            else:
+                print(f"{path}: 읽을 수 없습니다 ({e})", file=sys.stderr)
+            continue
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False))
+        else:
+            print("\n".join(format_inspection(result)))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+
+import numpy as np
+from .build_parts_map import find_ib_sections
+
+_IB_FORMATS = {
+    "DXGI_FORMAT_R16_UINT": np.uint16,
+    "DXGI_FORMAT_R32_UINT": np.uint32,
+}
+_HASH_RE = re.compile(r"^\s*hash\s*=\s*(\S+)$", re.IGNORECASE)
+_VB_SLOT_RE = re.compile(r"^\s*(vb\d+)\s*=\s*(.+)$", re.IGNORECASE)
+_INVALID_NAME_RE = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def _strip_inline_comment(s: str) -> str:
+    for sep in (";", "#"):
+        idx = s.find(sep)
+        if idx != -1:
+            s = s[:idx]
+    return s.strip()
+
+
+def resource_options(sections, name):
+    """
+    [Resource...] 섹션의 `key = value` 항목을 소문자 키 dict로 반환합니다.
+
+    Raises:
+        KeyError: 섹션이 없을 때
+    """
+    if name not in sections:
+        raise KeyError(f"Resource section not found: {name}")
+    options = {}
+    for line in sections[name]:
+        s = _strip_inline_comment(line)
+        if "=" not in s:
+            continue
+        key, value = s.split("=", 1)
+        options[key.strip().lower()] = value.strip()
+    return options
+
+
+def _resource_path(ini_dir, options, name):
+    filename = options.get("filename", "").strip().strip('"')
+    if not filename:
+        raise ValueError(f"{name}: filename이 없습니다.")
+    filename = filename.replace("\\", os.sep).replace("/", os.sep)
+    return os.path.join(ini_dir, filename)
+
+
+def _vertex_slots(sections, section_names, seen, out):
+    for sec in section_names:
+        for line in sections[sec]:
+            m = _VB_SLOT_RE.match(_strip_inline_comment(line))
+            if not m:
+                continue
+            slot, res = m.group(1).lower(), m.group(2).strip()
+            if res.lower() == "null" or res in seen or res not in sections:
+                continue
+            seen.add(res)
+            out.append((slot, res))
+
+
+def find_vertex_resources(sections, resource):
+    """
+    IB 리소스 resource와 함께 쓰는 `vbN = Resource...` 지정을 (slot, resource) 목록으로 반환합니다.
+    같은 리소스는 처음 등장한 슬롯만 유지합니다.
+
+    `ib = resource`를 지정하는 TextureOverride 섹션의 vbN을 먼저 찾고, 없으면
+    (Position/Blend/Texcoord 오버라이드를 따로 두는 형식) 그 섹션들과 hash가 같은 IB 오버라이드까지
+    포함한 섹션 이름에서 끝의 `IB`를 뗀 이름으로 시작하는 TextureOverride 섹션에서 찾습니다.
+    다른 모델의 VB는 포함하지 않습니다.
+    """
+    ib_sections = [
+        sec
+        for sec in find_ib_sections(sections, resource)
+        if sec.startswith("TextureOverride")
+    ]
+    seen = set()
+    out = []
+    _vertex_slots(sections, ib_sections, seen, out)
+    if out:
+        return out
+
+    def section_hashes(sec):
+        return {
+            m.group(1).lower()
+            for m in (_HASH_RE.match(_strip_inline_comment(l)) for l in sections[sec])
+            if m
+        }
+
+    hashes = set()
+    for sec in ib_sections:
+        hashes |= section_hashes(sec)
+    ib_overrides = [
+        sec
+        for sec in sections
+        if sec.startswith("TextureOverride")
+        and (sec in ib_sections or section_hashes(sec) & hashes)
+    ]
+    prefixes = set()
+    for sec in ib_overrides:
+        prefix = sec[:-2] if sec.lower().endswith("ib") else sec
+        if prefix != "TextureOverride":
+            prefixes.add(prefix)
+    related = [
+        sec
+        for sec in sections
+        if sec.startswith("TextureOverride")
+        and sec not in ib_overrides
+        and any(sec.startswith(p) for p in prefixes)
+    ]
+    _vertex_slots(sections, related, seen, out)
+    return out
+
+
+def index_dtype(fmt):
+    """IB DXGI format 이름의 NumPy dtype. 지원하지 않으면 None."""
+    return _IB_FORMATS.get((fmt or "").strip().upper())
+
+
+def open_index_buffer(sections, ini_dir, resource):
+    """IB 리소스를 메모리 맵 배열(R16/R32)로 엽니다."""
+    options = resource_options(sections, resource)
+    fmt = options.get("format", "").upper()
+    dtype = index_dtype(fmt)
+    if dtype is None:
+        raise ValueError(f"{resource}: 지원하지 않는 IB format입니다: {fmt or '(없음)'}")
+    return np.memmap(_resource_path(ini_dir, options, resource), dtype=dtype, mode="r")
+
+
+def open_vertex_buffer(sections, ini_dir, resource):
+    """VB 리소스를 (정점 수, stride) 형태의 uint8 메모리 맵 배열로 엽니다."""
+    options = resource_options(sections, resource)
+    try:
+        stride = int(options.get("stride", ""))
+    except ValueError:
+        raise ValueError(f"{resource}: stride가 없거나 잘못되었습니다.")
+    if stride <= 0:
+        raise ValueError(f"{resource}: stride가 잘못되었습니다.")
+    path = _resource_path(ini_dir, options, resource)
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    if raw.size % stride:
+        raise ValueError(f"{resource}: 파일 크기가 stride({stride})의 배수가 아닙니다.")
+    return raw.reshape(-1, stride)
+
+
+def compact_indices(indices):
+    """
+    IB 구간을 (사용하는 원래 정점 인덱스(오름차순), 0부터 다시 번호를 매긴 인덱스)로 나눕니다.
+    정점 버퍼는 `vb[used]`로 같은 순서로 모으면 됩니다.
+    """
+    used, remapped = np.unique(np.asarray(indices), return_inverse=True)
+    return used, remapped.reshape(-1)
+
+
+def safe_file_name(name):
+    return _INVALID_NAME_RE.sub("_", name).strip("_") or "part"
+
+
+def _write_parts(ib, vbs, resource, parts_map, out_dir):
+    """파츠별 IB/VB 파일을 out_dir에 쓰고 매니페스트를 반환합니다(`split_buffers` 참고)."""
+    manifest = {"resource": resource, "index_format": ib.dtype.name, "parts": [], "skipped": []}
+    used_names = set()
+
+    valid = parts_map.valid_mask(ib.size)
+    for i, name in enumerate(parts_map.names):
+        start = int(parts_map.starts[i])
+        count = int(parts_map.counts[i])
+        if not valid[i]:
+            manifest["skipped"].append(
+                {"name": name, "reason": f"invalid range {start},{count} (0~{ib.size})"}
+            )
+            continue
+
+        used, remapped = compact_indices(ib[start : start + count])
+        for res, vb in vbs:
+            if used.size and int(used[-1]) >= vb.shape[0]:
+                raise ValueError(f"{name}: 인덱스가 {res}의 정점 수({vb.shape[0]})를 넘습니다.")
+
+        base = safe_file_name(name)
+        stem, i = base, 1
+        while stem in used_names:
+            stem = f"{base}_{i}"
+            i += 1
+        used_names.add(stem)
+
+        files = {"ib": f"{stem}.ib"}
+        remapped.astype(ib.dtype).tofile(os.path.join(out_dir, files["ib"]))
+        for res, vb in vbs:
+            file_name = f"{stem}-{safe_file_name(res)}.buf"
+            vb[used].tofile(os.path.join(out_dir, file_name))
+            files[res] = file_name
+
+        manifest["parts"].append(
+            {
+                "name": name,
+                "start_index": start,
+                "index_count": count,
+                "vertex_count": int(used.size),
+                "files": files,
+            }
+        )
+    return manifest
+
+
+def split_buffers(sections, ini_dir, resource, parts_map, out_dir, vb_resources=None):
+    """
+    Blender 임포트 없이 IB/VB 원본 버퍼를 파츠 맵 기준으로 잘라 파츠별 압축 버퍼를 씁니다.
+
+    각 파츠마다:
+      - `<part>.ib`: 파츠가 사용하는 정점만 0부터 다시 번호를 매긴 인덱스 버퍼 (원본 IB 형식 유지)
+      - `<part>-<Resource>.buf`: 해당 정점만 원래 순서대로 모은 정점 버퍼
+    그리고 out_dir에 `parts.json` 매니페스트를 씁니다. 파일은 out_dir 안의 임시 폴더에 모두 쓴 뒤
+    매니페스트까지 성공해야 out_dir로 옮기므로, 실패하면 out_dir에 아무것도 남지 않습니다.
+
+    Args:
+        sections: parse_ini_sections 결과(섹션 -> 라인 리스트)
+        ini_dir: 버퍼 파일 경로의 기준 폴더(INI 파일 폴더)
+        resource: IB 리소스 이름
+        parts_map: build_parts_map 결과(PartsMap)
+        out_dir: 출력 폴더
+        vb_resources: VB 리소스 이름 목록(None이면 resource를 쓰는 TextureOverride의 vbN 지정에서 수집)
+
+    Returns:
+        dict: 매니페스트(파츠별 파일/정점 수, 건너뛴 파츠와 사유)
+    Raises:
+        KeyError, ValueError: 리소스 정의가 없거나 잘못되었을 때
+    """
+    ib = open_index_buffer(sections, ini_dir, resource)
+    if vb_resources is None:
+        vb_resources = [res for _slot, res in find_vertex_resources(sections, resource)]
+    vbs = [(res, open_vertex_buffer(sections, ini_dir, res)) for res in vb_resources]
+
+    os.makedirs(out_dir, exist_ok=True)
+    # 모두 임시 폴더에 쓴 뒤 매니페스트까지 끝나면 out_dir로 옮김(중간 실패 시 일부 파일을 남기지 않음)
+    work_dir = tempfile.mkdtemp(prefix=".inips-parts-", dir=out_dir)
+    try:
+        manifest = _write_parts(ib, vbs, resource, parts_map, work_dir)
+        with open(os.path.join(work_dir, "parts.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        for part in manifest["parts"]:
+            for file_name in part["files"].values():
+                os.replace(os.path.join(work_dir, file_name), os.path.join(out_dir, file_name))
+        os.replace(os.path.join(work_dir, "parts.json"), os.path.join(out_dir, "parts.json"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return manifest
@@ -1,6 +1,44 @@
 import re
 from typing import List, Dict, Iterable, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from . import timing
+
+
+_IB_LINE_RE = re.compile(r"^\s*ib\s*=\s*(.+)$", re.IGNORECASE)
+_VARIABLE_RE = re.compile(r"(?:global\s+)?(\$\w+)\s*=\s*(\d+)", re.IGNORECASE)
+_RANGE_PAIR_RE = re.compile(r"^\s*(\d+)\s*(?:,|\s)\s*(\d+)\s*$")
+# 한 줄 입력용 구분자: `|`, 또는 뒤에 drawindexed/숫자가 오는 `;`(그 외 `;`는 주석)
+_RANGE_SPLIT_RE = re.compile(r"\||;(?=\s*(?:drawindexed|\d))", re.IGNORECASE)
+# 주석 처리된 drawindexed/범위 줄(이름 주석으로도 쓰지 않음)
+_COMMENTED_RANGE_RE = re.compile(r"^[;#]\s*(?:drawindexed|\d+\s*(?:,|\s)\s*\d+)", re.I)
+
+
+def find_ib_resources(sections: Dict[str, Iterable[str]]) -> List[str]:
+    """모든 섹션의 `ib = ...` 값을 등장 순서대로 중복 없이 반환합니다."""
+    seen = set()
+    resources = []
+    for lines in sections.values():
+        for line in lines:
+            m = _IB_LINE_RE.match(line)
+            if not m:
+                continue
+            val = m.group(1).strip()
+            if val and val not in seen:
+                seen.add(val)
+                resources.append(val)
+    return resources
+
+
+def find_ib_sections(sections: Dict[str, Iterable[str]], resource: str) -> List[str]:
+    """`ib = resource`를 지정하는 섹션 이름을 등장 순서대로 반환합니다(줄 끝 주석 무시)."""
+    out = []
+    for name, lines in sections.items():
+        for line in lines:
+            m = _IB_LINE_RE.match(line.split(";", 1)[0])
+            if m and m.group(1).strip() == resource:
+                out.append(name)
+                break
+    return out
 
 
 @dataclass
@@ -133,7 +171,7 @@ def _build_parts_map_dataclass(
     for sec_name, lines in sections.items():
         for line in lines:
             line = _strip_inline_comment(line)
-            match = re.search(r'(?:global\s+)?(\$\w+)\s*=\s*(\d+)', line, re.IGNORECASE)
+            match = _VARIABLE_RE.search(line)
             if match:
                 variables[match.group(1).lower()] = int(match.group(2))
 
@@ -182,7 +220,11 @@ def _build_parts_map_dataclass(
     return parts
 
 
-def build_parts_map(sections: Dict[str, Iterable[str]], resource: str) -> List[Dict]:
+@timing.timed("build_parts_map")
+def build_parts_map(sections: Dict[str, Iterable[str]], resource: str) -> "PartsMap":
+    # NumPy를 쓰는 PartsMap은 리소스 목록만 필요한 경우를 위해 여기서 임포트
+    from .parts_map import PartsMap
+
     parts = _build_parts_map_dataclass(sections, resource)
 
     # drawindexed (start_index, index_count) 기준으로 중복 제거 — 첫 등장 우선 보존
@@ -195,4 +237,56 @@ def build_parts_map(sections: Dict[str, Iterable[str]], resource: str) -> List[D
         seen.add(key)
         unique_parts.append(p)
 
-    return [asdict(p) for p in unique_parts]
+    return PartsMap.from_rows(unique_parts)
+
+
+def parse_drawindexed_ranges(text: str, single_line: bool = False) -> "PartsMap":
+    """
+    붙여넣은 텍스트에서 선택할 drawindexed 범위를 모아 PartsMap으로 반환합니다.
+
+    - `drawindexed = count, start, 0` 줄: TextureOverride 블록을 통째로 붙여넣어도 되며,
+      블록 안의 `$var = N` 참조와 주석 이름은 파츠 맵과 같은 규칙으로 처리합니다.
+    - `count, start` 또는 `count start` 줄: 범위 목록을 직접 입력할 때 사용합니다.
+    - `;`/`#`로 시작하는 줄은 주석이며 범위가 되지 않습니다.
+    여러 줄 텍스트는 줄 단위로만 나눕니다. single_line(한 줄 입력란)이면 `|` 또는
+    뒤에 drawindexed/숫자가 오는 `;`로 여러 범위를 구분합니다.
+    """
+    from .parts_map import PartsMap
+
+    text = text or ""
+    if not single_line:
+        chunks = [c.strip() for c in text.splitlines()]
+    elif text.lstrip()[:1] in (";", "#"):
+        # 주석으로 시작하는 한 줄은 통째로 주석
+        chunks = []
+    else:
+        chunks = [c.strip() for c in _RANGE_SPLIT_RE.split(text)]
+    variables = {}
+    for chunk in chunks:
+        match = _VARIABLE_RE.match(chunk)
+        if match:
+            variables[match.group(1).lower()] = int(match.group(2))
+
+    block, pairs = [], []
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if chunk[0] in ";#":
+            if not _COMMENTED_RANGE_RE.match(chunk):
+                block.append(chunk)
+            continue
+        if chunk.lower().startswith("drawindexed"):
+            # 줄 끝 주석 제거
+            block.append(re.split(r"[;#]", chunk, 1)[0].strip())
+            continue
+        match = _RANGE_PAIR_RE.match(chunk)
+        if match:
+            pairs.append((int(match.group(1)), int(match.group(2))))
+
+    parts, _counter = _extract_drawindexed_from_lines(block, 1, variables)
+    rows = [(p.name, p.start_index, p.index_count) for p in parts]
+    for i, (count, start) in enumerate(pairs, start=1):
+        rows.append((f"range_{i}", start, count))
+    return PartsMap(
+        [r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows]
+    )
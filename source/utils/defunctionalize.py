@@ -1,5 +1,6 @@
 from collections import OrderedDict
 import re
+from . import timing
 
 
 def _strip_inline_comments(value: str) -> str:
@@ -50,6 +51,7 @@ def _expand_section(
     return list(out_lines)
 
 
+@timing.timed("defunctionalize_sections")
 def defunctionalize_sections(ini_sections):
     """
     INI 섹션 맵을 전처리해 `CommandList...` 섹션을 함수처럼 취급하고
@@ -0,0 +1,70 @@
+import numpy as np
+
+# 조기 종료 모드에서 처음 검사하는 페이스 수 (이후 두 배씩 늘려가며 검사)
+_FIRST_CHUNK = 4096
+# 정렬된 삼각형 인덱스 3개를 int64 하나로 묶을 수 있는 최대 정점 수 (2^21)
+_PACK_LIMIT = 1 << 21
+
+
+def _face_keys(faces, limit=0):
+    """
+    각 삼각형의 인덱스를 정렬해(정점 순서/와인딩 무시) 비교 가능한 1차원 키 배열로 만듭니다.
+    정점 수가 2^21 이하이면 int64 하나로 묶고, 그보다 크면 행 단위 바이트 뷰를 씁니다.
+    """
+    if limit > 0:
+        faces = faces[:limit]
+    tris = np.sort(np.asarray(faces, dtype=np.int64).reshape(-1, 3), axis=1)
+    if tris.size == 0:
+        return np.empty(0, dtype=np.int64)
+    m = int(tris.max()) + 1
+    if m <= _PACK_LIMIT:
+        return (tris[:, 0] * m + tris[:, 1]) * m + tris[:, 2]
+    tris = np.ascontiguousarray(tris)
+    return tris.view(np.dtype((np.void, tris.dtype.itemsize * 3))).ravel()
+
+
+def _duplicates(keys):
+    return int(keys.size - np.unique(keys).size)
+
+
+def count_duplicate_faces(faces, early_exit=False, sample_size=0):
+    """
+    같은 정점 3개로 이루어진 중복 삼각형 수를 셉니다.
+
+    Args:
+        faces: (N, 3) 형태의 삼각형 인덱스 (예: XXMI `ib.faces`)
+        early_exit (bool): True면 앞쪽 구간부터 두 배씩 늘려가며 구간마다 키를 만들어 검사하고
+            중복이 하나라도 발견되면 그 시점까지 센 수를 바로 반환
+        sample_size (int): 0보다 크면 앞쪽 sample_size개 페이스만 검사
+
+    Returns:
+        int: 발견된 중복 페이스 수 (첫 등장은 제외)
+    """
+    if not early_exit:
+        return _duplicates(_face_keys(faces, sample_size))
+
+    total = len(faces)
+    if sample_size > 0:
+        total = min(total, sample_size)
+    # 앞 구간들의 키(정렬, 중복 없음). 구간마다 같은 기준으로 묶도록 곱수는 _PACK_LIMIT 고정
+    seen = np.empty(0, dtype=np.int64)
+    start, size = 0, _FIRST_CHUNK
+    while start < total:
+        end = min(start + size, total)
+        tris = np.sort(np.asarray(faces[start:end], dtype=np.int64).reshape(-1, 3), axis=1)
+        if tris.size and int(tris.max()) >= _PACK_LIMIT:
+            # 묶을 수 없는 큰 인덱스는 드물므로 전체를 일반 경로로 검사
+            return _duplicates(_face_keys(faces, total))
+        keys = (tris[:, 0] * _PACK_LIMIT + tris[:, 1]) * _PACK_LIMIT + tris[:, 2]
+        unique = np.unique(keys)
+        found = int(keys.size - unique.size)
+        if seen.size:
+            pos = np.minimum(np.searchsorted(seen, unique), seen.size - 1)
+            found += int(np.count_nonzero(seen[pos] == unique))
+        if found:
+            return found
+        seen = np.concatenate((seen, unique))
+        # 정렬된 두 구간을 이어 붙인 배열이므로 병합 정렬이 거의 선형으로 끝남
+        seen.sort(kind="mergesort")
+        start, size = end, size * 2
+    return 0
@@ -0,0 +1,143 @@
+"""
+면별 원래 IB 위치(삼각형 단위) 속성.
+
+`select_indices_from_drawindexed`처럼 `mesh.loop_triangles` 순서를 IB 순서로 보는 방식은
+면을 지우거나 추가하는 편집 뒤에는 맞지 않습니다. 임포트 직후(또는 첫 분리 때) 면마다
+원래 IB 삼각형 위치를 정수 FACE 속성으로 기록해 두면, 속성은 편집/분리 후에도 면을 따라가므로
+drawindexed 범위를 정렬된 속성 배열에 대한 searchsorted로 찾을 수 있고
+분리한 파츠를 원래 IB 순서로 다시 정렬해 내보낼 수 있습니다.
+
+속성에는 IB 위치 + 1을 저장합니다. 기록 뒤에 추가된 면은 Blender 기본값 0을 받으므로
+0은 "원래 IB 위치 없음"이 되고, 읽을 때는 -1로 바뀌어 범위 조회와 정렬에서 빠집니다.
+`mesh.attributes`가 없는 Blender(2.93 미만)에서는 속성을 쓰지 않고 loop triangle 순서를 씁니다.
+"""
+
+import numpy as np
+
+IB_ORDER_ATTR = "inips_ib_order"
+# 속성을 기록할 때의 전체 IB 삼각형 수(이후 편집으로 면 수가 바뀌어도 범위 검사에 사용)
+IB_TRIANGLES_PROP = "inips_ib_triangles"
+# 원래 IB 위치가 없는 면(기록 뒤에 추가된 면)의 읽기 값
+UNKNOWN_POSITION = -1
+
+
+def has_ib_order(mesh):
+    if not hasattr(mesh, "attributes"):
+        return False
+    attr = mesh.attributes.get(IB_ORDER_ATTR)
+    return attr is not None and attr.domain == "FACE" and attr.data_type == "INT"
+
+
+def read_ib_order(mesh):
+    """면별 원래 IB 삼각형 위치 배열(int64). 위치가 없는 면은 UNKNOWN_POSITION."""
+    stored = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.attributes[IB_ORDER_ATTR].data.foreach_get("value", stored)
+    return stored.astype(np.int64) - 1
+
+
+def ensure_ib_order(mesh, positions=None, total_triangles=None):
+    """
+    IB 순서 속성이 없으면 현재 loop triangle 순서를 원래 IB 순서로 보고 기록합니다.
+    면마다 첫 삼각형의 위치 + 1을 저장합니다(0은 위치 없음).
+    속성을 지원하지 않는 Blender에서는 아무것도 하지 않습니다.
+
+    Args:
+        positions: loop triangle별 원래 IB 삼각형 위치(파츠 버퍼만 임포트한 메시용).
+            None이면 loop triangle 순서 그대로. 길이가 삼각형 수와 다르면 기록하지 않음
+        total_triangles: 원래 IB 전체 삼각형 수(None이면 이 메시의 삼각형 수)
+
+    Returns:
+        bool: 새로 기록했으면 True
+    """
+    if not hasattr(mesh, "attributes") or has_ib_order(mesh):
+        return False
+    mesh.calc_loop_triangles()
+    tris = mesh.loop_triangles
+    tri_polys = np.empty(len(tris), dtype=np.int32)
+    tris.foreach_get("polygon_index", tri_polys)
+    if positions is None:
+        positions = np.arange(len(tris), dtype=np.int64)
+    else:
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1)
+        if positions.size != len(tris):
+            # 임포트 중 면이 정리(중복/퇴화 제거)되어 삼각형과 위치를 맞출 수 없음
+            return False
+    first = np.zeros(len(mesh.polygons), dtype=np.int32)
+    polys, first_tri = np.unique(tri_polys, return_index=True)
+    first[polys] = positions[first_tri] + 1
+
+    attr = mesh.attributes.get(IB_ORDER_ATTR)
+    if attr is not None:
+        # 같은 이름의 다른 형식 속성은 교체
+        mesh.attributes.remove(attr)
+    attr = mesh.attributes.new(IB_ORDER_ATTR, "INT", "FACE")
+    attr.data.foreach_set("value", first)
+    mesh[IB_TRIANGLES_PROP] = len(tris) if total_triangles is None else int(total_triangles)
+    return True
+
+
+def total_ib_indices(mesh):
+    """범위 검사 기준 IB 인덱스 수. 속성을 기록할 때의 삼각형 수를 우선 사용합니다."""
+    recorded = mesh.get(IB_TRIANGLES_PROP) if has_ib_order(mesh) else None
+    if recorded is not None:
+        return int(recorded) * 3
+    return (len(mesh.loops) - 2 * len(mesh.polygons)) * 3
+
+
+class IbOrderIndex:
+    """
+    면별 IB 위치를 정렬해 둔 색인. 위치가 없는 면(음수)은 색인에 넣지 않습니다.
+
+    - order: IB 위치 순으로 정렬한 면 인덱스
+    - positions: order 순서의 IB 위치(오름차순)
+    - spans: order 순서의 면별 삼각형 수(삼각형 메시면 모두 1)
+    """
+
+    __slots__ = ("order", "positions", "spans", "n_polys")
+
+    def __init__(self, ib_order, loop_total):
+        ib_order = np.asarray(ib_order, dtype=np.int64).reshape(-1)
+        spans = np.maximum(np.asarray(loop_total, dtype=np.int64) - 2, 1)
+        known = np.flatnonzero(ib_order >= 0)
+        self.order = known[np.argsort(ib_order[known], kind="stable")]
+        self.positions = ib_order[self.order]
+        self.spans = spans[self.order]
+        self.n_polys = ib_order.size
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        """메시에 IB 순서 속성이 있으면 색인을, 없으면 None을 반환합니다."""
+        if not has_ib_order(mesh):
+            return None
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        return cls(read_ib_order(mesh), loop_total)
+
+    def _bounds(self, first_tris, stop_tris):
+        """삼각형 구간들의 정렬 위치 [lo, hi). 앞 면이 구간 시작에 걸쳐 있으면 lo에 포함."""
+        lo = np.searchsorted(self.positions, first_tris, side="left")
+        hi = np.searchsorted(self.positions, stop_tris, side="left")
+        if not self.positions.size:
+            return lo, hi
+        prev = np.maximum(lo - 1, 0)
+        straddle = (lo > 0) & (self.positions[prev] + self.spans[prev] > first_tris)
+        return np.where(straddle, prev, lo), hi
+
+    def polygons(self, first_tri, stop_tri):
+        """IB 삼각형 [first_tri, stop_tri)에 걸치는 면 인덱스(정렬됨)."""
+        lo, hi = self._bounds(np.int64(first_tri), np.int64(stop_tri))
+        return np.sort(self.order[int(lo) : int(hi)])
+
+    def polygon_mask(self, first_tris, stop_tris):
+        """여러 삼각형 구간의 합집합에 걸치는 면을 bool 배열로 반환합니다."""
+        first_tris = np.asarray(first_tris, dtype=np.int64).reshape(-1)
+        stop_tris = np.asarray(stop_tris, dtype=np.int64).reshape(-1)
+        lo, hi = self._bounds(first_tris, stop_tris)
+        # 정렬 위치 공간에서 구간 시작/끝에 +1/-1을 더한 뒤 누적합
+        delta = np.zeros(self.order.size + 1, dtype=np.int64)
+        np.add.at(delta, lo, 1)
+        np.add.at(delta, hi, -1)
+        hit = np.cumsum(delta[:-1]) > 0
+        mask = np.zeros(self.n_polys, dtype=bool)
+        mask[self.order[hit]] = True
+        return mask
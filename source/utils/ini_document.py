@@ -0,0 +1,118 @@
+from collections import OrderedDict
+import re
+from .ini_parser import parse_ini_sections
+from .defunctionalize import _expand_section, _strip_inline_comments
+from .build_parts_map import build_parts_map
+
+_RUN_RE = re.compile(r"^\s*run\s*=", re.IGNORECASE)
+_RECURSION_MARKER = "; [defunctionalize_sections] recursion skipped: {}"
+
+
+def _run_refs(lines):
+    """섹션 안의 `run = 이름` 대상 이름 집합(존재 여부와 무관)."""
+    refs = set()
+    for line in lines:
+        if _RUN_RE.match(line):
+            target = _strip_inline_comments(line.split("=", 1)[1])
+            if target:
+                refs.add(target)
+    return refs
+
+
+class IniDocument:
+    """
+    INI 텍스트의 파싱/함수화 해제 결과를 보관하고 변경분만 다시 계산합니다.
+
+    `update(text)`는 원본 섹션 중 내용이 바뀐(추가/삭제 포함) 섹션과, `run`으로 그 섹션을
+    직간접적으로 호출하는 섹션의 확장 캐시만 버리고 다시 확장합니다.
+    결과 `sections`는 `defunctionalize_sections(parse_ini_sections(text))`와 같습니다.
+    """
+
+    def __init__(self, text=""):
+        self.raw = OrderedDict()
+        self.sections = OrderedDict()
+        self._refs = {}
+        self._memo = {}
+        self._parts_maps = {}
+        self.revision = 0
+        self.update(text)
+
+    def update(self, text):
+        """
+        새 텍스트를 반영하고 확장 결과가 바뀐(또는 사라진) 섹션 이름 집합을 반환합니다.
+        내용은 같고 순서만 바뀐 섹션도 위치가 달라진 섹션으로 포함합니다.
+        """
+        new_raw = parse_ini_sections(text)
+        old_raw = self.raw
+        changed_raw = {
+            name
+            for name in set(new_raw) | set(old_raw)
+            if old_raw.get(name) != new_raw.get(name)
+        }
+        if not changed_raw and list(new_raw) == list(old_raw):
+            return set()
+
+        for name in changed_raw:
+            if name in new_raw:
+                self._refs[name] = _run_refs(new_raw[name])
+            else:
+                self._refs.pop(name, None)
+
+        # 바뀐 섹션을 (직간접) 호출하는 섹션까지 확장 캐시 무효화
+        referrers = {}
+        for name, refs in self._refs.items():
+            for target in refs:
+                referrers.setdefault(target, []).append(name)
+        dirty = set(changed_raw)
+        stack = list(changed_raw)
+        while stack:
+            for caller in referrers.get(stack.pop(), ()):
+                if caller not in dirty:
+                    dirty.add(caller)
+                    stack.append(caller)
+        for name in dirty:
+            self._memo.pop(name, None)
+
+        run_targets = {
+            target
+            for refs in self._refs.values()
+            for target in refs
+            if target in new_raw
+        }
+        new_sections = OrderedDict()
+        for name in new_raw:
+            if name in run_targets:
+                continue
+            if name in dirty or name not in self.sections:
+                new_sections[name] = _expand_section(
+                    name, set(), new_raw, self._memo, _RECURSION_MARKER
+                )
+            else:
+                new_sections[name] = self.sections[name]
+
+        changed = {
+            name
+            for name in set(new_sections) | set(self.sections)
+            if self.sections.get(name) != new_sections.get(name)
+        }
+        if list(new_sections) != list(self.sections):
+            old_positions = {name: i for i, name in enumerate(self.sections)}
+            changed.update(
+                name
+                for i, name in enumerate(new_sections)
+                if old_positions.get(name) != i
+            )
+        self.raw = new_raw
+        self.sections = new_sections
+        if changed:
+            self._parts_maps.clear()
+            self.revision += 1
+        return changed
+
+    def parts_map(self, resource):
+        """리소스의 파츠 맵(PartsMap). 섹션이 바뀌기 전까지 재사용합니다."""
+        parts_map = self._parts_maps.get(resource)
+        if parts_map is None:
+            parts_map = build_parts_map(self.sections, resource)
+            self._parts_maps[resource] = parts_map
+        return parts_map
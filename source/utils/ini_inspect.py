@@ -0,0 +1,62 @@
+import os
+from .ini_parser import parse_ini_sections
+from .defunctionalize import defunctionalize_sections
+from .build_parts_map import build_parts_map, find_ib_resources
+from .interval_index import analyze_parts
+
+
+def load_ini_sections(path):
+    """
+    INI 파일을 읽어 섹션 파싱과 CommandList 함수화 해제까지 마친 섹션 맵을 반환합니다.
+
+    Raises:
+        OSError: 파일을 읽을 수 없을 때
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    sections = parse_ini_sections(text)
+    return defunctionalize_sections(sections)
+
+
+def inspect_ini(path, resource=None):
+    """
+    INI 하나의 IB 리소스 목록과 리소스별 파츠 맵/범위 점검 결과를 dict로 반환합니다.
+    resource를 주면 해당 리소스의 파츠 맵만 포함합니다.
+
+    Raises:
+        OSError, UnicodeDecodeError: 파일을 읽을 수 없을 때
+    """
+    sections = load_ini_sections(path)
+    resources = find_ib_resources(sections)
+    targets = [resource] if resource else resources
+    parts_maps = {res: build_parts_map(sections, res) for res in targets}
+    return {
+        "ini": os.path.abspath(path),
+        "resources": resources,
+        "parts": {res: pm.to_list() for res, pm in parts_maps.items()},
+        # 메시 크기를 모르므로 범위 초과/뒤쪽 빈 구간은 검사하지 않음
+        "analysis": {res: analyze_parts(pm) for res, pm in parts_maps.items()},
+    }
+
+
+def format_inspection(result):
+    """inspect_ini 결과를 사람이 읽을 수 있는 줄 목록으로 만듭니다."""
+    lines = [result["ini"]]
+    lines.append("  리소스: " + (", ".join(result["resources"]) or "(없음)"))
+    for res, parts in result["parts"].items():
+        lines.append(f"  [{res}] 파츠 {len(parts)}개")
+        for part in parts:
+            lines.append(
+                f"    {part['name']}: start={part['start_index']} count={part['index_count']}"
+            )
+        analysis = result.get("analysis", {}).get(res)
+        if analysis:
+            lines.append(
+                f"    점검: 범위 오류 {len(analysis['invalid'])}, 겹침 {len(analysis['overlaps'])}, "
+                f"빈 구간 {len(analysis['gaps'])}, 3의 배수 아님 {len(analysis['unaligned'])}"
+            )
+            for item in analysis["overlaps"]:
+                lines.append(
+                    f"      겹침 {item['a']} / {item['b']}: start={item['start']} count={item['count']}"
+                )
+    return lines
@@ -1,9 +1,11 @@
 from collections import OrderedDict
 import re
+from . import timing
 
 _SECTION_RE = re.compile(r"^\s*\[([^\]]+)\]\s*(?:[;#].*)?$")
 
 
+@timing.timed("parse_ini_sections")
 def parse_ini_sections(text: str) -> OrderedDict:
     """
     INI-like 문자열을 섹션 단위로 파싱해 OrderedDict(section_name -> list_of_lines)을 반환.
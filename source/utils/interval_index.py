@@ -0,0 +1,165 @@
+import numpy as np
+
+
+class IntervalIndex:
+    """
+    반열린 구간 [start, end) 목록을 시작 위치 기준으로 정렬해 둔 인덱스.
+
+    정렬(O(n log n)) 후 누적 최대 끝 위치를 함께 보관하므로 겹침/빈 구간/합집합 계산은
+    한 번의 선형 순회로 끝나고, 위치 질의는 searchsorted로 후보 범위를 좁힙니다.
+    ids는 원래 목록(예: 파츠 맵)에서의 위치입니다.
+    """
+
+    __slots__ = ("ids", "starts", "ends", "max_ends", "_merged")
+
+    def __init__(self, starts, ends, ids=None):
+        starts = np.asarray(starts, dtype=np.int64).reshape(-1)
+        ends = np.asarray(ends, dtype=np.int64).reshape(-1)
+        if ids is None:
+            ids = np.arange(starts.size)
+        order = np.argsort(starts, kind="stable")
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.max_ends = (
+            np.maximum.accumulate(self.ends) if self.ends.size else self.ends.copy()
+        )
+        self._merged = None
+
+    def __len__(self):
+        return self.starts.size
+
+    def overlapping(self, start, stop):
+        """[start, stop)와 겹치는 구간의 id 배열을 반환합니다."""
+        hi = np.searchsorted(self.starts, stop, side="left")
+        if not hi:
+            return self.ids[:0]
+        # max_ends는 단조 증가이므로 start 이하로 끝나는 앞부분은 한 번에 건너뜀
+        lo = np.searchsorted(self.max_ends[:hi], start, side="right")
+        hit = self.ends[lo:hi] > start
+        return self.ids[lo:hi][hit]
+
+    def overlaps(self):
+        """
+        앞선 구간과 겹치는 구간마다 (앞 구간 id, 구간 id, 겹침 시작, 겹침 끝)을 반환합니다.
+        앞 구간은 그 시점까지 가장 멀리 뻗은 구간입니다.
+        """
+        n = self.starts.size
+        if n < 2:
+            return []
+        prev_max = self.max_ends[:-1]
+        hit = np.flatnonzero(self.starts[1:] < prev_max) + 1
+        if not hit.size:
+            return []
+        # 각 위치까지 최대 끝 위치를 가진 구간(동률이면 뒤쪽)
+        holder = np.maximum.accumulate(
+            np.where(self.ends == self.max_ends, np.arange(n), 0)
+        )
+        out = []
+        for i in hit.tolist():
+            h = holder[i - 1]
+            out.append(
+                (
+                    int(self.ids[h]),
+                    int(self.ids[i]),
+                    int(self.starts[i]),
+                    int(min(self.ends[i], self.max_ends[i - 1])),
+                )
+            )
+        return out
+
+    def merged(self):
+        """겹치거나 맞닿은 구간을 합친 (starts, ends) 배열을 반환합니다."""
+        if self._merged is None:
+            if not self.starts.size:
+                self._merged = (self.starts.copy(), self.ends.copy())
+            else:
+                # 이전까지의 최대 끝보다 뒤에서 시작하면 새 묶음
+                new_group = np.ones(self.starts.size, dtype=bool)
+                new_group[1:] = self.starts[1:] > self.max_ends[:-1]
+                first = np.flatnonzero(new_group)
+                last = np.append(first[1:], self.starts.size) - 1
+                self._merged = (self.starts[first], self.max_ends[last])
+        return self._merged
+
+    def covered(self):
+        starts, ends = self.merged()
+        return int((ends - starts).sum())
+
+    def gaps(self, lo=0, hi=None):
+        """[lo, hi) 중 어떤 구간에도 속하지 않는 (start, end) 목록. hi가 None이면 마지막 끝까지."""
+        starts, ends = self.merged()
+        if hi is None:
+            hi = int(ends[-1]) if ends.size else lo
+        bounds_start = np.concatenate(([lo], ends))
+        bounds_end = np.concatenate((starts, [hi]))
+        bounds_start = np.clip(bounds_start, lo, hi)
+        bounds_end = np.clip(bounds_end, lo, hi)
+        keep = bounds_end > bounds_start
+        return list(zip(bounds_start[keep].tolist(), bounds_end[keep].tolist()))
+
+    def triangle_mask(self, total_triangles):
+        """구간(IB 인덱스 단위)이 하나라도 걸치는 삼각형을 bool 배열로 반환합니다."""
+        starts, ends = self.merged()
+        delta = np.zeros(total_triangles + 1, dtype=np.int64)
+        np.add.at(delta, np.clip(starts // 3, 0, total_triangles), 1)
+        np.add.at(delta, np.clip((ends - 1) // 3 + 1, 0, total_triangles), -1)
+        return np.cumsum(delta[:-1]) > 0
+
+
+def analyze_parts(parts_map, total_indices=None):
+    """
+    파츠 맵의 drawindexed 범위를 점검합니다.
+
+    Args:
+        parts_map: PartsMap
+        total_indices: 메시(IB)의 전체 인덱스 수. None이면 범위 초과 검사와 뒤쪽 빈 구간을 생략
+
+    Returns:
+        dict: invalid(범위 오류), unaligned(3의 배수가 아님), overlaps, gaps,
+              covered(덮인 인덱스 수), coverage(total_indices 대비 비율 또는 None)
+    """
+    names = parts_map.names
+    starts, counts = parts_map.starts, parts_map.counts
+    ends = starts + counts
+
+    bad = (counts > 0) & (starts < 0)
+    if total_indices is not None:
+        bad |= (counts > 0) & (ends > total_indices)
+    invalid = []
+    for reason, mask in (("empty", counts <= 0), ("out_of_bounds", bad)):
+        for i in np.flatnonzero(mask).tolist():
+            invalid.append(
+                {
+                    "name": names[i],
+                    "start": int(starts[i]),
+                    "count": int(counts[i]),
+                    "reason": reason,
+                }
+            )
+
+    index = parts_map.interval_index(total_indices)
+    unaligned = [
+        names[i]
+        for i in index.ids[(index.starts % 3 != 0) | (index.ends % 3 != 0)].tolist()
+    ]
+    overlaps = [
+        {"a": names[a], "b": names[b], "start": start, "count": stop - start}
+        for a, b, start, stop in index.overlaps()
+    ]
+    gaps = [
+        {"start": start, "count": stop - start}
+        for start, stop in index.gaps(0, total_indices)
+    ]
+    covered = index.covered()
+    return {
+        "total_indices": total_indices,
+        "parts": len(parts_map),
+        "valid": len(index),
+        "invalid": invalid,
+        "unaligned": unaligned,
+        "overlaps": overlaps,
+        "gaps": gaps,
+        "covered": covered,
+        "coverage": covered / total_indices if total_indices else None,
+    }
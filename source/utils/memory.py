@@ -0,0 +1,103 @@
+import sys
+
+
+def _linux_status():
+    values = {}
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                values[key] = int(rest.split()[0]) * 1024
+    return values.get("VmRSS"), values.get("VmHWM")
+
+
+def _windows_memory():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(
+        handle, ctypes.byref(counters), counters.cb
+    ):
+        return None, None
+    return counters.WorkingSetSize, counters.PeakWorkingSetSize
+
+
+def _rusage_peak():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, 그 외 유닉스는 KB 단위
+    return None, peak if sys.platform == "darwin" else peak * 1024
+
+
+def process_memory():
+    """
+    (현재 메모리, 최대 메모리)를 바이트 단위로 반환합니다. 알 수 없는 값은 None.
+    Blender 전체 프로세스 기준(RSS/Working Set)입니다.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            return _linux_status()
+        if sys.platform == "win32":
+            return _windows_memory()
+        return _rusage_peak()
+    except Exception:
+        return None, None
+
+
+def format_bytes(value):
+    if value is None:
+        return "?"
+    return f"{value / (1024 * 1024):.0f}MB"
+
+
+class MemoryMonitor:
+    """
+    한 실행 구간의 메모리(현재 RSS)를 표본으로 기록합니다.
+    프로세스 전체 최대값(VmHWM 등)은 이전 작업의 최대치가 남아 있으므로,
+    단계마다 `sample()`을 불러 이 구간 안의 최대값을 따로 구합니다.
+    """
+
+    def __init__(self):
+        self.start, _peak = process_memory()
+        self.peak = self.start
+        self.end = None
+
+    def sample(self):
+        current, _peak = process_memory()
+        if current is not None and (self.peak is None or current > self.peak):
+            self.peak = current
+        return current
+
+    def stop(self):
+        self.end = self.sample()
+        return self
+
+    def as_dict(self):
+        growth = None
+        if self.start is not None and self.peak is not None:
+            growth = self.peak - self.start
+        return {"start": self.start, "peak": self.peak, "end": self.end, "growth": growth}
+
+    def summary_line(self):
+        return (
+            f"메모리 시작 {format_bytes(self.start)}, 최대 {format_bytes(self.peak)}"
+            f" (+{format_bytes(self.as_dict()['growth'])}), 종료 {format_bytes(self.end)}"
+        )
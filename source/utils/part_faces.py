@@ -0,0 +1,117 @@
+"""
+파츠별 면/정점/엣지 인덱스 미리 계산.
+
+메인 스레드가 메시 배열을 한 번 복사해 `MeshSnapshot`을 만들면, `FaceSetPrefetcher`가
+작업 스레드에서 파츠 순서대로 앞쪽 몇 개 파츠의 인덱스 집합을 계산해 둡니다.
+NumPy 정렬/인덱싱은 GIL을 놓으므로 모달 분리의 메인 스레드가 앞 파츠의 오브젝트를 만드는 동안
+다음 파츠의 범위 계산이 겹쳐 진행됩니다.
+bpy에 의존하지 않습니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+
+class MeshSnapshot:
+    """
+    범위 계산에 필요한 메시 배열의 복사본.
+
+    - tri_polys: loop triangle별 폴리곤 인덱스(IB 삼각형 순서)
+    - loop_start / loop_total: 폴리곤별 루프 시작 위치와 수
+    - loop_verts / loop_edges: 루프별 정점/엣지 인덱스
+    - ib_index: 면별 IB 순서 속성 색인(`ib_order.IbOrderIndex`). 있으면 tri_polys 대신 사용
+    """
+
+    __slots__ = (
+        "tri_polys",
+        "loop_start",
+        "loop_total",
+        "loop_verts",
+        "loop_edges",
+        "ib_index",
+    )
+
+    def __init__(
+        self, tri_polys, loop_start, loop_total, loop_verts, loop_edges, ib_index=None
+    ):
+        self.ib_index = ib_index
+        self.tri_polys = np.asarray(tri_polys, dtype=np.int32)
+        self.loop_start = np.asarray(loop_start, dtype=np.int64)
+        self.loop_total = np.asarray(loop_total, dtype=np.int64)
+        self.loop_verts = np.asarray(loop_verts, dtype=np.int32)
+        self.loop_edges = np.asarray(loop_edges, dtype=np.int32)
+
+
+def part_face_set(snapshot, start, count):
+    """
+    drawindexed [start, start + count) 구간이 걸치는 (폴리곤, 정점, 엣지) 인덱스 배열(정렬됨).
+    범위는 호출 전에 검사되어 있어야 합니다.
+    """
+    first = start // 3
+    stop = (start + count - 1) // 3 + 1
+    if snapshot.ib_index is not None:
+        polys = snapshot.ib_index.polygons(first, stop)
+    else:
+        polys = np.unique(snapshot.tri_polys[first:stop])
+    if not polys.size:
+        empty = polys[:0]
+        return polys, empty, empty
+
+    # 선택된 폴리곤들의 루프 인덱스를 이어 붙인 배열(폴리곤별 연속 구간을 한 번에 펼침)
+    starts = snapshot.loop_start[polys]
+    totals = snapshot.loop_total[polys]
+    offsets = np.cumsum(totals) - totals
+    loops = np.repeat(starts - offsets, totals) + np.arange(int(totals.sum()))
+    verts = np.unique(snapshot.loop_verts[loops])
+    edges = np.unique(snapshot.loop_edges[loops])
+    return polys, verts, edges
+
+
+class FaceSetPrefetcher:
+    """
+    작업 스레드 하나에서 파츠 순서대로 `part_face_set`을 계산합니다.
+    한 번에 lookahead개까지만 미리 계산하고, `get(i)`/`discard(i)`로 파츠 하나를 꺼낼 때마다
+    다음 파츠를 하나 더 맡기므로 메모리에는 앞쪽 몇 개 파츠의 인덱스만 남습니다.
+    """
+
+    def __init__(self, snapshot, parts_map, indices, lookahead=4):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inips-faces")
+        self._snapshot = snapshot
+        self._parts_map = parts_map
+        self._indices = list(indices)
+        self._next = 0
+        self._lookahead = max(1, int(lookahead))
+        self._futures = {}
+        self._fill()
+
+    def _fill(self):
+        parts_map = self._parts_map
+        while len(self._futures) < self._lookahead and self._next < len(self._indices):
+            i = self._indices[self._next]
+            self._next += 1
+            self._futures[i] = self._executor.submit(
+                part_face_set,
+                self._snapshot,
+                int(parts_map.starts[i]),
+                int(parts_map.counts[i]),
+            )
+
+    def get(self, i):
+        """i번째 파츠의 (폴리곤, 정점, 엣지). 미리 계산하지 않은 파츠면 None."""
+        future = self._futures.pop(i, None)
+        self._fill()
+        return future.result() if future is not None else None
+
+    def discard(self, i):
+        """필요 없어진 파츠(예: 메시 공유로 건너뜀)의 계산을 취소하거나 결과를 버립니다."""
+        future = self._futures.pop(i, None)
+        if future is not None:
+            future.cancel()
+        self._fill()
+
+    def close(self):
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._next = len(self._indices)
+        self._executor.shutdown(wait=False)
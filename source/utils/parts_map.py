@@ -0,0 +1,133 @@
+import numpy as np
+
+
+def _field(row, key, default=None):
+    if isinstance(row, dict):
+        return row.get(key, default)
+    return getattr(row, key, default)
+
+
+class PartsMap:
+    """
+    drawindexed 파츠 목록을 열 단위로 보관하는 파츠 맵.
+
+    - names: 파츠 이름 리스트
+    - starts / counts: IB 시작 인덱스와 인덱스 수(int64 배열)
+    - meta: 파츠별 부가 정보 dict 리스트(예: {"comment": ...})
+
+    범위 계산은 배열 연산으로 처리하고, 기존 코드가 쓰던 `parts_map[i]["name"]`,
+    `for part in parts_map` 형식은 행 dict를 만들어 돌려주는 호환 접근자로 지원합니다.
+    """
+
+    __slots__ = ("names", "starts", "counts", "meta", "_interval_index")
+
+    def __init__(self, names=(), starts=(), counts=(), meta=None):
+        self.names = list(names)
+        self.starts = np.asarray(starts, dtype=np.int64).reshape(-1)
+        self.counts = np.asarray(counts, dtype=np.int64).reshape(-1)
+        self.meta = list(meta) if meta is not None else [None] * len(self.names)
+        if not (len(self.names) == self.starts.size == self.counts.size == len(self.meta)):
+            raise ValueError("PartsMap columns must have the same length.")
+        self._interval_index = (None, None)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """dict 또는 name/start_index/index_count 속성을 가진 객체 목록에서 만듭니다."""
+        names, starts, counts, meta = [], [], [], []
+        for row in rows:
+            names.append(_field(row, "name") or "part")
+            starts.append(int(_field(row, "start_index", 0) or 0))
+            counts.append(int(_field(row, "index_count", 0) or 0))
+            meta.append(_field(row, "meta"))
+        return cls(names, starts, counts, meta)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PartsMap(
+                self.names[index],
+                self.starts[index],
+                self.counts[index],
+                self.meta[index],
+            )
+        return self.row(index)
+
+    def __iter__(self):
+        for i in range(len(self.names)):
+            yield self.row(i)
+
+    def __repr__(self):
+        return f"PartsMap({len(self)} parts)"
+
+    def row(self, index):
+        """i번째 파츠를 기존 형식의 dict로 반환합니다."""
+        return {
+            "name": self.names[index],
+            "start_index": int(self.starts[index]),
+            "index_count": int(self.counts[index]),
+            "meta": self.meta[index],
+        }
+
+    def keys(self):
+        """
+        파츠를 구분하는 키 목록. 보통 이름 그대로이고,
+        같은 이름이 다시 나오면 `이름#2`, `이름#3`...으로 구분합니다.
+        """
+        seen = {}
+        out = []
+        for name in self.names:
+            n = seen.get(name, 0) + 1
+            seen[name] = n
+            out.append(name if n == 1 else f"{name}#{n}")
+        return out
+
+    def to_list(self):
+        return [self.row(i) for i in range(len(self.names))]
+
+    @property
+    def ends(self):
+        return self.starts + self.counts
+
+    def valid_mask(self, total_indices):
+        """인덱스 수가 양수이고 [0, total_indices) 안에 들어오는 파츠만 True."""
+        return (self.counts > 0) & (self.starts >= 0) & (self.ends <= total_indices)
+
+    def triangle_bounds(self):
+        """파츠별 (첫 삼각형, 마지막 삼각형 + 1) 배열을 반환합니다."""
+        first = self.starts // 3
+        stop = (self.ends - 1) // 3 + 1
+        return first, stop
+
+    def interval_index(self, total_indices=None):
+        """
+        범위가 유효한 파츠로 만든 IntervalIndex를 반환합니다(같은 total_indices면 재사용).
+        total_indices가 None이면 범위 초과 검사를 생략합니다.
+        """
+        from .interval_index import IntervalIndex
+
+        cached_total, index = self._interval_index
+        if index is None or cached_total != total_indices:
+            if total_indices is None:
+                mask = (self.counts > 0) & (self.starts >= 0)
+            else:
+                mask = self.valid_mask(total_indices)
+            ids = np.flatnonzero(mask)
+            index = IntervalIndex(self.starts[ids], self.ends[ids], ids)
+            self._interval_index = (total_indices, index)
+        return index
+
+    def triangle_mask(self, total_triangles, mask=None):
+        """
+        선택한 파츠(mask, 기본은 범위가 유효한 전체)가 덮는 삼각형을 bool 배열로 반환합니다.
+        구간 시작/끝에 +1/-1을 더한 뒤 누적합을 구하므로 파츠 수와 삼각형 수에 선형입니다.
+        """
+        if mask is None:
+            mask = self.valid_mask(total_triangles * 3)
+        first, stop = self.triangle_bounds()
+        first, stop = first[mask], stop[mask]
+        delta = np.zeros(total_triangles + 1, dtype=np.int64)
+        np.add.at(delta, first, 1)
+        np.add.at(delta, stop, -1)
+        return np.cumsum(delta[:-1]) > 0
@@ -0,0 +1,110 @@
+"""
+사용자 환경에서 느린 사례를 오프라인으로 분석하기 위한 cProfile / tracemalloc 래퍼.
+
+    session = ProfileSession("split", out_dir, cprofile=True, tracemalloc=True)
+    session.start()
+    ...
+    paths = session.stop()  # 저장된 .prof / .txt 파일 경로 목록
+
+모달 오퍼레이터처럼 여러 틱에 걸친 실행도 start/stop 사이의 Python 호출만 기록됩니다.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc as _tracemalloc
+
+
+class ProfileSession:
+    def __init__(self, label, out_dir, cprofile=True, tracemalloc=False, top=25):
+        self.label = label
+        self.out_dir = out_dir
+        self.use_cprofile = cprofile
+        self.use_tracemalloc = tracemalloc
+        self.top = top
+        self._profiler = None
+        self._started_tracemalloc = False
+        self._stamp = ""
+
+    @property
+    def enabled(self):
+        return self.use_cprofile or self.use_tracemalloc
+
+    def start(self):
+        self._stamp = time.strftime("%Y%m%d-%H%M%S")
+        if self.use_tracemalloc and not _tracemalloc.is_tracing():
+            _tracemalloc.start(10)
+            self._started_tracemalloc = True
+        if self.use_cprofile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def stop(self):
+        """측정을 끝내고 결과 파일을 out_dir에 저장한 뒤 경로 목록을 반환합니다."""
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            profiler.disable()
+
+        snapshot = None
+        if self._started_tracemalloc:
+            snapshot = _tracemalloc.take_snapshot()
+            peak = _tracemalloc.get_traced_memory()[1]
+            _tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        if profiler is None and snapshot is None:
+            return []
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        base = os.path.join(self.out_dir, f"{self.label}-{self._stamp}")
+        paths = []
+        if profiler is not None:
+            # .prof는 snakeviz / pstats로 열고, .txt는 바로 읽을 수 있는 상위 목록
+            profiler.dump_stats(base + ".prof")
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.sort_stats("cumulative").print_stats(self.top)
+            with open(base + "-cprofile.txt", "w", encoding="utf-8") as f:
+                f.write(stream.getvalue())
+            paths += [base + ".prof", base + "-cprofile.txt"]
+        if snapshot is not None:
+            path = base + "-tracemalloc.txt"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(format_allocations(snapshot, self.top, peak))
+            paths.append(path)
+        return paths
+
+    def abort(self):
+        """결과를 저장하지 않고 측정을 중단합니다."""
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler = None
+        if self._started_tracemalloc:
+            _tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def format_allocations(snapshot, top=25, peak=None):
+    """tracemalloc 스냅샷에서 할당량 상위 줄(파일:줄 기준)을 문자열로 만듭니다."""
+    snapshot = snapshot.filter_traces(
+        (
+            _tracemalloc.Filter(False, _tracemalloc.__file__),
+            _tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    stats = snapshot.statistics("lineno")
+    lines = []
+    if peak is not None:
+        lines.append(f"최대 추적 메모리: {peak / 1024:.1f} KiB")
+    lines.append(f"총 할당: {sum(s.size for s in stats) / 1024:.1f} KiB")
+    lines.append("")
+    for index, stat in enumerate(stats[:top], 1):
+        frame = stat.traceback[0]
+        lines.append(
+            f"#{index}: {frame.filename}:{frame.lineno}: "
+            f"{stat.size / 1024:.1f} KiB ({stat.count}회)"
+        )
+    return "\n".join(lines) + "\n"
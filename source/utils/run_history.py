@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import statistics
+
+# 이전 실행들의 중앙값보다 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+# 회귀 판단에 사용하는 이전 실행 수
+DEFAULT_BASELINE_RUNS = 5
+
+
+def file_hash(path):
+    """파일 내용의 SHA-256 앞 16자리를 반환합니다(읽을 수 없으면 빈 문자열)."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                h.update(chunk)
+    except OSError:
+        return ""
+    return h.hexdigest()[:16]
+
+
+def append_record(path, record):
+    """실행 기록 하나를 JSON Lines 파일 끝에 추가합니다."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def load_records(path):
+    """JSON Lines 파일에서 기록을 읽습니다. 깨진 줄은 건너뜁니다."""
+    records = []
+    if not os.path.isfile(path):
+        return records
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def asset_key(record):
+    return (record.get("ini_hash", ""), record.get("resource", ""))
+
+
+def summarize(
+    records,
+    threshold=DEFAULT_REGRESSION_THRESHOLD,
+    baseline_runs=DEFAULT_BASELINE_RUNS,
+):
+    """
+    같은 에셋(INI 해시 + 리소스)별로 최신 실행을 이전 실행들의 중앙값과 비교합니다.
+
+    Returns:
+        list[dict]: 에셋별 요약(runs, latest_ms, baseline_ms, ratio, regression, slower_phases)
+    """
+    groups = {}
+    for record in records:
+        groups.setdefault(asset_key(record), []).append(record)
+
+    out = []
+    for (ini_hash, resource), runs in groups.items():
+        latest = runs[-1]
+        previous = runs[-1 - baseline_runs : -1]
+        item = {
+            "ini": latest.get("ini", ""),
+            "ini_hash": ini_hash,
+            "resource": resource,
+            "runs": len(runs),
+            "latest_ms": latest.get("total_ms", 0.0),
+            "baseline_ms": None,
+            "ratio": None,
+            "regression": False,
+            "slower_phases": [],
+            "version": latest.get("addon_version", ""),
+        }
+        if previous:
+            baseline = statistics.median(r.get("total_ms", 0.0) for r in previous)
+            item["baseline_ms"] = baseline
+            if baseline > 0:
+                item["ratio"] = item["latest_ms"] / baseline
+                item["regression"] = item["ratio"] > 1.0 + threshold
+
+            # 단계별로도 비교해 눈에 띄게 느려진 단계를 표시
+            for name, entry in (latest.get("phases") or {}).items():
+                prev_ms = [
+                    r["phases"][name]["ms"]
+                    for r in previous
+                    if name in (r.get("phases") or {})
+                ]
+                if not prev_ms:
+                    continue
+                base_ms = statistics.median(prev_ms)
+                if base_ms > 0 and entry["ms"] > base_ms * (1.0 + threshold):
+                    item["slower_phases"].append((name, base_ms, entry["ms"]))
+        out.append(item)
+    return out
+
+
+def format_report(summary, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """summarize 결과를 사람이 읽을 수 있는 줄 목록으로 만듭니다."""
+    lines = [f"# 파츠 분리 실행 기록 요약 (회귀 기준 +{threshold * 100:.0f}%)", ""]
+    for item in sorted(summary, key=lambda i: (not i["regression"], i["ini"], i["resource"])):
+        mark = "[회귀] " if item["regression"] else ""
+        line = f"{mark}{item['ini']} / {item['resource']}: 실행 {item['runs']}회, 최근 {item['latest_ms']:.0f}ms"
+        if item["baseline_ms"] is not None:
+            line += f", 이전 중앙값 {item['baseline_ms']:.0f}ms ({item['ratio'] or 0:.2f}배)"
+        if item["version"]:
+            line += f", v{item['version']}"
+        lines.append(line)
+        for name, base_ms, ms in item["slower_phases"]:
+            lines.append(f"    {name}: {base_ms:.0f}ms -> {ms:.0f}ms")
+    return lines
@@ -1,6 +1,8 @@
 import bpy, bmesh
+from . import timing
 
 
+@timing.timed("select_indices_from_drawindexed")
 def select_indices_from_drawindexed(mesh, start, count):
     """
     drawIndexed 인덱스 버퍼의 [start:start+count) 구간에 포함된 정점 인덱스를 기준으로
@@ -20,23 +22,38 @@ def select_indices_from_drawindexed(mesh, start, count):
     if count <= 0:
         return 0, set(), set()
 
-    # loop triangles 기준으로 삼각형 범위 계산
-    mesh.calc_loop_triangles()
-    tris = mesh.loop_triangles
-    total_indices = len(tris) * 3
-    if start < 0 or start + count > total_indices:
-        raise ValueError(f"Invalid drawIndexed range (0~{total_indices}).")
+    # IB 순서 속성 색인은 NumPy를 쓰므로 애드온 시작 시간을 위해 여기서 임포트
+    from .ib_order import IbOrderIndex, total_ib_indices
 
     first_tri = start // 3
     last_tri = (start + count - 1) // 3
 
-    # 선택된 삼각형이 소속된 폴리곤 인덱스와, 범위에 등장하는 정점 인덱스 집합
-    selected_poly_indices = {
-        tris[i].polygon_index for i in range(first_tri, last_tri + 1)
-    }
-    selected_indices = set()
-    for i in range(first_tri, last_tri + 1):
-        selected_indices.update(tris[i].vertices)
+    ib_index = IbOrderIndex.from_mesh(mesh)
+    if ib_index is not None:
+        # IB 순서 속성이 있으면 편집 후에도 원래 IB 위치로 면을 찾음
+        total_indices = total_ib_indices(mesh)
+        if start < 0 or start + count > total_indices:
+            raise ValueError(f"Invalid drawIndexed range (0~{total_indices}).")
+        polys = ib_index.polygons(first_tri, last_tri + 1).tolist()
+        selected_poly_indices = set(polys)
+        selected_indices = set()
+        for i in polys:
+            selected_indices.update(mesh.polygons[i].vertices)
+    else:
+        # loop triangles 기준으로 삼각형 범위 계산
+        mesh.calc_loop_triangles()
+        tris = mesh.loop_triangles
+        total_indices = len(tris) * 3
+        if start < 0 or start + count > total_indices:
+            raise ValueError(f"Invalid drawIndexed range (0~{total_indices}).")
+
+        # 선택된 삼각형이 소속된 폴리곤 인덱스와, 범위에 등장하는 정점 인덱스 집합
+        selected_poly_indices = {
+            tris[i].polygon_index for i in range(first_tri, last_tri + 1)
+        }
+        selected_indices = set()
+        for i in range(first_tri, last_tri + 1):
+            selected_indices.update(tris[i].vertices)
 
     # 편집 모드로 전환(요청된 경우)
     obj = bpy.context.active_object
@@ -62,3 +79,166 @@ def select_indices_from_drawindexed(mesh, start, count):
     bmesh.update_edit_mesh(mesh)
 
     return select_count, selected_indices, face_vertex_indices
+
+
+def polygon_mask_from_ranges(mesh, starts, counts):
+    """
+    drawIndexed 구간 여러 개(start/count 배열)가 걸치는 폴리곤을 bool 배열로 반환합니다.
+
+    loop triangle -> 폴리곤 대응은 foreach_get으로 한 번에 읽고, 구간 합집합은
+    IntervalIndex의 누적합 마스크로 구하므로 구간 수와 상관없이 메시 크기에 선형입니다.
+    메시에 IB 순서 속성(`ib_order`)이 있으면 loop triangle 순서 대신 그 속성으로 찾으므로
+    면을 편집한 뒤에도 원래 IB 범위와 맞습니다. count가 0 이하인 구간은 무시합니다.
+
+    Raises:
+        ValueError: 범위가 유효하지 않을 때
+    """
+    import numpy as np
+    from .interval_index import IntervalIndex
+    from .ib_order import IbOrderIndex, total_ib_indices
+
+    starts = np.asarray(starts, dtype=np.int64).reshape(-1)
+    counts = np.asarray(counts, dtype=np.int64).reshape(-1)
+    keep = counts > 0
+    starts = starts[keep]
+    ends = starts + counts[keep]
+
+    ib_index = IbOrderIndex.from_mesh(mesh)
+    if ib_index is not None:
+        total_indices = total_ib_indices(mesh)
+        if ((starts < 0) | (ends > total_indices)).any():
+            raise ValueError(f"Invalid drawIndexed range (0~{total_indices}).")
+        merged_starts, merged_ends = IntervalIndex(starts, ends).merged()
+        return ib_index.polygon_mask(merged_starts // 3, (merged_ends - 1) // 3 + 1)
+
+    mesh.calc_loop_triangles()
+    tris = mesh.loop_triangles
+    total_indices = len(tris) * 3
+    if ((starts < 0) | (ends > total_indices)).any():
+        raise ValueError(f"Invalid drawIndexed range (0~{total_indices}).")
+
+    poly_mask = np.zeros(len(mesh.polygons), dtype=bool)
+    if starts.size:
+        tri_mask = IntervalIndex(starts, ends).triangle_mask(len(tris))
+        tri_polys = np.empty(len(tris), dtype=np.int32)
+        tris.foreach_get("polygon_index", tri_polys)
+        poly_mask[tri_polys[tri_mask]] = True
+    return poly_mask
+
+
+def _face_elements(mesh, poly_mask):
+    """poly_mask 폴리곤들이 사용하는 (정점 마스크, 엣지 마스크)를 반환합니다."""
+    import numpy as np
+
+    n_polys = len(mesh.polygons)
+    loop_start = np.empty(n_polys, dtype=np.int32)
+    loop_total = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    # 루프는 폴리곤별로 연속 저장되므로 loop_start 순서로 펼치면 루프 -> 폴리곤 대응이 됨
+    order = np.argsort(loop_start, kind="stable")
+    loop_mask = np.repeat(poly_mask[order], loop_total[order])
+
+    vert_mask = np.zeros(len(mesh.vertices), dtype=bool)
+    edge_mask = np.zeros(len(mesh.edges), dtype=bool)
+    vert_mask[loop_verts[loop_mask]] = True
+    edge_mask[loop_edges[loop_mask]] = True
+    return vert_mask, edge_mask
+
+
+def apply_polygon_selection(obj, poly_mask, isolate=False, mode="SET"):
+    """
+    오브젝트의 폴리곤 선택을 poly_mask로 한 번에 바꾸고 편집 모드로 들어갑니다.
+
+    편집 모드였다면 잠시 오브젝트 모드로 나가 메시 배열에 foreach_set으로 쓰고 돌아오므로
+    BMesh 면을 하나씩 순회하지 않습니다. 정점/엣지 선택은 선택된 폴리곤에서 다시 계산합니다.
+    isolate면 선택되지 않은 폴리곤을 숨깁니다(편집 모드에서 Alt+H로 다시 표시).
+    mode는 "SET"(교체), "ADD"(현재 선택에 추가), "SUBTRACT"(현재 선택에서 제외)입니다.
+
+    Returns:
+        int: 선택된 폴리곤 수
+    """
+    import numpy as np
+
+    if obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    mesh = obj.data
+
+    if isolate:
+        hidden = ~poly_mask
+        vert_visible, edge_visible = _face_elements(mesh, poly_mask)
+        mesh.polygons.foreach_set("hide", hidden)
+        mesh.vertices.foreach_set("hide", ~vert_visible)
+        mesh.edges.foreach_set("hide", ~edge_visible)
+    else:
+        if mode != "SET":
+            current = np.empty(len(mesh.polygons), dtype=bool)
+            mesh.polygons.foreach_get("select", current)
+            poly_mask = current | poly_mask if mode == "ADD" else current & ~poly_mask
+        # 숨겨진 면은 선택하지 않음(편집 모드 규칙과 동일)
+        hidden = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get("hide", hidden)
+        poly_mask = poly_mask & ~hidden
+
+    vert_mask, edge_mask = _face_elements(mesh, poly_mask)
+    mesh.polygons.foreach_set("select", poly_mask)
+    mesh.vertices.foreach_set("select", vert_mask)
+    mesh.edges.foreach_set("select", edge_mask)
+    mesh.update()
+
+    bpy.ops.object.mode_set(mode="EDIT")
+    return int(np.count_nonzero(poly_mask))
+
+
+def select_face_set(obj, polys, verts, edges):
+    """
+    미리 계산한 (폴리곤, 정점, 엣지) 인덱스 배열(`part_faces.part_face_set`)로 선택을 교체하고
+    편집 모드로 들어갑니다. 분리 대상이 빠지지 않도록 숨김은 모두 해제합니다.
+
+    Returns:
+        int: 선택된 폴리곤 수
+    """
+    import numpy as np
+
+    if obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    mesh = obj.data
+    for collection, indices in (
+        (mesh.polygons, polys),
+        (mesh.vertices, verts),
+        (mesh.edges, edges),
+    ):
+        mask = np.zeros(len(collection), dtype=bool)
+        collection.foreach_set("hide", mask)
+        mask[indices] = True
+        collection.foreach_set("select", mask)
+    mesh.update()
+
+    bpy.ops.object.mode_set(mode="EDIT")
+    return len(polys)
+
+
+def mesh_snapshot(mesh):
+    """범위 계산용 메시 배열을 foreach_get으로 복사해 `part_faces.MeshSnapshot`으로 반환합니다."""
+    import numpy as np
+    from .part_faces import MeshSnapshot
+    from .ib_order import IbOrderIndex
+
+    mesh.calc_loop_triangles()
+    arrays = []
+    for collection, attr in (
+        (mesh.loop_triangles, "polygon_index"),
+        (mesh.polygons, "loop_start"),
+        (mesh.polygons, "loop_total"),
+        (mesh.loops, "vertex_index"),
+        (mesh.loops, "edge_index"),
+    ):
+        buf = np.empty(len(collection), dtype=np.int32)
+        collection.foreach_get(attr, buf)
+        arrays.append(buf)
+    return MeshSnapshot(*arrays, ib_index=IbOrderIndex.from_mesh(mesh))
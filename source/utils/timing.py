@@ -0,0 +1,146 @@
+"""
+파츠 분리 파이프라인 단계별 시간 측정.
+
+측정이 꺼져 있으면 `phase()`는 전역 변수 하나를 확인한 뒤 공용 nullcontext를 돌려주므로
+계측 코드를 그대로 두어도 비용이 거의 없습니다.
+
+    timer = timing.start("split")
+    with timing.phase("build_parts_map"):
+        ...
+    timing.stop()
+    timer.summary_lines()
+"""
+
+import contextlib
+import functools
+import time
+
+_NULL = contextlib.nullcontext()
+
+# 현재 측정 중인 타이머 (None이면 측정 꺼짐)
+_active = None
+
+# 라벨(예: "load", "split")별 마지막 측정 결과
+last_results = {}
+
+
+class _Phase:
+    __slots__ = ("_timer", "_name", "_started")
+
+    def __init__(self, timer, name):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._timer.add(self._name, time.perf_counter() - self._started)
+        return False
+
+
+class PhaseTimer:
+    """단계 이름별 (누적 시간, 호출 수)와 파츠별 단계 시간을 모읍니다."""
+
+    def __init__(self, label):
+        self.label = label
+        self.phases = {}
+        self.parts = {}
+        self.current_part = None
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def add(self, name, seconds):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+        if self.current_part is not None:
+            part = self.parts.setdefault(self.current_part, {})
+            part[name] = part.get(name, 0.0) + seconds
+
+    def as_dict(self):
+        return {
+            "label": self.label,
+            "total_ms": self.elapsed * 1000.0,
+            "phases": {
+                name: {"ms": total * 1000.0, "count": count}
+                for name, (total, count) in self.phases.items()
+            },
+            "parts": {
+                part: {name: sec * 1000.0 for name, sec in phases.items()}
+                for part, phases in self.parts.items()
+            },
+        }
+
+    def summary_lines(self, limit=8):
+        """누적 시간이 큰 순서로 '단계  시간(ms) ×호출수' 문자열 목록을 반환합니다."""
+        ranked = sorted(self.phases.items(), key=lambda kv: kv[1][0], reverse=True)
+        lines = [f"전체 {self.elapsed * 1000.0:.1f}ms"]
+        for name, (total, count) in ranked[:limit]:
+            lines.append(f"{name} {total * 1000.0:.1f}ms ×{count}")
+        return lines
+
+    def slowest_parts(self, limit=3):
+        totals = [(sum(p.values()), name) for name, p in self.parts.items()]
+        totals.sort(reverse=True)
+        return [(name, sec * 1000.0) for sec, name in totals[:limit]]
+
+
+def start(label):
+    """새 타이머로 측정을 시작하고 반환합니다."""
+    global _active
+    _active = PhaseTimer(label)
+    return _active
+
+
+def stop():
+    """측정을 끝내고 결과를 last_results[label]에 보관합니다."""
+    global _active
+    timer = _active
+    _active = None
+    if timer is not None:
+        timer.elapsed = time.perf_counter() - timer.started
+        timer.current_part = None
+        last_results[timer.label] = timer
+    return timer
+
+
+def active():
+    return _active
+
+
+def phase(name):
+    timer = _active
+    if timer is None:
+        return _NULL
+    return timer.phase(name)
+
+
+def set_part(name):
+    """이후 phase 기록을 파츠 name 아래에도 누적합니다(None이면 해제)."""
+    timer = _active
+    if timer is not None:
+        timer.current_part = name
+
+
+def timed(name):
+    """함수 호출 전체를 phase(name)으로 감싸는 데코레이터."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
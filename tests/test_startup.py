@@ -0,0 +1,134 @@
+"""
+애드온 시작 비용 검사(Blender 없이 실행).
+
+bpy/bpy_extras/bmesh를 가짜 모듈로 채운 새 인터프리터에서 애드온을 임포트하고 등록한 뒤,
+무거운 모듈(NumPy, 네트워크, 압축, 스레드 풀)이 로드되지 않았고 시작 시간이
+`STARTUP_BUDGET_MS` 안에 드는지 확인합니다.
+
+    python -m unittest discover -s tests
+    (cd tests && python -m pytest)  # 저장소 루트의 __init__.py는 bpy가 필요해 루트에서 수집하지 않음
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 처음 사용할 때만 불러와야 하는 모듈
+LAZY_MODULES = ("numpy", "urllib.request", "zipfile", "concurrent", "concurrent.futures")
+
+_PROBE = textwrap.dedent(
+    """
+    import importlib.util
+    import json
+    import sys
+    import time
+    import types
+
+
+    class _Stub:
+        # 어떤 속성/호출이든 받아 주는 가짜 객체(클래스 정의 시 기반 클래스로도 사용 가능)
+        def __init__(self, name="stub"):
+            self._name = name
+
+        def __getattr__(self, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return _Stub(f"{self._name}.{name}")
+
+        def __call__(self, *args, **kwargs):
+            # 데코레이터로 쓰이면 함수를 그대로 돌려줌
+            if len(args) == 1 and callable(args[0]) and not kwargs:
+                return args[0]
+            return _Stub(self._name + "()")
+
+        def __mro_entries__(self, bases):
+            return (type(self._name.rsplit(".", 1)[-1], (), {}),)
+
+        def __iter__(self):
+            return iter(())
+
+        def __bool__(self):
+            return False
+
+
+    class _StubModule(types.ModuleType):
+        def __getattr__(self, name):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return _Stub(f"{self.__name__}.{name}")
+
+
+    for name in (
+        "bpy", "bpy.props", "bpy.types", "bpy.utils", "bpy.app", "bpy.app.handlers",
+        "bpy_extras", "bpy_extras.io_utils", "bmesh",
+    ):
+        module = _StubModule(name)
+        module.__path__ = []
+        sys.modules[name] = module
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+
+    addon_dir = sys.argv[1]
+    spec = importlib.util.spec_from_file_location(
+        "inips_addon", f"{addon_dir}/__init__.py", submodule_search_locations=[addon_dir]
+    )
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = addon
+    started = time.perf_counter()
+    spec.loader.exec_module(addon)
+    import_ms = (time.perf_counter() - started) * 1000.0
+    loaded_after_import = sorted(m for m in json.loads(sys.argv[2]) if m in sys.modules)
+    addon.register()
+    ok, total, timings = addon.check_startup_budget()
+    print(json.dumps({
+        "import_ms": import_ms,
+        "budget_ms": addon.STARTUP_BUDGET_MS,
+        "within_budget": ok,
+        "total_ms": total,
+        "timings": timings,
+        "loaded_after_import": loaded_after_import,
+        "loaded_after_register": sorted(m for m in json.loads(sys.argv[2]) if m in sys.modules),
+    }))
+    """
+)
+
+
+class StartupTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # 다른 테스트가 이미 불러온 모듈이 섞이지 않도록 새 인터프리터에서 측정
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE, ADDON_DIR, json.dumps(LAZY_MODULES)],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if proc.returncode != 0:
+            raise AssertionError(f"애드온 임포트/등록 실패:\n{proc.stderr}")
+        cls.result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    def test_heavy_modules_not_loaded_on_import(self):
+        self.assertEqual(self.result["loaded_after_import"], [])
+
+    def test_heavy_modules_not_loaded_on_register(self):
+        self.assertEqual(self.result["loaded_after_register"], [])
+
+    def test_import_within_budget(self):
+        self.assertLessEqual(self.result["import_ms"], self.result["budget_ms"])
+
+    def test_startup_within_budget(self):
+        self.assertTrue(
+            self.result["within_budget"],
+            f"{self.result['total_ms']:.1f}ms > {self.result['budget_ms']:.0f}ms: "
+            f"{self.result['timings']}",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()